@@ -0,0 +1,59 @@
+"""
+Benchmark for the memory usage of `gedcom.columnar.ColumnarTree` against the element tree of `gedcom.parser.Parser`.
+
+Measures the memory traced while parsing a synthetic file of the given size (default 20 MB) and the time
+it takes to find the date of every birth.
+
+Run from the repository root: `python benchmarks/bench_columnar.py [size in MB]`
+"""
+
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from bench_decode import write_file
+from python_gedcom_2.columnar import ColumnarTree
+from python_gedcom_2.parser import Parser
+import python_gedcom_2.tags
+
+
+def find_birth_dates_in_element_tree(parser):
+    return [child for element in parser.get_element_list() if element.get_tag() == python_gedcom_2.tags.GEDCOM_TAG_BIRTH
+            for child in element.get_child_elements() if child.get_tag() == python_gedcom_2.tags.GEDCOM_TAG_DATE]
+
+
+def find_birth_dates_in_columnar_tree(tree):
+    return tree.find_indexes_by_tag(python_gedcom_2.tags.GEDCOM_TAG_DATE, python_gedcom_2.tags.GEDCOM_TAG_BIRTH)
+
+
+def measure(name, parse, find):
+    tracemalloc.start()
+    tree = parse()
+    memory = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    start = time.perf_counter()
+    dates = find(tree)
+    seconds = time.perf_counter() - start
+    print("%-14s %8.1f MB %8d birth dates in %6.3f s" % (name, memory / (1024.0 * 1024.0), len(dates), seconds))
+
+
+def main():
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    with tempfile.TemporaryDirectory() as directory:
+        file_path = os.path.join(directory, 'synthetic.ged')
+        write_file(file_path, size * 1024 * 1024)
+
+        def parse_element_tree():
+            parser = Parser()
+            parser.parse_file(file_path)
+            return parser
+
+        measure("element tree", parse_element_tree, find_birth_dates_in_element_tree)
+        measure("columnar tree", lambda: ColumnarTree.from_file(file_path), find_birth_dates_in_columnar_tree)
+
+
+if __name__ == '__main__':
+    main()
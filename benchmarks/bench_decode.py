@@ -0,0 +1,68 @@
+"""
+Benchmark for reading and decoding the lines of a large GEDCOM file.
+
+Compares decoding every line with `bytes.decode('utf-8-sig')` against `gedcom.reader.read_lines()`,
+which decodes in large buffers. A synthetic file of the given size (default 500 MB) is generated
+in a temporary directory first.
+
+Run from the repository root: `python benchmarks/bench_decode.py [size in MB]`
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+from python_gedcom_2.reader import read_lines
+
+RECORD = (
+    u"0 @I{0}@ INDI\n"
+    u"1 NAME Jürgen /Müller/\n"
+    u"1 SEX M\n"
+    u"1 BIRT\n"
+    u"2 DATE 12 MAR 1851\n"
+    u"2 PLAC Gräfenhainichen, Sachsen-Anhalt, Deutschland\n"
+    u"1 FAMS @F{0}@\n"
+)
+
+
+def write_file(file_path, size):
+    with open(file_path, 'wb') as gedcom_file:
+        gedcom_file.write(u"\ufeff0 HEAD\n".encode('utf-8'))
+        written = 0
+        number = 0
+        while written < size:
+            chunk = u"".join(RECORD.format(number + i) for i in range(1000)).encode('utf-8')
+            gedcom_file.write(chunk)
+            written += len(chunk)
+            number += 1000
+        gedcom_file.write(b"0 TRLR\n")
+
+
+def per_line_decode(gedcom_stream):
+    for line in gedcom_stream:
+        yield line.decode('utf-8-sig')
+
+
+def measure(name, file_path, read):
+    start = time.perf_counter()
+    lines = 0
+    with open(file_path, 'rb') as gedcom_stream:
+        for _ in read(gedcom_stream):
+            lines += 1
+    seconds = time.perf_counter() - start
+    megabytes = os.path.getsize(file_path) / (1024.0 * 1024.0)
+    print("%-16s %8d lines %8.2f s %8.1f MB/s" % (name, lines, seconds, megabytes / seconds))
+
+
+def main():
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    with tempfile.TemporaryDirectory() as directory:
+        file_path = os.path.join(directory, 'synthetic.ged')
+        write_file(file_path, size * 1024 * 1024)
+        measure("per-line decode", file_path, per_line_decode)
+        measure("buffered decode", file_path, read_lines)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,58 @@
+"""
+Micro-benchmark for `gedcom.element_creator.ElementCreator.create_element()`.
+
+Compares the elements created per second against the previous implementation, which rebuilt the
+tag dictionary and imported the element module on every call.
+
+Run from the repository root: `python benchmarks/bench_element_creator.py`
+"""
+
+import importlib
+import timeit
+
+from python_gedcom_2.element.element import Element
+from python_gedcom_2.element_creator import ElementCreator, _BUILT_IN_ELEMENT_CLASS_NAMES
+import python_gedcom_2.tags
+
+# A typical mix of tags in an individual record
+TAGS = [
+    python_gedcom_2.tags.GEDCOM_TAG_INDIVIDUAL,
+    python_gedcom_2.tags.GEDCOM_TAG_NAME,
+    python_gedcom_2.tags.GEDCOM_TAG_SEX,
+    python_gedcom_2.tags.GEDCOM_TAG_BIRTH,
+    python_gedcom_2.tags.GEDCOM_TAG_DATE,
+    python_gedcom_2.tags.GEDCOM_TAG_PLACE,
+    python_gedcom_2.tags.GEDCOM_TAG_DEATH,
+    python_gedcom_2.tags.GEDCOM_TAG_DATE,
+    python_gedcom_2.tags.GEDCOM_TAG_FAMILY_SPOUSE,
+    python_gedcom_2.tags.GEDCOM_TAG_FAMILY_CHILD,
+]
+
+REPEAT = 5
+NUMBER = 20000
+
+
+def create_element_before(level, pointer, tag, value, linebreak, is_multiline=True):
+    tag_element_dict = dict(_BUILT_IN_ELEMENT_CLASS_NAMES)
+    if tag in tag_element_dict:
+        class_name_in_string_form = tag_element_dict[tag]
+        file_name = ElementCreator._get_file_name_from_class_name(class_name_in_string_form)
+        module = importlib.import_module("python_gedcom_2.element." + file_name)
+        class_ = getattr(module, class_name_in_string_form)
+        return class_(level, pointer, tag, value, linebreak, is_multiline)
+    return Element(level, pointer, tag, value, linebreak, is_multiline)
+
+
+def run(create_element):
+    for tag in TAGS:
+        create_element(1, "", tag, "", "\n", False)
+
+
+def main():
+    for name, create_element in (("before", create_element_before), ("after", ElementCreator.create_element)):
+        seconds = min(timeit.repeat(lambda: run(create_element), repeat=REPEAT, number=NUMBER))
+        print("%-6s %12.0f elements/s" % (name, NUMBER * len(TAGS) / seconds))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,95 @@
+"""
+Benchmark for `gedcom.element.element.Element.set_multi_line_value()` with long notes.
+
+Compares setting notes of 1 KB to 1 MB, as paragraphs of about 4 KB and as a single line, against the previous
+implementation, which formatted the element
+again for each line of at most 255 characters, sliced the remaining text for each of them and added
+the concatenation lines one at a time.
+
+Run from the repository root: `python benchmarks/bench_multi_line_value.py`
+"""
+
+import time
+
+from python_gedcom_2.element.element import Element
+import python_gedcom_2.tags
+
+SIZES = [1024, 10 * 1024, 100 * 1024, 1024 * 1024]
+
+# A paragraph of a note, with a line break about every 4 KB
+WORDS = u"Jürgen Müller was born in Gräfenhainichen and emigrated to America in 1881. "
+
+
+REPEAT = 3
+
+
+def make_note(size, paragraph_size):
+    paragraph = (WORDS * (paragraph_size // len(WORDS) + 1))[:paragraph_size - 1] + u"\n"
+    return (paragraph * (size // paragraph_size + 1))[:size]
+
+
+def line_length_before(element, line):
+    element_characters = len(element.to_gedcom_string())
+    available_characters = 0 if element_characters > 255 else 255 - element_characters
+    total_characters = len(line)
+    if total_characters <= available_characters:
+        return total_characters
+    spaces = 0
+    while spaces < available_characters and line[available_characters - spaces - 1] == ' ':
+        spaces += 1
+    if spaces == available_characters:
+        return available_characters
+    return available_characters - spaces
+
+
+def add_bounded_child_before(element, tag, value):
+    child = element.new_child_element(tag)
+    line_length = line_length_before(child, value)
+    child.set_value(value[:line_length])
+    return line_length
+
+
+def add_concatenation_before(element, string):
+    index = 0
+    size = len(string)
+    while index < size:
+        index += add_bounded_child_before(element, python_gedcom_2.tags.GEDCOM_TAG_CONCATENATION, string[index:])
+
+
+def set_multi_line_value_before(element, value):
+    element.set_value('')
+    lines = value.splitlines()
+    if lines:
+        line = lines.pop(0)
+        line_length = line_length_before(element, line)
+        element.set_value(line[:line_length])
+        add_concatenation_before(element, line[line_length:])
+        for line in lines:
+            line_length = add_bounded_child_before(element, python_gedcom_2.tags.GEDCOM_TAG_CONTINUED, line)
+            add_concatenation_before(element, line[line_length:])
+
+
+def measure(set_multi_line_value, note):
+    best_seconds = None
+    for _ in range(REPEAT):
+        element = Element(1, "", python_gedcom_2.tags.GEDCOM_TAG_NOTE, "", multi_line=False)
+        start = time.perf_counter()
+        set_multi_line_value(element, note)
+        seconds = time.perf_counter() - start
+        best_seconds = seconds if best_seconds is None else min(best_seconds, seconds)
+    return best_seconds, element.to_gedcom_string(True)
+
+
+def main():
+    for shape, paragraph_size in (("paragraphs", 4096), ("single line", None)):
+        for size in SIZES:
+            note = make_note(size, paragraph_size or size + 1)
+            seconds_before, lines_before = measure(set_multi_line_value_before, note)
+            seconds_after, lines_after = measure(Element.set_multi_line_value, note)
+            assert lines_before == lines_after
+            print("%-11s %8d characters  before %9.4f s  after %9.4f s  %7.1fx" % (
+                shape, size, seconds_before, seconds_after, seconds_before / seconds_after))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,55 @@
+"""
+Benchmark for saving a large GEDCOM tree.
+
+Compares writing the string of `gedcom.element.element.Element.to_gedcom_string()` at once against
+`gedcom.parser.Parser.save_gedcom()`, which streams the lines in large buffers to a binary file. Time and
+peak memory are measured with `tracemalloc`, which slows down both of them alike. A synthetic file of the given
+size (default 100 MB) is generated and parsed in a temporary directory first.
+
+Run from the repository root: `python benchmarks/bench_writer.py [size in MB]`
+"""
+
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from python_gedcom_2.parser import Parser
+
+from bench_decode import write_file
+
+
+def write_string(parser, file_path):
+    with open(file_path, 'w', encoding='utf-8') as gedcom_file:
+        gedcom_file.write(parser.get_root_element().to_gedcom_string(True))
+
+
+def save_gedcom(parser, file_path):
+    with open(file_path, 'wb') as gedcom_file:
+        parser.save_gedcom(gedcom_file)
+
+
+def measure(name, parser, file_path, write):
+    tracemalloc.start()
+    start = time.perf_counter()
+    write(parser, file_path)
+    seconds = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    print("%-14s %8.2f s %10.1f MB peak" % (name, seconds, peak / (1024.0 * 1024.0)))
+
+
+def main():
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+    with tempfile.TemporaryDirectory() as directory:
+        file_path = os.path.join(directory, 'synthetic.ged')
+        write_file(file_path, size * 1024 * 1024)
+        parser = Parser()
+        parser.parse_file(file_path, False)
+        measure("write string", parser, os.path.join(directory, 'string.ged'), write_string)
+        measure("save_gedcom", parser, os.path.join(directory, 'saved.ged'), save_gedcom)
+
+
+if __name__ == '__main__':
+    main()
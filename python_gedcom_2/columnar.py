@@ -0,0 +1,407 @@
+"""
+Module containing a read-only, column oriented store of GEDCOM data. Instead of a tree of
+`gedcom.element.element.Element` objects, all lines are kept in parallel arrays, which take a
+fraction of the memory and can be scanned without walking the tree.
+"""
+
+from array import array
+
+from python_gedcom_2.element_creator import ElementCreator
+from python_gedcom_2.reader import decode_lines, iter_raw_lines, map_file, read_lines
+from python_gedcom_2.tokenizer import iter_tokens, tokenize_bytes_line
+import python_gedcom_2.tags
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None
+
+NO_INDEX = -1
+"""Index of a missing parent, first child or next sibling"""
+
+
+class ColumnarTree(object):
+    """Read-only tree of GEDCOM data stored as parallel arrays
+
+    Each line is identified by its index in the order of the file. For each index the arrays hold the level,
+    the ids of the interned tag, pointer and line break, the offset of the value within a single string table,
+    and the indexes of the parent, the first child and the next sibling. Logical records have a parent of
+    `gedcom.columnar.NO_INDEX`.
+
+    Use `gedcom.columnar.ColumnarTree.from_file()` or `gedcom.columnar.ColumnarTree.from_stream()` to create a tree.
+    `gedcom.columnar.ColumnarElement` views are created on access.
+    """
+
+    def __init__(self, tokens):
+        """Creates the tree out of tokens as yielded by `gedcom.tokenizer.iter_tokens()`
+        :type tokens: collections.abc.Iterable[tuple]
+        """
+        self.__levels = array('i')
+        self.__tag_ids = array('i')
+        self.__pointer_ids = array('i')
+        self.__line_break_ids = array('b')
+        self.__value_offsets = array('q', [0])
+        self.__parents = array('i')
+        self.__first_children = array('i')
+        self.__next_siblings = array('i')
+
+        self.__tags = []
+        self.__pointers = ['']
+        self.__line_breaks = []
+        self.__tag_ids_by_tag = {}
+        self.__pointer_ids_by_pointer = {'': 0}
+        self.__record_indexes_by_pointer = {}
+
+        self.__build(tokens)
+
+    def __build(self, tokens):
+        levels = self.__levels
+        parents = self.__parents
+        first_children = self.__first_children
+        next_siblings = self.__next_siblings
+        values = []
+        value_offset = 0
+
+        # Indexes of the elements that can still get children, starting with the virtual root,
+        # together with the index of the last child of each of them
+        open_indexes = [NO_INDEX]
+        last_children = [NO_INDEX]
+
+        for index, (level, pointer, tag, value, crlf) in enumerate(tokens):
+            while len(open_indexes) > 1 and levels[open_indexes[-1]] >= level:
+                open_indexes.pop()
+                last_children.pop()
+
+            parent = open_indexes[-1]
+            if last_children[-1] != NO_INDEX:
+                next_siblings[last_children[-1]] = index
+            elif parent != NO_INDEX:
+                first_children[parent] = index
+            last_children[-1] = index
+
+            levels.append(level)
+            self.__tag_ids.append(self.__intern(tag, self.__tags, self.__tag_ids_by_tag))
+            self.__pointer_ids.append(self.__intern(pointer or '', self.__pointers, self.__pointer_ids_by_pointer))
+            self.__line_break_ids.append(self.__intern_line_break(crlf))
+            values.append(value)
+            value_offset += len(value)
+            self.__value_offsets.append(value_offset)
+            parents.append(parent)
+            first_children.append(NO_INDEX)
+            next_siblings.append(NO_INDEX)
+
+            if level == 0 and pointer:
+                self.__record_indexes_by_pointer[pointer] = index
+
+            open_indexes.append(index)
+            last_children.append(NO_INDEX)
+
+        self.__values = ''.join(values)
+
+    @staticmethod
+    def __intern(string, strings, ids_by_string):
+        string_id = ids_by_string.get(string)
+        if string_id is None:
+            string_id = ids_by_string[string] = len(strings)
+            strings.append(string)
+        return string_id
+
+    def __intern_line_break(self, crlf):
+        if crlf not in self.__line_breaks:
+            self.__line_breaks.append(crlf)
+        return self.__line_breaks.index(crlf)
+
+    @staticmethod
+    def from_file(file_path, strict=True, mmap=False):
+        """Opens and parses a file, from the given file path, as GEDCOM 5.5 formatted data
+
+        See `gedcom.parser.Parser.parse_file()` for `mmap`.
+
+        :type file_path: str
+        :type strict: bool
+        :type mmap: bool
+        :rtype: ColumnarTree
+        """
+        if mmap:
+            with map_file(file_path) as mapped_file:
+                return ColumnarTree(iter_tokens(iter_raw_lines(mapped_file), strict, tokenize_bytes_line))
+
+        with open(file_path, 'rb') as gedcom_stream:
+            return ColumnarTree(iter_tokens(read_lines(gedcom_stream), strict))
+
+    @staticmethod
+    def from_stream(gedcom_stream, strict=True):
+        """Parses a stream, or an array of lines, as GEDCOM 5.5 formatted data
+        :type gedcom_stream: a file stream, or bytes or str array of lines with new line at the end
+        :type strict: bool
+        :rtype: ColumnarTree
+        """
+        return ColumnarTree(iter_tokens(decode_lines(gedcom_stream), strict))
+
+    def __len__(self):
+        return len(self.__levels)
+
+    def get_level(self, index):
+        """:rtype: int"""
+        return self.__levels[index]
+
+    def get_tag(self, index):
+        """:rtype: str"""
+        return self.__tags[self.__tag_ids[index]]
+
+    def get_pointer(self, index):
+        """:rtype: str"""
+        return self.__pointers[self.__pointer_ids[index]]
+
+    def get_value(self, index):
+        """:rtype: str"""
+        return self.__values[self.__value_offsets[index]:self.__value_offsets[index + 1]]
+
+    def get_line_break(self, index):
+        """:rtype: str"""
+        return self.__line_breaks[self.__line_break_ids[index]]
+
+    def get_parent(self, index):
+        """Returns the index of the parent, or `gedcom.columnar.NO_INDEX` for a logical record
+        :rtype: int
+        """
+        return self.__parents[index]
+
+    def get_first_child(self, index):
+        """Returns the index of the first child, or `gedcom.columnar.NO_INDEX` if there is none
+        :rtype: int
+        """
+        return self.__first_children[index]
+
+    def get_next_sibling(self, index):
+        """Returns the index of the next sibling, or `gedcom.columnar.NO_INDEX` if there is none
+        :rtype: int
+        """
+        return self.__next_siblings[index]
+
+    def get_child_indexes(self, index):
+        """Returns the indexes of the direct children of an element
+        :type index: int
+        :rtype: list of int
+        """
+        child_indexes = []
+        child = self.__first_children[index]
+        while child != NO_INDEX:
+            child_indexes.append(child)
+            child = self.__next_siblings[child]
+        return child_indexes
+
+    def get_record_indexes(self):
+        """Returns the indexes of all logical records
+        :rtype: list of int
+        """
+        record_indexes = []
+        record = 0 if len(self) else NO_INDEX
+        while record != NO_INDEX:
+            record_indexes.append(record)
+            record = self.__next_siblings[record]
+        return record_indexes
+
+    def get_record_index_by_pointer(self, pointer):
+        """Returns the index of the logical record with the given pointer, or `gedcom.columnar.NO_INDEX` if there is none
+        :type pointer: str
+        :rtype: int
+        """
+        return self.__record_indexes_by_pointer.get(pointer, NO_INDEX)
+
+    def find_indexes_by_tag(self, tag, parent_tag=None):
+        """Returns the indexes of all elements with the given tag, in the order of the file
+
+        With a `parent_tag`, only elements whose direct parent has that tag are returned,
+        e.g. every `gedcom.tags.GEDCOM_TAG_DATE` of a `gedcom.tags.GEDCOM_TAG_BIRTH`. Only the arrays of tag
+        and parent ids get compared, as a whole with NumPy if it is installed.
+
+        :type tag: str
+        :type parent_tag: str
+        :rtype: list of int
+        """
+        tag_id = self.__tag_ids_by_tag.get(tag)
+        if tag_id is None:
+            return []
+        parent_tag_id = None
+        if parent_tag is not None:
+            parent_tag_id = self.__tag_ids_by_tag.get(parent_tag)
+            if parent_tag_id is None:
+                return []
+
+        if numpy is not None:
+            return self.__find_indexes_with_numpy(tag_id, parent_tag_id)
+
+        tag_ids = self.__tag_ids
+        indexes = [index for index, element_tag_id in enumerate(tag_ids) if element_tag_id == tag_id]
+        if parent_tag_id is None:
+            return indexes
+
+        parents = self.__parents
+        return [index for index in indexes if parents[index] != NO_INDEX and tag_ids[parents[index]] == parent_tag_id]
+
+    def __find_indexes_with_numpy(self, tag_id, parent_tag_id):
+        # The arrays are shared with NumPy rather than copied
+        tag_ids = numpy.frombuffer(self.__tag_ids, dtype=numpy.intc)
+        indexes = numpy.flatnonzero(tag_ids == tag_id)
+        if parent_tag_id is not None:
+            parents = numpy.frombuffer(self.__parents, dtype=numpy.intc)[indexes]
+            indexes = indexes[(parents != NO_INDEX) & (tag_ids[parents] == parent_tag_id)]
+        return indexes.tolist()
+
+    def get_element(self, index):
+        """Returns a view of the element at the given index
+        :type index: int
+        :rtype: ColumnarElement
+        """
+        if not 0 <= index < len(self):
+            raise IndexError("element index out of range")
+        return ColumnarElement(self, index)
+
+    def get_root_child_elements(self):
+        """Returns views of all logical records
+        :rtype: list of ColumnarElement
+        """
+        return [ColumnarElement(self, index) for index in self.get_record_indexes()]
+
+    def get_element_by_pointer(self, pointer):
+        """Returns a view of the logical record with the given pointer, or `None` if there is none
+        :type pointer: str
+        :rtype: ColumnarElement
+        """
+        index = self.get_record_index_by_pointer(pointer)
+        return None if index == NO_INDEX else ColumnarElement(self, index)
+
+    def find_elements_by_tag(self, tag, parent_tag=None):
+        """Returns views of the elements found by `gedcom.columnar.ColumnarTree.find_indexes_by_tag()`
+        :type tag: str
+        :type parent_tag: str
+        :rtype: list of ColumnarElement
+        """
+        return [ColumnarElement(self, index) for index in self.find_indexes_by_tag(tag, parent_tag)]
+
+
+class ColumnarElement(object):
+    """Read-only view of an element of a `gedcom.columnar.ColumnarTree`
+
+    Offers the reading methods of `gedcom.element.element.Element`. Use
+    `gedcom.columnar.ColumnarElement.to_element()` to get an actual element including its sub-elements.
+    """
+
+    __slots__ = ('__tree', '__index')
+
+    def __init__(self, tree, index):
+        """
+        :type tree: ColumnarTree
+        :type index: int
+        """
+        self.__tree = tree
+        self.__index = index
+
+    def __eq__(self, other):
+        return (isinstance(other, ColumnarElement) and self.__tree is other.__tree
+                and self.__index == other.__index)
+
+    def __hash__(self):
+        return hash((id(self.__tree), self.__index))
+
+    def get_index(self):
+        """:rtype: int"""
+        return self.__index
+
+    def get_level(self):
+        """:rtype: int"""
+        return self.__tree.get_level(self.__index)
+
+    def get_pointer(self):
+        """:rtype: str"""
+        return self.__tree.get_pointer(self.__index)
+
+    def get_tag(self):
+        """:rtype: str"""
+        return self.__tree.get_tag(self.__index)
+
+    def get_value(self):
+        """:rtype: str"""
+        return self.__tree.get_value(self.__index)
+
+    def get_multi_line_value(self):
+        """Returns the value of this element including concatenations or continuations
+        :rtype: str
+        """
+        tree = self.__tree
+        values = [tree.get_value(self.__index)]
+        last_crlf = tree.get_line_break(self.__index)
+        for child in tree.get_child_indexes(self.__index):
+            tag = tree.get_tag(child)
+            if tag == python_gedcom_2.tags.GEDCOM_TAG_CONCATENATION:
+                values.append(tree.get_value(child))
+                last_crlf = tree.get_line_break(child)
+            elif tag == python_gedcom_2.tags.GEDCOM_TAG_CONTINUED:
+                values.append(last_crlf + tree.get_value(child))
+                last_crlf = tree.get_line_break(child)
+        return ''.join(values)
+
+    def get_child_elements(self):
+        """Returns views of the direct child elements of this element
+        :rtype: list of ColumnarElement
+        """
+        return [ColumnarElement(self.__tree, index) for index in self.__tree.get_child_indexes(self.__index)]
+
+    def get_parent_element(self):
+        """Returns a view of the parent element, or `None` for a logical record
+        :rtype: ColumnarElement
+        """
+        parent = self.__tree.get_parent(self.__index)
+        return None if parent == NO_INDEX else ColumnarElement(self.__tree, parent)
+
+    def to_element(self):
+        """Creates an actual element, including all of its sub-elements, out of this view
+
+        The element isn't connected to any parent element.
+
+        :rtype: Element
+        """
+        tree = self.__tree
+        index = self.__index
+        element = ElementCreator.create_element(tree.get_level(index), tree.get_pointer(index), tree.get_tag(index),
+                                                tree.get_value(index), tree.get_line_break(index), is_multiline=False)
+
+        pending = [(element, child) for child in reversed(tree.get_child_indexes(index))]
+        while pending:
+            parent_element, child = pending.pop()
+            child_element = ElementCreator.create_element(tree.get_level(child), tree.get_pointer(child),
+                                                          tree.get_tag(child), tree.get_value(child),
+                                                          tree.get_line_break(child), is_multiline=False)
+            parent_element.add_child_element(child_element)
+            pending.extend((child_element, grandchild) for grandchild in reversed(tree.get_child_indexes(child)))
+
+        return element
+
+    def to_gedcom_string(self, recursive=False):
+        """Formats this element and optionally all of its sub-elements into a GEDCOM string
+        :type recursive: bool
+        :rtype: str
+        """
+        tree = self.__tree
+        lines = []
+        pending = [self.__index]
+        while pending:
+            index = pending.pop()
+
+            line = str(tree.get_level(index))
+            if tree.get_pointer(index) != "":
+                line += ' ' + tree.get_pointer(index)
+            line += ' ' + tree.get_tag(index)
+            if tree.get_value(index) != "":
+                line += ' ' + tree.get_value(index)
+            lines.append(line + tree.get_line_break(index))
+
+            if recursive:
+                pending.extend(reversed(tree.get_child_indexes(index)))
+
+        return ''.join(lines)
+
+    def __str__(self):
+        """:rtype: str"""
+        return self.to_gedcom_string()
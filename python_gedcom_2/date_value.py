@@ -0,0 +1,431 @@
+"""
+Module containing the parser of GEDCOM date values (see pg 39-42 of the GEDCOM 5.5 spec), which turns a value
+such as `BET 1 JAN 1700 AND @#DJULIAN@ 5 JUN 1699/00` into a `gedcom.date_value.DateValue`.
+
+Each date is converted into an interval of julian day numbers, so dates of all calendars can be sorted and compared.
+Parsed values are cached per distinct string, see `gedcom.date_value.parse_date()`.
+"""
+
+from functools import lru_cache
+import re as regex
+
+CALENDAR_GREGORIAN = "@#DGREGORIAN@"
+CALENDAR_JULIAN = "@#DJULIAN@"
+CALENDAR_HEBREW = "@#DHEBREW@"
+CALENDAR_FRENCH = "@#DFRENCH R@"
+CALENDAR_ROMAN = "@#DROMAN@"
+CALENDAR_UNKNOWN = "@#DUNKNOWN@"
+
+DATE_KIND_EXACT = "EXACT"
+DATE_KIND_ABOUT = "ABT"
+DATE_KIND_CALCULATED = "CAL"
+DATE_KIND_ESTIMATED = "EST"
+DATE_KIND_BEFORE = "BEF"
+DATE_KIND_AFTER = "AFT"
+DATE_KIND_BETWEEN = "BET"
+DATE_KIND_FROM = "FROM"
+DATE_KIND_TO = "TO"
+DATE_KIND_FROM_TO = "FROM_TO"
+DATE_KIND_INTERPRETED = "INT"
+DATE_KIND_PHRASE = "PHRASE"
+DATE_KIND_INVALID = "INVALID"
+
+RETURN_FIRST_DATE = "first"
+RETURN_SECOND_DATE = "second"
+
+NO_YEAR = -1
+"""Year returned if a date has none"""
+
+DATE_CACHE_SIZE = 100000
+"""Number of distinct date values `gedcom.date_value.parse_date()` keeps parsed"""
+
+_APPROXIMATED_KINDS = (DATE_KIND_ABOUT, DATE_KIND_CALCULATED, DATE_KIND_ESTIMATED)
+
+_GREGORIAN_MONTHS = {month: number for number, month in enumerate(
+    ("JAN", "FEB", "MAR", "APR", "MAY", "JUN", "JUL", "AUG", "SEP", "OCT", "NOV", "DEC"), 1)}
+
+# Months of the Hebrew calendar, numbered from Nisan as in the conversion below. ADR is Adar, or Adar I in a
+# leap year, ADS Adar II.
+_HEBREW_MONTHS = {"TSH": 7, "CSH": 8, "KSL": 9, "TVT": 10, "SHV": 11, "ADR": 12, "ADS": 13,
+                  "NSN": 1, "IYR": 2, "SVN": 3, "TMZ": 4, "AAV": 5, "ELL": 6}
+
+_FRENCH_MONTHS = {month: number for number, month in enumerate(
+    ("VEND", "BRUM", "FRIM", "NIVO", "PLUV", "VENT", "GERM", "FLOR", "PRAI", "MESS", "THER", "FRUC", "COMP"), 1)}
+
+_MONTHS_BY_CALENDAR = {
+    CALENDAR_GREGORIAN: _GREGORIAN_MONTHS,
+    CALENDAR_JULIAN: _GREGORIAN_MONTHS,
+    CALENDAR_HEBREW: _HEBREW_MONTHS,
+    CALENDAR_FRENCH: _FRENCH_MONTHS,
+}
+
+_BC_MARKERS = ("B.C.", "BC", "BCE", "(B.C.)")
+
+_CALENDAR_ESCAPE_REGEX = regex.compile(r'^(@#D[^@]*@)\s*(.*)$')
+_YEAR_REGEX = regex.compile(r'^(\d+)(?:/(\d\d))?$')
+
+
+class CalendarDate(object):
+    """A single date of a calendar, e.g. `@#DJULIAN@ 5 JUN 1699/00`, where the day and the month are optional
+
+    `month` is the number of the month in the calendar (Tishri is 7 in the Hebrew calendar), 0 if there is none,
+    `day` 0 if there is none. `dual_year` is the later year of a dual year such as `1699/00`, otherwise `None`.
+    """
+
+    __slots__ = ('calendar', 'day', 'month', 'year', 'dual_year', 'is_bc')
+
+    def __init__(self, calendar, day, month, year, dual_year=None, is_bc=False):
+        """
+        :type calendar: str
+        :type day: int
+        :type month: int
+        :type year: int
+        :type dual_year: int
+        :type is_bc: bool
+        """
+        self.calendar = calendar
+        self.day = day
+        self.month = month
+        self.year = year
+        self.dual_year = dual_year
+        self.is_bc = is_bc
+
+    def __eq__(self, other):
+        return isinstance(other, CalendarDate) and self.__get_fields() == other.__get_fields()
+
+    def __hash__(self):
+        return hash(self.__get_fields())
+
+    def __repr__(self):
+        return "CalendarDate(%r, %d, %d, %d, %r, %r)" % self.__get_fields()
+
+    def __get_fields(self):
+        return self.calendar, self.day, self.month, self.year, self.dual_year, self.is_bc
+
+    def get_julian_day_range(self):
+        """Returns the first and the last julian day number this date can stand for, e.g. all days of its month
+        if it has no day, or `None` for the Roman and unknown calendar
+        :rtype: tuple
+        """
+        if self.calendar not in _MONTHS_BY_CALENDAR:
+            return None
+
+        # The later year of a dual year is the one of the modern calendar.
+        year = self.dual_year if self.dual_year is not None else self.year
+        if self.is_bc:
+            year = 1 - year
+
+        if self.calendar == CALENDAR_HEBREW:
+            return _get_hebrew_julian_day_range(year, self.month, self.day)
+        if self.calendar == CALENDAR_FRENCH:
+            return _get_french_julian_day_range(year, self.month, self.day)
+        return _get_roman_julian_day_range(self.calendar, year, self.month, self.day)
+
+
+class DateValue(object):
+    """A parsed GEDCOM date value
+
+    `kind` is one of the `DATE_KIND_` constants. `first` and `second` are the `gedcom.date_value.CalendarDate`
+    objects of the value, e.g. of `BET first AND second`, where a value with a single date only has a `first` date,
+    except for `TO second`. `phrase` is the text in parentheses of an interpreted date or a date phrase.
+    Values that can't be parsed are of kind `DATE_KIND_INVALID`.
+    """
+
+    __slots__ = ('value', 'kind', 'first', 'second', 'phrase')
+
+    def __init__(self, value, kind, first=None, second=None, phrase=""):
+        """
+        :type value: str
+        :type kind: str
+        :type first: CalendarDate
+        :type second: CalendarDate
+        :type phrase: str
+        """
+        self.value = value
+        self.kind = kind
+        self.first = first
+        self.second = second
+        self.phrase = phrase
+
+    def is_valid(self):
+        """Checks if the value could be parsed
+        :rtype: bool
+        """
+        return self.kind != DATE_KIND_INVALID
+
+    def is_approximated(self):
+        """Checks if the value is an `ABT`, `CAL` or `EST` date
+        :rtype: bool
+        """
+        return self.kind in _APPROXIMATED_KINDS
+
+    def get_year(self, which_date_to_return_in_a_range=RETURN_SECOND_DATE):
+        """Returns the year of the second date of a range or period by default, of the first one with
+        `RETURN_FIRST_DATE`, or `NO_YEAR` if there is none
+
+        Returns `NO_YEAR` for years before Christ as well.
+
+        :type which_date_to_return_in_a_range: str
+        :rtype: int
+        """
+        if which_date_to_return_in_a_range == RETURN_FIRST_DATE:
+            date = self.first or self.second
+        else:
+            date = self.second or self.first
+
+        if date is None or date.is_bc:
+            return NO_YEAR
+        return date.year
+
+    def get_julian_day_range(self):
+        """Returns the first and the last julian day number of this value as a tuple
+
+        Either of them is `None` if the value is open on that side, e.g. `BEF 1900` has no first day.
+        Returns `None` if the value has no date that can be converted.
+
+        :rtype: tuple
+        """
+        first_range = self.first.get_julian_day_range() if self.first is not None else None
+        second_range = self.second.get_julian_day_range() if self.second is not None else None
+
+        if self.kind == DATE_KIND_BEFORE or self.kind == DATE_KIND_TO:
+            date_range = second_range or first_range
+            return (None, date_range[1]) if date_range is not None else None
+        if self.kind == DATE_KIND_AFTER or self.kind == DATE_KIND_FROM:
+            return (first_range[0], None) if first_range is not None else None
+        if self.kind == DATE_KIND_BETWEEN or self.kind == DATE_KIND_FROM_TO:
+            if first_range is None or second_range is None:
+                return None
+            return first_range[0], second_range[1]
+        return first_range
+
+    def get_sort_key(self):
+        """Returns a key to sort date values chronologically, values without a julian day range last
+        :rtype: tuple
+        """
+        julian_day_range = self.get_julian_day_range()
+        if julian_day_range is None:
+            return 1, 0, 0
+        first_day, last_day = julian_day_range
+        if first_day is None:
+            first_day = last_day
+        if last_day is None:
+            last_day = first_day
+        return 0, first_day, last_day
+
+
+@lru_cache(maxsize=DATE_CACHE_SIZE)
+def parse_date(value):
+    """Parses a GEDCOM date value, keeping the result for the most recently used values
+
+    The returned `gedcom.date_value.DateValue` is shared by all equal values and must not be modified.
+
+    :type value: str
+    :rtype: DateValue
+    """
+    text = value.strip()
+    if not text:
+        return DateValue(value, DATE_KIND_INVALID)
+
+    if text.startswith("(") and text.endswith(")"):
+        return DateValue(value, DATE_KIND_PHRASE, phrase=text[1:-1])
+
+    words = text.split(None, 1)
+    keyword = words[0].upper()
+    rest = words[1] if len(words) > 1 else ""
+
+    try:
+        if keyword == "INT":
+            date, separator, phrase = rest.partition("(")
+            return DateValue(value, DATE_KIND_INTERPRETED, _parse_calendar_date(date), phrase=phrase.rstrip(")"))
+        if keyword in _APPROXIMATED_KINDS or keyword == DATE_KIND_BEFORE or keyword == DATE_KIND_AFTER:
+            return DateValue(value, keyword, _parse_calendar_date(rest))
+        if keyword == DATE_KIND_BETWEEN:
+            first, second = _split_range(rest, " AND ")
+            return DateValue(value, DATE_KIND_BETWEEN, _parse_calendar_date(first), _parse_calendar_date(second))
+        if keyword == DATE_KIND_FROM:
+            if " TO " in rest.upper():
+                first, second = _split_range(rest, " TO ")
+                return DateValue(value, DATE_KIND_FROM_TO, _parse_calendar_date(first), _parse_calendar_date(second))
+            return DateValue(value, DATE_KIND_FROM, _parse_calendar_date(rest))
+        if keyword == DATE_KIND_TO:
+            return DateValue(value, DATE_KIND_TO, second=_parse_calendar_date(rest))
+        return DateValue(value, DATE_KIND_EXACT, _parse_calendar_date(text))
+    except ValueError:
+        return DateValue(value, DATE_KIND_INVALID)
+
+
+def _split_range(text, separator):
+    index = text.upper().find(separator)
+    if index < 0:
+        raise ValueError("Missing %r in date range %r" % (separator.strip(), text))
+    return text[:index], text[index + len(separator):]
+
+
+def _parse_calendar_date(text):
+    """Parses a single date such as `@#DJULIAN@ 5 JUN 1699/00`, raising a `ValueError` if it is invalid
+    :type text: str
+    :rtype: CalendarDate
+    """
+    text = text.strip()
+    calendar = CALENDAR_GREGORIAN
+    match = _CALENDAR_ESCAPE_REGEX.match(text)
+    if match:
+        calendar = match.group(1).upper()
+        text = match.group(2)
+
+    words = text.upper().split()
+    is_bc = False
+    if words and words[-1] in _BC_MARKERS:
+        is_bc = True
+        words.pop()
+
+    if not words or len(words) > 3:
+        raise ValueError("Invalid date %r" % text)
+
+    year_match = _YEAR_REGEX.match(words[-1])
+    if not year_match:
+        raise ValueError("Invalid year in date %r" % text)
+    year = int(year_match.group(1))
+    dual_year = None
+    if year_match.group(2) is not None:
+        dual_year = year // 100 * 100 + int(year_match.group(2))
+        if dual_year <= year:
+            dual_year += 100
+
+    month = 0
+    day = 0
+    if len(words) > 1:
+        months = _MONTHS_BY_CALENDAR.get(calendar, _GREGORIAN_MONTHS)
+        if words[-2] not in months:
+            raise ValueError("Invalid month in date %r" % text)
+        month = months[words[-2]]
+        if len(words) > 2:
+            if not words[0].isdigit() or not 1 <= int(words[0]) <= 31:
+                raise ValueError("Invalid day in date %r" % text)
+            day = int(words[0])
+
+    date = CalendarDate(calendar, day, month, year, dual_year, is_bc)
+    julian_day_range = date.get_julian_day_range()
+    if day and julian_day_range is not None and julian_day_range[0] != julian_day_range[1]:
+        raise ValueError("Invalid day in date %r" % text)
+    return date
+
+
+# Conversions into julian day numbers
+
+def _get_roman_julian_day(calendar, year, month, day):
+    """Returns the julian day number of a date of the Gregorian or the Julian calendar, with an astronomical year"""
+    a = (14 - month) // 12
+    y = year + 4800 - a
+    m = month + 12 * a - 3
+    julian_day = day + (153 * m + 2) // 5 + 365 * y + y // 4
+    if calendar == CALENDAR_JULIAN:
+        return julian_day - 32083
+    return julian_day - y // 100 + y // 400 - 32045
+
+
+def _get_roman_julian_day_range(calendar, year, month, day):
+    if not month:
+        return (_get_roman_julian_day(calendar, year, 1, 1),
+                _get_roman_julian_day(calendar, year + 1, 1, 1) - 1)
+    first_day_of_month = _get_roman_julian_day(calendar, year, month, 1)
+    last_day_of_month = _get_roman_julian_day(calendar, year + month // 12, month % 12 + 1, 1) - 1
+    if not day:
+        return first_day_of_month, last_day_of_month
+    if first_day_of_month + day - 1 > last_day_of_month:
+        # Reported as an invalid day by `_parse_calendar_date()`
+        return first_day_of_month, last_day_of_month
+    return first_day_of_month + day - 1, first_day_of_month + day - 1
+
+
+# The Hebrew calendar, following the arithmetic of "Calendrical Calculations" by Dershowitz and Reingold
+
+_HEBREW_EPOCH = 347998
+
+
+def _is_hebrew_leap_year(year):
+    return (7 * year + 1) % 19 < 7
+
+
+def _get_hebrew_elapsed_days(year):
+    months_elapsed = (235 * year - 234) // 19
+    parts_elapsed = 12084 + 13753 * months_elapsed
+    day = 29 * months_elapsed + parts_elapsed // 25920
+    if (3 * (day + 1)) % 7 < 3:
+        day += 1
+    return day
+
+
+def _get_hebrew_year_delay(year):
+    last_year = _get_hebrew_elapsed_days(year - 1)
+    present_year = _get_hebrew_elapsed_days(year)
+    next_year = _get_hebrew_elapsed_days(year + 1)
+    if next_year - present_year == 356:
+        return 2
+    if present_year - last_year == 382:
+        return 1
+    return 0
+
+
+def _get_hebrew_new_year(year):
+    return _HEBREW_EPOCH + _get_hebrew_elapsed_days(year) + _get_hebrew_year_delay(year)
+
+
+def _get_hebrew_month_length(year, month):
+    if month in (2, 4, 6, 10, 13):
+        return 29
+    if month == 12 and not _is_hebrew_leap_year(year):
+        return 29
+    year_length = _get_hebrew_new_year(year + 1) - _get_hebrew_new_year(year)
+    if month == 8 and year_length % 10 != 5:
+        return 29
+    if month == 9 and year_length % 10 == 3:
+        return 29
+    return 30
+
+
+def _get_hebrew_julian_day(year, month, day):
+    last_month = 13 if _is_hebrew_leap_year(year) else 12
+    julian_day = _get_hebrew_new_year(year) + day - 1
+    if month < 7:
+        julian_day += sum(_get_hebrew_month_length(year, other_month) for other_month in range(7, last_month + 1))
+        julian_day += sum(_get_hebrew_month_length(year, other_month) for other_month in range(1, month))
+    else:
+        julian_day += sum(_get_hebrew_month_length(year, other_month) for other_month in range(7, month))
+    return julian_day
+
+
+def _get_hebrew_julian_day_range(year, month, day):
+    if not month:
+        return _get_hebrew_new_year(year), _get_hebrew_new_year(year + 1) - 1
+    if month == 13 and not _is_hebrew_leap_year(year):
+        month = 12
+    first_day_of_month = _get_hebrew_julian_day(year, month, 1)
+    last_day_of_month = first_day_of_month + _get_hebrew_month_length(year, month) - 1
+    if not day or first_day_of_month + day - 1 > last_day_of_month:
+        return first_day_of_month, last_day_of_month
+    return first_day_of_month + day - 1, first_day_of_month + day - 1
+
+
+# The French republican calendar, with the leap years 3, 7, 11 and every fourth year after them
+
+_FRENCH_EPOCH = 2375840
+"""Julian day number of 1 VEND 1, i.e. 22 SEP 1792"""
+
+
+def _get_french_new_year(year):
+    return _FRENCH_EPOCH + 365 * (year - 1) + year // 4
+
+
+def _get_french_julian_day_range(year, month, day):
+    if not month:
+        return _get_french_new_year(year), _get_french_new_year(year + 1) - 1
+    first_day_of_month = _get_french_new_year(year) + 30 * (month - 1)
+    if month == 13:
+        last_day_of_month = _get_french_new_year(year + 1) - 1
+    else:
+        last_day_of_month = first_day_of_month + 29
+    if not day or first_day_of_month + day - 1 > last_day_of_month:
+        return first_day_of_month, last_day_of_month
+    return first_day_of_month + day - 1, first_day_of_month + day - 1
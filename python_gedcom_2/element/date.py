@@ -1,13 +1,12 @@
 """GEDCOM element consisting of tag `gedcom.tags.GEDCOM_TAG_DATE`"""
 
+from python_gedcom_2.date_value import RETURN_FIRST_DATE, RETURN_SECOND_DATE, parse_date
 from python_gedcom_2.element.element import Element
 
 
-RETURN_FIRST_DATE = "first"
-RETURN_SECOND_DATE = "second"
-
-
 class DateElement(Element):
+    __slots__ = ()
+
     @staticmethod
     def __is_a_from_to_statement(date_value):
         return date_value.startswith("FROM ") and " TO " in date_value
@@ -47,20 +46,31 @@ class DateElement(Element):
             date_value = date_value[5:]
             return date_value.split(" TO ")
 
+    def get_date_value(self):
+        """Returns the parsed value of this date, which is shared by all dates with an equal value
+        :rtype: DateValue
+        """
+        return parse_date(self.get_value())
+
     def get_year(self, which_date_to_return_in_a_range=RETURN_SECOND_DATE):
         """
         Tries to identify the year associated with this date. If it can't, returns -1. In the event
         NOTE: By default, this will return the later year in a date range (ex: 1932 for "BET 1922 AND 1932").
         Since this was the behavior of the code that uses this method before it was refactored into
         a separate DateElement class, I'm keeping that implementation for backwards compatibility.
+        The year is taken from `gedcom.element.date.DateElement.get_date_value()`. Dates that can't be parsed
+        fall back to the last word of the date, if it is a number.
         :type which_date_to_return_in_a_range: string
         :rtype: int
         """
+        date_value = self.get_date_value()
+        if date_value.is_valid():
+            return date_value.get_year(which_date_to_return_in_a_range)
+
         date_value = self.get_value().strip()
 
         if self.__contains_multiple_dates(date_value):
             first_date, second_date = self.__split_date_range(date_value)
-            print(first_date, second_date)
             if which_date_to_return_in_a_range == RETURN_FIRST_DATE:
                 date_value = first_date
             else:
@@ -7,6 +7,10 @@ from sys import version_info
 from python_gedcom_2.element_creator import ElementCreator
 from python_gedcom_2.helpers import deprecated
 import python_gedcom_2.tags
+from python_gedcom_2.writer import format_line, iter_lines, split_multi_line_value
+
+_FLAG_DIRTY = 1
+_FLAG_COLLAPSED = 2
 
 
 class Element(object):
@@ -37,6 +41,9 @@ class Element(object):
     Tags available to an element are seen here: `gedcom.tags`
     """
 
+    __slots__ = ('__level', '__pointer', '__tag', '__value', '__crlf', '__children', '__parent',
+                 '__children_by_tag', '__indexed_child_count', '__flags', '__multi_line_value')
+
     def __init__(self, level, pointer, tag, value, crlf="\n", multi_line=True):
         # basic element info
         self.__level = level
@@ -49,6 +56,16 @@ class Element(object):
         self.__children = []
         self.__parent = None
 
+        # Lazily built index of the children, see `__get_children_by_tag()`
+        self.__children_by_tag = None
+        self.__indexed_child_count = 0
+
+        # `_FLAG_DIRTY` and `_FLAG_COLLAPSED`, see `is_dirty()` and `is_collapsed()`
+        self.__flags = 0
+
+        # Cached result of `get_multi_line_value()` together with the number of children it was built from
+        self.__multi_line_value = None
+
         if multi_line:
             self.set_multi_line_value(value)
 
@@ -76,95 +93,131 @@ class Element(object):
         """
         return self.__value
 
+    def get_crlf(self):
+        """Returns the line break this element was parsed with, which ends its line when written
+        :rtype: str
+        """
+        return self.__crlf
+
     def set_value(self, value):
         """Sets the value of this element
         :type value: str
         """
         self.__value = value
+        self.__multi_line_value = None
+        if self.__parent is not None:
+            self.__parent.__multi_line_value = None
+        if not self.__flags & _FLAG_DIRTY:
+            self.__mark_dirty()
+
+    def is_dirty(self):
+        """Checks if this element or one of its sub-elements was changed since the dirty flags were cleared
+
+        The flags are set on a changed element and all elements containing it, up to its logical record, by
+        `set_value()`, `add_child_element()` and `new_child_element()`. Changes made by modifying
+        `get_child_elements()` directly aren't noticed. `gedcom.parser.Parser.parse_file()` clears the flags of all
+        records when tracking changes.
+
+        :rtype: bool
+        """
+        return bool(self.__flags & _FLAG_DIRTY)
+
+    def clear_dirty(self):
+        """Clears the dirty flags of this element and all of its sub-elements, see `is_dirty()`
+
+        Only the sub-elements which are dirty themselves are visited.
+        """
+        stack = [self]
+        while stack:
+            element = stack.pop()
+            if element.__flags & _FLAG_DIRTY:
+                element.__flags &= ~_FLAG_DIRTY
+                stack.extend(element.__children)
+
+    def __mark_dirty(self):
+        """Sets the dirty flags of this element and all elements containing it, up to the first one that is dirty"""
+        element = self
+        while element is not None and not element.__flags & _FLAG_DIRTY:
+            element.__flags |= _FLAG_DIRTY
+            element = element.__parent
 
     def get_multi_line_value(self):
         """Returns the value of this element including concatenations or continuations
+
+        The value is joined at once and cached until the value of this element or of one of its children
+        changes, or a child gets added. Changing the number of children by modifying `get_child_elements()`
+        directly is noticed as well.
+
         :rtype: str
         """
-        result = self.get_value()
+        children = self.__children
+        cached_value = self.__multi_line_value
+        if cached_value is not None and cached_value[0] == len(children):
+            return cached_value[1]
+
+        concatenation_tag = python_gedcom_2.tags.GEDCOM_TAG_CONCATENATION
+        continued_tag = python_gedcom_2.tags.GEDCOM_TAG_CONTINUED
+
+        parts = [self.__value]
         last_crlf = self.__crlf
-        for element in self.get_child_elements():
-            tag = element.get_tag()
-            if tag == python_gedcom_2.tags.GEDCOM_TAG_CONCATENATION:
-                result += element.get_value()
+        for element in children:
+            tag = element.__tag
+            if tag == concatenation_tag:
+                parts.append(element.__value)
                 last_crlf = element.__crlf
-            elif tag == python_gedcom_2.tags.GEDCOM_TAG_CONTINUED:
-                result += last_crlf + element.get_value()
+            elif tag == continued_tag:
+                parts.append(last_crlf)
+                parts.append(element.__value)
                 last_crlf = element.__crlf
+
+        result = ''.join(parts)
+        self.__multi_line_value = (len(children), result)
         return result
 
-    def __available_characters(self):
-        """Get the number of available characters of the elements original string
-        :rtype: int
-        """
-        element_characters = len(self.to_gedcom_string())
-        return 0 if element_characters > 255 else 255 - element_characters
+    def is_collapsed(self):
+        """Checks if the whole multi-line value is held by this element instead of concatenation and continuation lines
 
-    def __line_length(self, line):
-        """@TODO Write docs.
-        :type line: str
-        :rtype: int
-        """
-        total_characters = len(line)
-        available_characters = self.__available_characters()
-        if total_characters <= available_characters:
-            return total_characters
-        spaces = 0
-        while spaces < available_characters and line[available_characters - spaces - 1] == ' ':
-            spaces += 1
-        if spaces == available_characters:
-            return available_characters
-        return available_characters - spaces
-
-    def __set_bounded_value(self, value):
-        """@TODO Write docs.
-        :type value: str
-        :rtype: int
-        """
-        line_length = self.__line_length(value)
-        self.set_value(value[:line_length])
-        return line_length
+        The value of a collapsed element may contain line breaks and have any length. It gets split into
+        concatenation and continuation lines when it is written, see `gedcom.writer.iter_lines()`.
+        See `set_multi_line_value()` and `gedcom.parser.Parser.parse_file()`.
 
-    def __add_bounded_child(self, tag, value):
-        """@TODO Write docs.
-        :type tag: str
-        :type value: str
-        :rtype: int
+        :rtype: bool
         """
-        child = self.new_child_element(tag)
-        return child.__set_bounded_value(value)
+        return bool(self.__flags & _FLAG_COLLAPSED)
 
-    def __add_concatenation(self, string):
-        """@TODO Write docs.
-        :rtype: str
-        """
-        index = 0
-        size = len(string)
-        while index < size:
-            index += self.__add_bounded_child(python_gedcom_2.tags.GEDCOM_TAG_CONCATENATION, string[index:])
-
-    def set_multi_line_value(self, value):
+    def set_multi_line_value(self, value, collapse=False):
         """Sets the value of this element, adding concatenation and continuation lines when necessary
+
+        Each line is split in a single pass, see `gedcom.writer.split_multi_line_value()`, and all concatenation
+        and continuation elements are added at once.
+
+        With `collapse` no such elements are added. The whole value is held by this element instead, see
+        `is_collapsed()`.
+
         :type value: str
+        :type collapse: bool
         """
         self.set_value('')
-        self.__children = [child for child in self.get_child_elements() if
-                           child.get_tag() not in (python_gedcom_2.tags.GEDCOM_TAG_CONCATENATION, python_gedcom_2.tags.GEDCOM_TAG_CONTINUED)]
-
-        lines = value.splitlines()
-        if lines:
-            line = lines.pop(0)
-            n = self.__set_bounded_value(line)
-            self.__add_concatenation(line[n:])
-
-            for line in lines:
-                n = self.__add_bounded_child(python_gedcom_2.tags.GEDCOM_TAG_CONTINUED, line)
-                self.__add_concatenation(line[n:])
+        self.__children_by_tag = None
+        self.__children = [child for child in self.get_child_elements() if child.get_tag() not in (
+            python_gedcom_2.tags.GEDCOM_TAG_CONCATENATION, python_gedcom_2.tags.GEDCOM_TAG_CONTINUED)]
+
+        if collapse:
+            self.__flags |= _FLAG_COLLAPSED
+            self.set_value(value)
+            return
+
+        self.__flags &= ~_FLAG_COLLAPSED
+        level = self.get_level() + 1
+        crlf = self.__crlf
+        first_value, lines = split_multi_line_value(value, len(self.to_gedcom_string()), level, crlf)
+        self.set_value(first_value)
+
+        create_element = ElementCreator.create_element
+        new_children = [create_element(level, "", tag, line_value, crlf, False) for tag, line_value in lines]
+        for child in new_children:
+            child.__parent = self
+        self.__children.extend(new_children)
 
     def get_child_elements(self):
         """Returns the direct child elements of this element
@@ -172,6 +225,54 @@ class Element(object):
         """
         return self.__children
 
+    def get_child_elements_by_tag(self, tag):
+        """Returns the direct child elements of this element with the given tag, in their original order
+
+        The children are looked up in an index by tag, which gets built on the first call and is kept up to date
+        by `add_child_element()` and `set_multi_line_value()`. It is also rebuilt when the number, the first or the
+        last of the children changed by modifying `get_child_elements()` directly, e.g. by removing a child. Replacing
+        a child in between by assignment isn't detected. The returned list must not be modified.
+
+        :type tag: str
+        :rtype: list of Element
+        """
+        return self.__get_children_by_tag().get(tag, [])
+
+    def get_first_child(self, tag):
+        """Returns the first direct child element of this element with the given tag, or `None` if there is none
+        :type tag: str
+        :rtype: Element
+        """
+        children = self.__get_children_by_tag().get(tag)
+        return children[0] if children else None
+
+    def __get_children_by_tag(self):
+        """Returns the index of the children by tag, rebuilding it if the children were changed otherwise
+        :rtype: dict[str, list of Element]
+        """
+        if not self.__is_index_up_to_date():
+            children_by_tag = {}
+            for child in self.__children:
+                children_by_tag.setdefault(child.get_tag(), []).append(child)
+            self.__children_by_tag = children_by_tag
+            self.__indexed_child_count = len(self.__children)
+        return self.__children_by_tag
+
+    def __is_index_up_to_date(self):
+        """Checks the index of the children by tag against the number, the first and the last of the children
+        :rtype: bool
+        """
+        children_by_tag = self.__children_by_tag
+        children = self.__children
+        if children_by_tag is None or self.__indexed_child_count != len(children):
+            return False
+        if not children:
+            return True
+        first_children = children_by_tag.get(children[0].get_tag())
+        last_children = children_by_tag.get(children[-1].get_tag())
+        return (first_children is not None and first_children[0] is children[0]
+                and last_children is not None and last_children[-1] is children[-1])
+
     def new_child_element(self, tag, pointer="", value=""):
         """Creates and returns a new child element of this element
 
@@ -189,9 +290,19 @@ class Element(object):
 
         :type element: Element
         """
+        is_index_up_to_date = self.__is_index_up_to_date()
         self.get_child_elements().append(element)
         element.set_parent_element(self)
 
+        if is_index_up_to_date:
+            self.__children_by_tag.setdefault(element.get_tag(), []).append(element)
+            self.__indexed_child_count += 1
+        else:
+            self.__children_by_tag = None
+
+        self.__multi_line_value = None
+        if not self.__flags & _FLAG_DIRTY:
+            self.__mark_dirty()
         return element
 
     def get_parent_element(self):
@@ -211,10 +322,7 @@ class Element(object):
         self.__parent = element
 
     def _is_tag_present(self, tag):
-        for child in self.get_child_elements():
-            if child.get_tag() == tag:
-                return True
-        return False
+        return self.get_first_child(tag) is not None
 
     @deprecated
     def get_individual(self):
@@ -226,30 +334,19 @@ class Element(object):
 
     def to_gedcom_string(self, recursive=False):
         """Formats this element and optionally all of its sub-elements into a GEDCOM string
+
+        Use `gedcom.writer.write_elements()` to write the sub-elements to a file stream without building the string.
+
         :type recursive: bool
         :rtype: str
         """
-
-        result = str(self.get_level())
-
-        if self.get_pointer() != "":
-            result += ' ' + self.get_pointer()
-
-        result += ' ' + self.get_tag()
-
-        if self.get_value() != "":
-            result += ' ' + self.get_value()
-
-        result += self.__crlf
+        if recursive:
+            return ''.join(iter_lines(self))
 
         if self.get_level() < 0:
-            result = ''
+            return ''
 
-        if recursive:
-            for child_element in self.get_child_elements():
-                result += child_element.to_gedcom_string(True)
-
-        return result
+        return format_line(self)
 
     def __str__(self):
         """:rtype: str"""
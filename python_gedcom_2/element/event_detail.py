@@ -9,6 +9,20 @@ class EventDetail(Element):
     NOTE: This is different from an event element, which is a legitimate GEDCOM tag and has its own rules.
     """
 
+    __slots__ = ()
+
+    def get_date_value(self):
+        """Returns the parsed value of the date of this event, or `None` if it has no date
+        :rtype: DateValue
+        """
+        date_value = None
+
+        for child in self.get_child_elements():
+            if isinstance(child, DateElement):
+                date_value = child.get_date_value()
+
+        return date_value
+
     def get_year_in_date(self):
         date = -1
 
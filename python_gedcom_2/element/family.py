@@ -9,6 +9,7 @@ class NotAnActualFamilyError(Exception):
 
 
 class FamilyElement(Element):
+    __slots__ = ()
 
     def get_tag(self):
         return python_gedcom_2.tags.GEDCOM_TAG_FAMILY
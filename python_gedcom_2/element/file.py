@@ -8,4 +8,4 @@ class NotAnActualFileError(Exception):
 
 
 class FileElement(Element):
-    pass
+    __slots__ = ()
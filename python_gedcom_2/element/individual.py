@@ -7,6 +7,7 @@ from python_gedcom_2.element.death import DeathElement
 from python_gedcom_2.element.element import Element
 from python_gedcom_2.element.event_detail import EventDetail
 from python_gedcom_2.helpers import deprecated
+from python_gedcom_2.query import compile_criteria
 import python_gedcom_2.tags
 
 
@@ -15,6 +16,7 @@ class NotAnActualIndividualError(Exception):
 
 
 class IndividualElement(Element):
+    __slots__ = ()
 
     def get_tag(self):
         return python_gedcom_2.tags.GEDCOM_TAG_INDIVIDUAL
@@ -41,11 +43,10 @@ class IndividualElement(Element):
         """Checks if this individual is marked private
         :rtype: bool
         """
-        for child in self.get_child_elements():
-            if child.get_tag() == python_gedcom_2.tags.GEDCOM_TAG_PRIVATE:
-                private = child.get_value()
-                if private == 'Y':
-                    return True
+        for child in self.get_child_elements_by_tag(python_gedcom_2.tags.GEDCOM_TAG_PRIVATE):
+            private = child.get_value()
+            if private == 'Y':
+                return True
 
         return False
 
@@ -62,38 +63,38 @@ class IndividualElement(Element):
         found_given_name = False
         found_surname_name = False
 
-        for child in self.get_child_elements():
-            if child.get_tag() == python_gedcom_2.tags.GEDCOM_TAG_NAME:
-                # Some GEDCOM files don't use child tags but instead
-                # place the name in the value of the NAME tag.
-                if child.get_value() != "":
-                    name = child.get_value().split('/')
-
-                    if len(name) > 0:
-                        given_name = name[0].strip()
-                        if len(name) > 1:
-                            surname = name[1].strip()
+        for child in self.get_child_elements_by_tag(python_gedcom_2.tags.GEDCOM_TAG_NAME):
+            # Some GEDCOM files don't use child tags but instead
+            # place the name in the value of the NAME tag.
+            if child.get_value() != "":
+                name = child.get_value().split('/')
 
-                    return given_name, surname
+                if len(name) > 0:
+                    given_name = name[0].strip()
+                    if len(name) > 1:
+                        surname = name[1].strip()
 
-                for childOfChild in child.get_child_elements():
+                return given_name, surname
 
-                    if childOfChild.get_tag() == python_gedcom_2.tags.GEDCOM_TAG_GIVEN_NAME:
-                        given_name = childOfChild.get_value()
-                        found_given_name = True
+            # The last of each of the tags wins.
+            given_names = child.get_child_elements_by_tag(python_gedcom_2.tags.GEDCOM_TAG_GIVEN_NAME)
+            if given_names:
+                given_name = given_names[-1].get_value()
+                found_given_name = True
 
-                    if childOfChild.get_tag() == python_gedcom_2.tags.GEDCOM_TAG_SURNAME:
-                        surname = childOfChild.get_value()
-                        found_surname_name = True
+            surnames = child.get_child_elements_by_tag(python_gedcom_2.tags.GEDCOM_TAG_SURNAME)
+            if surnames:
+                surname = surnames[-1].get_value()
+                found_surname_name = True
 
-                if found_given_name and found_surname_name:
-                    return given_name, surname
+            if found_given_name and found_surname_name:
+                return given_name, surname
 
         # If we reach here we are probably returning empty strings
         return given_name, surname
 
     def get_all_names(self):
-        return [a.get_value() for a in self.get_child_elements() if a.get_tag() == python_gedcom_2.tags.GEDCOM_TAG_NAME]
+        return [a.get_value() for a in self.get_child_elements_by_tag(python_gedcom_2.tags.GEDCOM_TAG_NAME)]
 
     def surname_match(self, surname_to_match):
         """Matches a string with the surname of an individual
@@ -124,31 +125,26 @@ class IndividualElement(Element):
         """Returns the gender of a person in string format
         :rtype: str
         """
-        gender = ""
-
-        for child in self.get_child_elements():
-            if child.get_tag() == python_gedcom_2.tags.GEDCOM_TAG_SEX:
-                gender = child.get_value()
-
-        return gender
+        # The last one wins, if there are several.
+        genders = self.get_child_elements_by_tag(python_gedcom_2.tags.GEDCOM_TAG_SEX)
+        return genders[-1].get_value() if genders else ""
 
     def __get_data_for_date_bearing_tag(self, tag):
         date = ""
         place = ""
         sources = []
 
-        for child in self.get_child_elements():
-            if child.get_tag() == tag:
-                for childOfChild in child.get_child_elements():
+        for child in self.get_child_elements_by_tag(tag):
+            for childOfChild in child.get_child_elements():
 
-                    if childOfChild.get_tag() == python_gedcom_2.tags.GEDCOM_TAG_DATE:
-                        date = childOfChild.get_value()
+                if childOfChild.get_tag() == python_gedcom_2.tags.GEDCOM_TAG_DATE:
+                    date = childOfChild.get_value()
 
-                    if childOfChild.get_tag() == python_gedcom_2.tags.GEDCOM_TAG_PLACE:
-                        place = childOfChild.get_value()
+                if childOfChild.get_tag() == python_gedcom_2.tags.GEDCOM_TAG_PLACE:
+                    place = childOfChild.get_value()
 
-                    if childOfChild.get_tag() == python_gedcom_2.tags.GEDCOM_TAG_SOURCE:
-                        sources.append(childOfChild.get_value())
+                if childOfChild.get_tag() == python_gedcom_2.tags.GEDCOM_TAG_SOURCE:
+                    sources.append(childOfChild.get_value())
 
         return date, place, sources
 
@@ -211,25 +207,24 @@ class IndividualElement(Element):
         """
         census = []
 
-        for child in self.get_child_elements():
-            if child.get_tag() == python_gedcom_2.tags.GEDCOM_TAG_CENSUS:
+        for child in self.get_child_elements_by_tag(python_gedcom_2.tags.GEDCOM_TAG_CENSUS):
 
-                date = ''
-                place = ''
-                sources = []
+            date = ''
+            place = ''
+            sources = []
 
-                for childOfChild in child.get_child_elements():
+            for childOfChild in child.get_child_elements():
 
-                    if childOfChild.get_tag() == python_gedcom_2.tags.GEDCOM_TAG_DATE:
-                        date = childOfChild.get_value()
+                if childOfChild.get_tag() == python_gedcom_2.tags.GEDCOM_TAG_DATE:
+                    date = childOfChild.get_value()
 
-                    if childOfChild.get_tag() == python_gedcom_2.tags.GEDCOM_TAG_PLACE:
-                        place = childOfChild.get_value()
+                if childOfChild.get_tag() == python_gedcom_2.tags.GEDCOM_TAG_PLACE:
+                    place = childOfChild.get_value()
 
-                    if childOfChild.get_tag() == python_gedcom_2.tags.GEDCOM_TAG_SOURCE:
-                        sources.append(childOfChild.get_value())
+                if childOfChild.get_tag() == python_gedcom_2.tags.GEDCOM_TAG_SOURCE:
+                    sources.append(childOfChild.get_value())
 
-                census.append((date, place, sources))
+            census.append((date, place, sources))
 
         return census
 
@@ -239,11 +234,10 @@ class IndividualElement(Element):
         """
         date = ""
 
-        for child in self.get_child_elements():
-            if child.get_tag() == python_gedcom_2.tags.GEDCOM_TAG_CHANGE:
-                for childOfChild in child.get_child_elements():
-                    if childOfChild.get_tag() == python_gedcom_2.tags.GEDCOM_TAG_DATE:
-                        date = childOfChild.get_value()
+        for child in self.get_child_elements_by_tag(python_gedcom_2.tags.GEDCOM_TAG_CHANGE):
+            dates = child.get_child_elements_by_tag(python_gedcom_2.tags.GEDCOM_TAG_DATE)
+            if dates:
+                date = dates[-1].get_value()
 
         return date
 
@@ -251,13 +245,9 @@ class IndividualElement(Element):
         """Returns the occupation of a person
         :rtype: str
         """
-        occupation = ""
-
-        for child in self.get_child_elements():
-            if child.get_tag() == python_gedcom_2.tags.GEDCOM_TAG_OCCUPATION:
-                occupation = child.get_value()
-
-        return occupation
+        # The last one wins, if there are several.
+        occupations = self.get_child_elements_by_tag(python_gedcom_2.tags.GEDCOM_TAG_OCCUPATION)
+        return occupations[-1].get_value() if occupations else ""
 
     def birth_year_match(self, year):
         """Returns `True` if the given year matches the birth year of this person
@@ -320,66 +310,10 @@ class IndividualElement(Element):
              Match a person whose death year is in the range of years from
              [from_year] to [to_year], including both [from_year] and [to_year].
 
+        The criteria get compiled once, see `gedcom.query.compile_criteria()`. To find all individuals
+        matching criteria, use `gedcom.parser.Parser.find_individuals()`.
+
         :type criteria: str
         :rtype: bool
         """
-
-        match = True
-
-        # Check if criteria is a valid criteria and can be split by `:` and `=` characters
-        if ":" in criteria:
-            for criterion in criteria.split(':'):
-                if "=" not in criterion:
-                    return False
-        else:
-            if "=" not in criteria:
-                return False
-
-        for criterion in criteria.split(':'):
-            key, value = criterion.split('=')
-
-            if key == "surname" and not self.surname_match(value):
-                match = False
-            elif key == "name" and not self.given_name_match(value):
-                match = False
-            elif key == "birth":
-
-                try:
-                    year = int(value)
-                    if not self.birth_year_match(year):
-                        match = False
-                except ValueError:
-                    match = False
-
-            elif key == "birth_range":
-
-                try:
-                    from_year, to_year = value.split('-')
-                    from_year = int(from_year)
-                    to_year = int(to_year)
-                    if not self.birth_range_match(from_year, to_year):
-                        match = False
-                except ValueError:
-                    match = False
-
-            elif key == "death":
-
-                try:
-                    year = int(value)
-                    if not self.death_year_match(year):
-                        match = False
-                except ValueError:
-                    match = False
-
-            elif key == "death_range":
-
-                try:
-                    from_year, to_year = value.split('-')
-                    from_year = int(from_year)
-                    to_year = int(to_year)
-                    if not self.death_range_match(from_year, to_year):
-                        match = False
-                except ValueError:
-                    match = False
-
-        return match
+        return compile_criteria(criteria).match(self)
@@ -4,5 +4,5 @@ from python_gedcom_2.element.event_detail import EventDetail
 
 
 class MarriageCountElement(EventDetail):
-    pass
+    __slots__ = ()
 
@@ -9,6 +9,7 @@ class NotAnActualObjectError(Exception):
 
 
 class ObjectElement(Element):
+    __slots__ = ()
 
     def is_object(self):
         """Checks if this element is an actual object
@@ -1,11 +1,77 @@
 import importlib
 import re
+from types import MappingProxyType
 
 import python_gedcom_2
 import python_gedcom_2.tags
 
 
+_BUILT_IN_ELEMENT_CLASS_NAMES = {
+    python_gedcom_2.tags.GEDCOM_TAG_ADOPTION: "AdoptionElement",
+    python_gedcom_2.tags.GEDCOM_TAG_ADULT_CHRISTENING: "AdultChristeningElement",
+    python_gedcom_2.tags.GEDCOM_TAG_ANNULMENT: "AnnulmentElement",
+    python_gedcom_2.tags.GEDCOM_TAG_BAPTISM: "BaptismElement",
+    python_gedcom_2.tags.GEDCOM_TAG_BAR_MITZVAH: "BarMitzvahElement",
+    python_gedcom_2.tags.GEDCOM_TAG_BAS_MITZVAH: "BasMitzvahElement",
+    python_gedcom_2.tags.GEDCOM_TAG_BIRTH: "BirthElement",
+    python_gedcom_2.tags.GEDCOM_TAG_BLESSING: "BlessingElement",
+    python_gedcom_2.tags.GEDCOM_TAG_BURIAL: "BurialElement",
+    python_gedcom_2.tags.GEDCOM_TAG_CASTE: "CasteElement",
+    python_gedcom_2.tags.GEDCOM_TAG_CENSUS: "CensusElement",
+    python_gedcom_2.tags.GEDCOM_TAG_CHILDREN_COUNT: "ChildrenCountElement",
+    python_gedcom_2.tags.GEDCOM_TAG_CHRISTENING: "ChristeningElement",
+    python_gedcom_2.tags.GEDCOM_TAG_CONFIRMATION: "ConfirmationElement",
+    python_gedcom_2.tags.GEDCOM_TAG_CREMATION: "CremationElement",
+    python_gedcom_2.tags.GEDCOM_TAG_DATE: "DateElement",
+    python_gedcom_2.tags.GEDCOM_TAG_DEATH: "DeathElement",
+    python_gedcom_2.tags.GEDCOM_TAG_DIVORCE: "DivorceElement",
+    python_gedcom_2.tags.GEDCOM_TAG_DIVORCE_FILED: "DivorceFiledElement",
+    python_gedcom_2.tags.GEDCOM_TAG_EDUCATION: "EducationElement",
+    python_gedcom_2.tags.GEDCOM_TAG_EMIGRATION: "EmigrationElement",
+    python_gedcom_2.tags.GEDCOM_TAG_ENGAGEMENT: "EngagementElement",
+    python_gedcom_2.tags.GEDCOM_TAG_EVENT: "EventElement",
+    python_gedcom_2.tags.GEDCOM_TAG_FAMILY: "FamilyElement",
+    python_gedcom_2.tags.GEDCOM_TAG_FILE: "FileElement",
+    python_gedcom_2.tags.GEDCOM_TAG_FIRST_COMMUNION: "FirstCommunionElement",
+    python_gedcom_2.tags.GEDCOM_TAG_GRADUATION: "GraduationElement",
+    python_gedcom_2.tags.GEDCOM_TAG_IDENTIFICATION_NUMBER: "IdentificationNumberElement",
+    python_gedcom_2.tags.GEDCOM_TAG_IMMIGRATION: "ImmigrationElement",
+    python_gedcom_2.tags.GEDCOM_TAG_INDIVIDUAL: "IndividualElement",
+    python_gedcom_2.tags.GEDCOM_TAG_MARRIAGE: "MarriageElement",
+    python_gedcom_2.tags.GEDCOM_TAG_MARRIAGE_BANN: "MarriageBannElement",
+    python_gedcom_2.tags.GEDCOM_TAG_MARRIAGE_CONTRACT: "MarriageContractElement",
+    python_gedcom_2.tags.GEDCOM_TAG_MARRIAGE_COUNT: "MarriageCountElement",
+    python_gedcom_2.tags.GEDCOM_TAG_MARRIAGE_LICENSE: "MarriageLicenseElement",
+    python_gedcom_2.tags.GEDCOM_TAG_MARRIAGE_SETTLEMENT: "MarriageSettlementElement",
+    python_gedcom_2.tags.GEDCOM_TAG_NATIONALITY: "NationalityElement",
+    python_gedcom_2.tags.GEDCOM_TAG_NATURALIZATION: "NaturalizationElement",
+    python_gedcom_2.tags.GEDCOM_TAG_OBJECT: "ObjectElement",
+    python_gedcom_2.tags.GEDCOM_TAG_OCCUPATION: "OccupationElement",
+    python_gedcom_2.tags.GEDCOM_TAG_ORDINATION: "OrdinationElement",
+    python_gedcom_2.tags.GEDCOM_TAG_PHYSICAL_DESCRIPTION: "PhysicalDescriptionElement",
+    python_gedcom_2.tags.GEDCOM_TAG_PROBATE: "ProbateElement",
+    python_gedcom_2.tags.GEDCOM_TAG_PROPERTY: "PropertyElement",
+    python_gedcom_2.tags.GEDCOM_TAG_RELIGION: "ReligionElement",
+    python_gedcom_2.tags.GEDCOM_TAG_RESIDENCE: "ResidenceElement",
+    python_gedcom_2.tags.GEDCOM_TAG_RETIREMENT: "RetirementElement",
+    python_gedcom_2.tags.GEDCOM_TAG_SOC_SEC_NUMBER: "SocialSecurityNumberElement",
+    python_gedcom_2.tags.GEDCOM_TAG_TITLE: "TitleElement",
+    python_gedcom_2.tags.GEDCOM_TAG_WILL: "WillElement",
+}
+
+
 class ElementCreator:
+    """Creates the matching `gedcom.element.element.Element` subclass for a tag
+
+    Tags without a registered class are created as plain `gedcom.element.element.Element` objects.
+    Additional classes, e.g. for program defined tags, can be added with `register_element_class()`.
+    """
+
+    __element_classes = {}
+    __built_in_element_classes = {}
+    __element_classes_view = MappingProxyType(__element_classes)
+    __default_element_class = None
+
     @staticmethod
     def _get_file_name_from_class_name(class_name):
         capitalized_words_in_class_name = re.findall('[A-Z][^A-Z]*', class_name)
@@ -13,70 +79,64 @@ class ElementCreator:
         return "_".join(capitalized_words_without_element_string_at_end).lower()
 
     @classmethod
-    def create_element(cls, level, pointer, tag, value, linebreak, is_multiline=True):
+    def __load_element_classes(cls):
+        """Resolves the class objects of the built-in tags once
+
+        This can't happen when this module is imported, since the element modules import it themselves.
+        """
         from python_gedcom_2.element.element import Element
 
-        tag_element_dict = {
-            python_gedcom_2.tags.GEDCOM_TAG_ADOPTION: "AdoptionElement",
-            python_gedcom_2.tags.GEDCOM_TAG_ADULT_CHRISTENING: "AdultChristeningElement",
-            python_gedcom_2.tags.GEDCOM_TAG_ANNULMENT: "AnnulmentElement",
-            python_gedcom_2.tags.GEDCOM_TAG_BAPTISM: "BaptismElement",
-            python_gedcom_2.tags.GEDCOM_TAG_BAR_MITZVAH: "BarMitzvahElement",
-            python_gedcom_2.tags.GEDCOM_TAG_BAS_MITZVAH: "BasMitzvahElement",
-            python_gedcom_2.tags.GEDCOM_TAG_BIRTH: "BirthElement",
-            python_gedcom_2.tags.GEDCOM_TAG_BLESSING: "BlessingElement",
-            python_gedcom_2.tags.GEDCOM_TAG_BURIAL: "BurialElement",
-            python_gedcom_2.tags.GEDCOM_TAG_CASTE: "CasteElement",
-            python_gedcom_2.tags.GEDCOM_TAG_CENSUS: "CensusElement",
-            python_gedcom_2.tags.GEDCOM_TAG_CHILDREN_COUNT: "ChildrenCountElement",
-            python_gedcom_2.tags.GEDCOM_TAG_CHRISTENING: "ChristeningElement",
-            python_gedcom_2.tags.GEDCOM_TAG_CONFIRMATION: "ConfirmationElement",
-            python_gedcom_2.tags.GEDCOM_TAG_CREMATION: "CremationElement",
-            python_gedcom_2.tags.GEDCOM_TAG_DATE: "DateElement",
-            python_gedcom_2.tags.GEDCOM_TAG_DEATH: "DeathElement",
-            python_gedcom_2.tags.GEDCOM_TAG_DIVORCE: "DivorceElement",
-            python_gedcom_2.tags.GEDCOM_TAG_DIVORCE_FILED: "DivorceFiledElement",
-            python_gedcom_2.tags.GEDCOM_TAG_EDUCATION: "EducationElement",
-            python_gedcom_2.tags.GEDCOM_TAG_EMIGRATION: "EmigrationElement",
-            python_gedcom_2.tags.GEDCOM_TAG_ENGAGEMENT: "EngagementElement",
-            python_gedcom_2.tags.GEDCOM_TAG_EVENT: "EventElement",
-            python_gedcom_2.tags.GEDCOM_TAG_FAMILY: "FamilyElement",
-            python_gedcom_2.tags.GEDCOM_TAG_FILE: "FileElement",
-            python_gedcom_2.tags.GEDCOM_TAG_FIRST_COMMUNION: "FirstCommunionElement",
-            python_gedcom_2.tags.GEDCOM_TAG_GRADUATION: "GraduationElement",
-            python_gedcom_2.tags.GEDCOM_TAG_IDENTIFICATION_NUMBER: "IdentificationNumberElement",
-            python_gedcom_2.tags.GEDCOM_TAG_IMMIGRATION: "ImmigrationElement",
-            python_gedcom_2.tags.GEDCOM_TAG_INDIVIDUAL: "IndividualElement",
-            python_gedcom_2.tags.GEDCOM_TAG_MARRIAGE: "MarriageElement",
-            python_gedcom_2.tags.GEDCOM_TAG_MARRIAGE_BANN: "MarriageBannElement",
-            python_gedcom_2.tags.GEDCOM_TAG_MARRIAGE_CONTRACT: "MarriageContractElement",
-            python_gedcom_2.tags.GEDCOM_TAG_MARRIAGE_COUNT: "MarriageCountElement",
-            python_gedcom_2.tags.GEDCOM_TAG_MARRIAGE_LICENSE: "MarriageLicenseElement",
-            python_gedcom_2.tags.GEDCOM_TAG_MARRIAGE_SETTLEMENT: "MarriageSettlementElement",
-            python_gedcom_2.tags.GEDCOM_TAG_NATIONALITY: "NationalityElement",
-            python_gedcom_2.tags.GEDCOM_TAG_NATURALIZATION: "NaturalizationElement",
-            python_gedcom_2.tags.GEDCOM_TAG_OBJECT: "ObjectElement",
-            python_gedcom_2.tags.GEDCOM_TAG_OCCUPATION: "OccupationElement",
-            python_gedcom_2.tags.GEDCOM_TAG_ORDINATION: "OrdinationElement",
-            python_gedcom_2.tags.GEDCOM_TAG_PHYSICAL_DESCRIPTION: "PhysicalDescriptionElement",
-            python_gedcom_2.tags.GEDCOM_TAG_PROBATE: "ProbateElement",
-            python_gedcom_2.tags.GEDCOM_TAG_PROPERTY: "PropertyElement",
-            python_gedcom_2.tags.GEDCOM_TAG_RELIGION: "ReligionElement",
-            python_gedcom_2.tags.GEDCOM_TAG_RESIDENCE: "ResidenceElement",
-            python_gedcom_2.tags.GEDCOM_TAG_RETIREMENT: "RetirementElement",
-            python_gedcom_2.tags.GEDCOM_TAG_SOC_SEC_NUMBER: "SocialSecurityNumberElement",
-            python_gedcom_2.tags.GEDCOM_TAG_TITLE: "TitleElement",
-            python_gedcom_2.tags.GEDCOM_TAG_WILL: "WillElement",
-        }
-
-        if tag in tag_element_dict:
-            class_name_in_string_form = tag_element_dict[tag]
+        for tag, class_name_in_string_form in _BUILT_IN_ELEMENT_CLASS_NAMES.items():
             file_name_without_extension_for_this_class = cls._get_file_name_from_class_name(class_name_in_string_form)
             module = importlib.import_module("python_gedcom_2.element." + file_name_without_extension_for_this_class)
-            class_ = getattr(module, class_name_in_string_form)
+            cls.__built_in_element_classes[tag] = getattr(module, class_name_in_string_form)
+            # Classes registered before the first element got created take precedence
+            cls.__element_classes.setdefault(tag, cls.__built_in_element_classes[tag])
+
+        cls.__default_element_class = Element
+
+    @classmethod
+    def get_element_classes(cls):
+        """Returns a read-only mapping of tags to the element classes created for them
+        :rtype: dict[str, type]
+        """
+        if cls.__default_element_class is None:
+            cls.__load_element_classes()
+        return cls.__element_classes_view
+
+    @classmethod
+    def register_element_class(cls, tag, element_class):
+        """Registers the element class that gets created for the given tag, replacing any previous class
+
+        :type tag: str
+        :type element_class: type
+        """
+        from python_gedcom_2.element.element import Element
 
-            element = class_(level, pointer, tag, value, linebreak, is_multiline)
+        if not isinstance(element_class, type) or not issubclass(element_class, Element):
+            raise TypeError("Element class for tag %s must be a subclass of Element" % tag)
+
+        cls.__element_classes[tag] = element_class
+
+    @classmethod
+    def unregister_element_class(cls, tag):
+        """Removes the element class registered for the given tag
+
+        A built-in tag gets its built-in class back, any other tag gets created as a plain element.
+
+        :type tag: str
+        """
+        if cls.__default_element_class is None:
+            cls.__load_element_classes()
+        if tag in cls.__built_in_element_classes:
+            cls.__element_classes[tag] = cls.__built_in_element_classes[tag]
         else:
-            element = Element(level, pointer, tag, value, linebreak, is_multiline)
+            cls.__element_classes.pop(tag, None)
+
+    @classmethod
+    def create_element(cls, level, pointer, tag, value, linebreak, is_multiline=True):
+        if cls.__default_element_class is None:
+            cls.__load_element_classes()
 
-        return element
+        class_ = cls.__element_classes.get(tag, cls.__default_element_class)
+        return class_(level, pointer, tag, value, linebreak, is_multiline)
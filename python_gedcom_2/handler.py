@@ -0,0 +1,31 @@
+"""
+Module containing the `gedcom.handler.GedcomHandler` which receives events from
+`gedcom.parser.Parser.parse_events()` instead of a tree of elements.
+"""
+
+
+class GedcomHandler(object):
+    """Receives a callback for each line of GEDCOM data, without any elements being created
+
+    Subclass it and override the callbacks of interest. `start_element()` is called for each line as soon
+    as it is tokenized, `end_element()` is called once all sub-elements of that line have been reported.
+    Quirk lines are reported like in `gedcom.parser.Parser.parse()`, e.g. a text line without level and tag
+    is reported as a `gedcom.tags.GEDCOM_TAG_CONCATENATION` with a pointer of `None`.
+    """
+
+    def start_element(self, level, pointer, tag, value):
+        """Called when a line starts an element
+        :type level: int
+        :type pointer: str
+        :type tag: str
+        :type value: str
+        """
+        pass
+
+    def end_element(self, level, pointer, tag):
+        """Called when an element and all of its sub-elements are complete
+        :type level: int
+        :type pointer: str
+        :type tag: str
+        """
+        pass
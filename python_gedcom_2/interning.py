@@ -0,0 +1,140 @@
+"""
+Module containing the string interning used while parsing, so that repeated tags and values
+share a single `str` object instead of each line creating its own.
+"""
+
+import sys
+
+import python_gedcom_2.tags
+
+KNOWN_TAGS = {value: value for name, value in vars(python_gedcom_2.tags).items() if name.startswith('GEDCOM_')}
+"""Dictionary of all tags in `gedcom.tags`, identified by themselves"""
+
+KNOWN_BYTES_TAGS = {tag.encode('ascii'): tag for tag in KNOWN_TAGS}
+"""Dictionary of all tags in `gedcom.tags`, identified by their encoded form"""
+
+DEFAULT_POOL_SIZE = 100000
+"""Maximum number of distinct values kept by a `gedcom.interning.ValuePool` by default"""
+
+DEFAULT_MAX_VALUE_LENGTH = 128
+"""Maximum length of a value interned by a `gedcom.interning.ValuePool` by default"""
+
+
+def intern_tag(tag):
+    """Returns the constant of `gedcom.tags` equal to the given tag, or an interned copy of any other tag
+    :type tag: str
+    :rtype: str
+    """
+    known_tag = KNOWN_TAGS.get(tag)
+    if known_tag is None:
+        return sys.intern(tag)
+    return known_tag
+
+
+def intern_bytes_tag(tag):
+    """Decodes a tag, returning the constant of `gedcom.tags` without decoding if there is one
+    :type tag: bytes
+    :rtype: str
+    """
+    known_tag = KNOWN_BYTES_TAGS.get(tag)
+    if known_tag is None:
+        return sys.intern(tag.decode('ascii'))
+    return known_tag
+
+
+class ValuePool(object):
+    """Pool of values shared by all elements that have an equal value, e.g. `M`, `F`, places or pointers
+
+    At most `max_size` distinct values of up to `max_length` characters are pooled. Once the pool is full,
+    values that are not pooled yet are kept as they are, so the memory of the pool stays bounded.
+    Statistics about the deduplication are collected, see `gedcom.interning.ValuePool.get_report()`.
+    """
+
+    def __init__(self, max_size=DEFAULT_POOL_SIZE, max_length=DEFAULT_MAX_VALUE_LENGTH):
+        """
+        :type max_size: int
+        :type max_length: int
+        """
+        self.__max_size = max_size
+        self.__max_length = max_length
+        self.clear()
+
+    def intern(self, value):
+        """Returns the pooled value equal to the given value, adding it to the pool if possible
+        :type value: str
+        :rtype: str
+        """
+        if not value:
+            return value
+
+        self.__value_count += 1
+        self.__character_count += len(value)
+
+        pooled_value = self.__values.get(value)
+        if pooled_value is not None:
+            self.__deduplicated_count += 1
+            self.__deduplicated_characters += len(value)
+            self.__deduplicated_bytes += sys.getsizeof(value)
+            return pooled_value
+
+        if len(self.__values) < self.__max_size and len(value) <= self.__max_length:
+            self.__values[value] = value
+        return value
+
+    def intern_tokens(self, tokens):
+        """Yields tokens, as yielded by `gedcom.tokenizer.iter_tokens()`, with pooled values
+        :type tokens: collections.abc.Iterable[tuple]
+        :rtype: collections.abc.Iterator[tuple]
+        """
+        intern = self.intern
+        for level, pointer, tag, value, crlf in tokens:
+            yield level, pointer, tag, intern(value), crlf
+
+    def __len__(self):
+        return len(self.__values)
+
+    def clear(self):
+        """Empties the pool and resets its statistics"""
+        self.__values = {}
+
+        self.__value_count = 0
+        self.__character_count = 0
+        self.__deduplicated_count = 0
+        self.__deduplicated_characters = 0
+        self.__deduplicated_bytes = 0
+
+    def get_statistics(self):
+        """Returns the statistics of this pool
+
+        The dictionary holds the number of non-empty values passed to `gedcom.interning.ValuePool.intern()`
+        (`values`) and their total length (`characters`), how many of them were replaced by a pooled value
+        (`deduplicated_values`, `deduplicated_characters`), the memory of the replaced `str` objects in bytes
+        (`deduplicated_bytes`) and the number of pooled values (`pool_size`).
+
+        :rtype: dict[str, int]
+        """
+        return {
+            'values': self.__value_count,
+            'characters': self.__character_count,
+            'deduplicated_values': self.__deduplicated_count,
+            'deduplicated_characters': self.__deduplicated_characters,
+            'deduplicated_bytes': self.__deduplicated_bytes,
+            'pool_size': len(self.__values),
+        }
+
+    def get_report(self):
+        """Returns a human readable summary of `gedcom.interning.ValuePool.get_statistics()`
+        :rtype: str
+        """
+        statistics = self.get_statistics()
+        return ("Deduplicated %d of %d values (%.1f%%), %d of %d characters (%.1f%%), saving %d bytes."
+                " %d of at most %d distinct values pooled." % (
+                    statistics['deduplicated_values'], statistics['values'],
+                    self.__percentage(statistics['deduplicated_values'], statistics['values']),
+                    statistics['deduplicated_characters'], statistics['characters'],
+                    self.__percentage(statistics['deduplicated_characters'], statistics['characters']),
+                    statistics['deduplicated_bytes'], statistics['pool_size'], self.__max_size))
+
+    @staticmethod
+    def __percentage(part, total):
+        return 100.0 * part / total if total else 0.0
@@ -0,0 +1,309 @@
+"""
+Module containing the `gedcom.kinship.KinshipCalculator`, which computes kinship and inbreeding coefficients
+with the tabular method.
+
+The kinship coefficient of two individuals is the probability that an allele picked at random from each of them
+is identical by descent. The inbreeding coefficient of an individual is the kinship coefficient of its parents.
+
+`gedcom.kinship.KinshipCalculator.get_kinship_matrix()` requires NumPy, or SciPy for its sparse output.
+"""
+
+from python_gedcom_2.element.individual import IndividualElement, NotAnActualIndividualError
+from python_gedcom_2.parser import PedigreeCycleError
+import python_gedcom_2.tags
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None
+
+try:
+    import scipy.sparse
+except ImportError:  # pragma: no cover
+    scipy = None
+
+UNKNOWN_PARENT = -1
+"""Index of a parent that isn't known, i.e. of both parents of a founder"""
+
+
+class KinshipCalculator(object):
+    """Computes kinship and inbreeding coefficients of the individuals of a `gedcom.parser.Parser`
+
+    The pedigree is ordered by generation on first use, founders first, so that the parents of an individual always
+    come before it. The kinship coefficient of two individuals is then half the sum of the coefficients of the later
+    one's parents with the other one, and the coefficient of an individual with itself is half of one plus the
+    inbreeding coefficient. Coefficients computed for pairs are kept for further calls.
+
+    Individuals with more than two parents (e.g. adopted children with `ancestor_type` `ALL`) are treated as
+    the child of their first two parents. Data modified after creating the calculator isn't taken into account,
+    create a new calculator instead.
+    """
+
+    def __init__(self, parser, ancestor_type="ALL"):
+        """
+        :type parser: Parser
+        :type ancestor_type: str
+        """
+        self.__parser = parser
+        self.__ancestor_type = ancestor_type
+        self.__indexes = None
+        self.__pointers = None
+        self.__generations = None
+        self.__first_parents = None
+        self.__second_parents = None
+        self.__kinship = {}
+
+    def get_kinship(self, individual, relative):
+        """Returns the kinship coefficient of two individuals
+        :type individual: IndividualElement
+        :type relative: IndividualElement
+        :rtype: float
+        """
+        return self.__get_kinship(self.__get_index(individual), self.__get_index(relative))
+
+    def get_inbreeding(self, individual):
+        """Returns the inbreeding coefficient of an individual, 0 if one of its parents isn't known
+        :type individual: IndividualElement
+        :rtype: float
+        """
+        index = self.__get_index(individual)
+        return self.__get_kinship(self.__first_parents[index], self.__second_parents[index])
+
+    def get_inbreeding_coefficients(self):
+        """Returns the inbreeding coefficients of all individuals by their pointer
+        :rtype: dict[str, float]
+        """
+        self.__build_pedigree()
+        return {
+            pointer: self.__get_kinship(self.__first_parents[index], self.__second_parents[index])
+            for index, pointer in enumerate(self.__pointers)
+        }
+
+    def get_kinship_matrix(self, individuals, sparse=False):
+        """Returns the kinship coefficients of all pairs of the given individuals as a matrix
+
+        Row and column `i` belong to the `i`-th individual. The coefficients are computed one generation of the
+        given individuals and their ancestors at a time.
+
+        By default the matrix is computed with NumPy, which takes memory for a dense matrix of all of them.
+        With `sparse` it is returned as a `scipy.sparse.csr_matrix`. Then only the coefficients of related
+        individuals are computed and kept, one row of relatives per individual, and no dense matrix gets created.
+
+        :type individuals: list of IndividualElement
+        :type sparse: bool
+        :rtype: numpy.ndarray | scipy.sparse.csr_matrix
+        """
+        if sparse and scipy is None:
+            raise ImportError("KinshipCalculator.get_kinship_matrix() requires SciPy for a sparse matrix")
+        if not sparse and numpy is None:
+            raise ImportError("KinshipCalculator.get_kinship_matrix() requires NumPy")
+
+        row_indexes = [self.__get_index(individual) for individual in individuals]
+
+        # The given individuals and all of their ancestors, in the order of the pedigree
+        indexes = set()
+        stack = list(row_indexes)
+        while stack:
+            index = stack.pop()
+            if index != UNKNOWN_PARENT and index not in indexes:
+                indexes.add(index)
+                stack.append(self.__first_parents[index])
+                stack.append(self.__second_parents[index])
+        indexes = sorted(indexes)
+
+        # Unknown parents get the index after the last individual
+        size = len(indexes)
+        local_indexes = {index: local_index for local_index, index in enumerate(indexes)}
+        local_indexes[UNKNOWN_PARENT] = size
+        first_parents = [local_indexes[self.__first_parents[index]] for index in indexes]
+        second_parents = [local_indexes[self.__second_parents[index]] for index in indexes]
+        rows = [local_indexes[index] for index in row_indexes]
+
+        if sparse:
+            return self.__get_sparse_kinship_matrix(first_parents, second_parents, rows)
+
+        generation_ends = []
+        for local_index in range(1, size + 1):
+            if local_index == size or self.__generations[indexes[local_index]] != self.__generations[indexes[local_index - 1]]:
+                generation_ends.append(local_index)
+        return self.__get_dense_kinship_matrix(first_parents, second_parents, generation_ends, rows)
+
+    @staticmethod
+    def __get_dense_kinship_matrix(first_parents, second_parents, generation_ends, rows):
+        """Computes the kinship matrix with NumPy, vectorized per generation
+        :type first_parents: list of int
+        :type second_parents: list of int
+        :type generation_ends: list of int
+        :type rows: list of int
+        :rtype: numpy.ndarray
+        """
+        # The last row and column belong to unknown parents and stay 0
+        size = len(first_parents)
+        first_parents = numpy.array(first_parents, dtype=numpy.intp)
+        second_parents = numpy.array(second_parents, dtype=numpy.intp)
+        kinship = numpy.zeros((size + 1, size + 1))
+
+        start = 0
+        for end in generation_ends:
+            first = first_parents[start:end]
+            second = second_parents[start:end]
+            block = slice(start, end)
+
+            # With all earlier generations, which contain the parents
+            kinship[block, :start] = 0.5 * (kinship[first, :start] + kinship[second, :start])
+            kinship[:start, block] = kinship[block, :start].T
+            # Within the generation, through the parents of the column individuals
+            kinship[block, block] = 0.5 * (kinship[block, first] + kinship[block, second])
+            diagonal = numpy.arange(start, end)
+            kinship[diagonal, diagonal] = 0.5 * (1.0 + kinship[first, second])
+
+            start = end
+
+        return kinship[numpy.ix_(rows, rows)]
+
+    @staticmethod
+    def __get_sparse_kinship_matrix(first_parents, second_parents, rows):
+        """Computes the kinship matrix from rows holding the nonzero coefficients of each individual only
+
+        The row of an individual is half the sum of the rows of its parents, as none of the individuals before
+        it in the pedigree can be its descendant. Its coefficients are added to the rows of its relatives as well,
+        so that the rows are symmetric.
+
+        :type first_parents: list of int
+        :type second_parents: list of int
+        :type rows: list of int
+        :rtype: scipy.sparse.csr_matrix
+        """
+        size = len(first_parents)
+        kinship_rows = []
+        for index in range(size):
+            first, second = first_parents[index], second_parents[index]
+            kinship_row = {}
+            for parent in (first, second):
+                if parent != size:
+                    for relative, coefficient in kinship_rows[parent].items():
+                        kinship_row[relative] = kinship_row.get(relative, 0.0) + 0.5 * coefficient
+
+            for relative, coefficient in kinship_row.items():
+                kinship_rows[relative][index] = coefficient
+
+            parents_kinship = kinship_rows[first].get(second, 0.0) if first != size and second != size else 0.0
+            kinship_row[index] = 0.5 * (1.0 + parents_kinship)
+            kinship_rows.append(kinship_row)
+
+        columns_by_index = {}
+        for column, index in enumerate(rows):
+            columns_by_index.setdefault(index, []).append(column)
+
+        data = []
+        row_numbers = []
+        column_numbers = []
+        for row, index in enumerate(rows):
+            for relative, coefficient in kinship_rows[index].items():
+                for column in columns_by_index.get(relative, ()):
+                    data.append(coefficient)
+                    row_numbers.append(row)
+                    column_numbers.append(column)
+
+        return scipy.sparse.csr_matrix((data, (row_numbers, column_numbers)), shape=(len(rows), len(rows)))
+
+    def __get_index(self, individual):
+        if not isinstance(individual, IndividualElement):
+            raise NotAnActualIndividualError(
+                "Operation only valid for elements with %s tag" % python_gedcom_2.tags.GEDCOM_TAG_INDIVIDUAL
+            )
+        self.__build_pedigree()
+        return self.__indexes[individual.get_pointer()]
+
+    def __get_parent_pointers(self, individual):
+        parent_pointers = []
+        for parent in self.__parser.get_parents(individual, self.__ancestor_type):
+            if parent.get_pointer() not in parent_pointers:
+                parent_pointers.append(parent.get_pointer())
+        return parent_pointers[:2]
+
+    def __build_pedigree(self):
+        """Orders all individuals by generation, founders being generation 0, without recursion"""
+        if self.__indexes is not None:
+            return
+
+        parent_pointers = {}
+        for pointer, element in self.__parser.get_element_dictionary().items():
+            if isinstance(element, IndividualElement):
+                parent_pointers[pointer] = self.__get_parent_pointers(element)
+
+        generations = {}
+        in_progress = set()
+        for pointer in parent_pointers:
+            stack = [pointer]
+            while stack:
+                current = stack[-1]
+                if current in generations:
+                    stack.pop()
+                    continue
+
+                if current not in in_progress:
+                    missing_pointers = [parent for parent in parent_pointers[current] if parent not in generations]
+                    if missing_pointers:
+                        in_progress.add(current)
+                        for parent in missing_pointers:
+                            if parent in in_progress:
+                                raise PedigreeCycleError("Individual %s is its own ancestor" % parent)
+                            stack.append(parent)
+                        continue
+
+                generations[current] = 1 + max([generations[parent] for parent in parent_pointers[current]], default=-1)
+                in_progress.discard(current)
+                stack.pop()
+
+        self.__pointers = sorted(parent_pointers, key=generations.get)
+        self.__indexes = {pointer: index for index, pointer in enumerate(self.__pointers)}
+        self.__generations = [generations[pointer] for pointer in self.__pointers]
+        self.__first_parents = []
+        self.__second_parents = []
+        for pointer in self.__pointers:
+            parent_indexes = [self.__indexes[parent] for parent in parent_pointers[pointer]]
+            parent_indexes += [UNKNOWN_PARENT] * (2 - len(parent_indexes))
+            self.__first_parents.append(parent_indexes[0])
+            self.__second_parents.append(parent_indexes[1])
+
+    def __get_kinship(self, first_index, second_index):
+        """Computes the kinship coefficient of two indexes of the pedigree, without recursion
+        :type first_index: int
+        :type second_index: int
+        :rtype: float
+        """
+        kinship = self.__kinship
+        stack = [(max(first_index, second_index), min(first_index, second_index))]
+
+        while stack:
+            pair = stack[-1]
+            if pair in kinship:
+                stack.pop()
+                continue
+
+            # The later individual of the pair can't be an ancestor of the other one.
+            later, earlier = pair
+            if earlier == UNKNOWN_PARENT:
+                kinship[pair] = 0.0
+                stack.pop()
+                continue
+
+            if later == earlier:
+                parent_pairs = [(self.__first_parents[later], self.__second_parents[later])]
+            else:
+                parent_pairs = [(self.__first_parents[later], earlier), (self.__second_parents[later], earlier)]
+            parent_pairs = [(max(parent_pair), min(parent_pair)) for parent_pair in parent_pairs]
+
+            missing_pairs = [parent_pair for parent_pair in parent_pairs if parent_pair not in kinship]
+            if missing_pairs:
+                stack.extend(missing_pairs)
+                continue
+
+            if later == earlier:
+                kinship[pair] = 0.5 * (1.0 + kinship[parent_pairs[0]])
+            else:
+                kinship[pair] = 0.5 * (kinship[parent_pairs[0]] + kinship[parent_pairs[1]])
+            stack.pop()
+
+        return kinship[(max(first_index, second_index), min(first_index, second_index))]
@@ -0,0 +1,140 @@
+"""
+Module containing the containers used by `gedcom.parser.Parser` in lazy mode, which only index the
+logical records of a file and create their elements when they get accessed.
+"""
+
+from array import array
+from collections import OrderedDict
+from collections.abc import Mapping, Sequence
+from contextlib import ExitStack
+import re as regex
+
+from python_gedcom_2.reader import count_lines, find_record_start, get_data_start, map_file
+
+DEFAULT_CACHE_SIZE = 10000
+"""Number of logical records kept in memory by default, see `gedcom.lazy.LazyRecordList`"""
+
+# Pointer of a level 0 line
+RECORD_POINTER_REGEX = regex.compile(b'0 (@[^@\n]+@) ')
+
+
+class LazyRecordList(Sequence):
+    """Read-only sequence of the logical records in a memory-mapped GEDCOM file
+
+    When created, only the start offset, first line number and pointer of each record get stored.
+    A record gets created by `load_record` when it is accessed and is kept in a least recently used
+    cache of `cache_size` records. A record that was dropped from the cache is created anew on its next access,
+    so changes made to it are lost.
+
+    `load_record` gets called with the mapped data, the start and end offset and the first line number of a record.
+    """
+
+    def __init__(self, file_path, load_record, cache_size=DEFAULT_CACHE_SIZE):
+        """
+        :type file_path: str
+        :type load_record: collections.abc.Callable
+        :type cache_size: int
+        """
+        self.__load_record = load_record
+        self.__cache_size = cache_size
+        self.__cache = OrderedDict()
+
+        self.__exit_stack = ExitStack()
+        self.__data = self.__exit_stack.enter_context(map_file(file_path))
+
+        self.__offsets = array('q')
+        self.__line_numbers = array('q')
+        self.__pointers = []
+        self.__build_index()
+
+        # Like `gedcom.parser.Parser.get_element_dictionary()`, the last record wins if pointers are duplicated.
+        self.__indexes = {pointer: index for index, pointer in enumerate(self.__pointers) if pointer}
+
+    def __build_index(self):
+        data = self.__data
+        start = get_data_start(data)
+        end = len(data)
+        line_number = 1
+
+        while start < end:
+            record_end = find_record_start(data, start, end)
+            pointer_match = RECORD_POINTER_REGEX.match(data[start:start + 256])
+
+            self.__offsets.append(start)
+            self.__line_numbers.append(line_number)
+            self.__pointers.append(pointer_match.group(1).decode('utf-8') if pointer_match else '')
+
+            line_number += count_lines(data, start, record_end)
+            start = record_end
+
+        self.__offsets.append(end)
+
+    def __len__(self):
+        return len(self.__pointers)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("record index out of range")
+
+        cache = self.__cache
+        record = cache.get(index)
+        if record is not None:
+            cache.move_to_end(index)
+            return record
+
+        record = self.__load_record(self.__data, self.__offsets[index], self.__offsets[index + 1],
+                                    self.__line_numbers[index])
+        cache[index] = record
+        if len(cache) > self.__cache_size:
+            cache.popitem(last=False)
+        return record
+
+    def get_pointers(self):
+        """Returns the pointers of all records, which is an empty string for records without one
+        :rtype: list of str
+        """
+        return self.__pointers
+
+    def get_pointer_indexes(self):
+        """Returns a dictionary of the indexes of all records with a pointer, identified by that pointer
+        :rtype: dict[str, int]
+        """
+        return self.__indexes
+
+    def get_cached_count(self):
+        """Returns the number of records currently kept in memory
+        :rtype: int
+        """
+        return len(self.__cache)
+
+    def close(self):
+        """Drops all cached records and unmaps the file. Records can't be accessed afterwards."""
+        self.__cache.clear()
+        self.__exit_stack.close()
+
+
+class LazyRecordDictionary(Mapping):
+    """Read-only mapping of pointers to the records of a `gedcom.lazy.LazyRecordList`"""
+
+    def __init__(self, records):
+        """
+        :type records: LazyRecordList
+        """
+        self.__records = records
+
+    def __getitem__(self, pointer):
+        return self.__records[self.__records.get_pointer_indexes()[pointer]]
+
+    def __contains__(self, pointer):
+        return pointer in self.__records.get_pointer_indexes()
+
+    def __iter__(self):
+        return iter(self.__records.get_pointer_indexes())
+
+    def __len__(self):
+        return len(self.__records.get_pointer_indexes())
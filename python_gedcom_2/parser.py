@@ -3,8 +3,7 @@ Module containing the actual `gedcom.parser.Parser` used to generate elements -
 which can in return be manipulated.
 """
 
-import re as regex
-from sys import version_info
+from concurrent.futures import ProcessPoolExecutor
 
 from python_gedcom_2.element_creator import ElementCreator
 
@@ -12,6 +11,14 @@ from python_gedcom_2.element.element import Element
 from python_gedcom_2.element.family import FamilyElement, NotAnActualFamilyError
 from python_gedcom_2.element.individual import IndividualElement, NotAnActualIndividualError
 from python_gedcom_2.element.root import RootElement
+from python_gedcom_2.lazy import DEFAULT_CACHE_SIZE, LazyRecordDictionary, LazyRecordList
+from python_gedcom_2.query import IndividualIndex, PreparedQuery, compile_criteria
+from python_gedcom_2.relationship_index import INDEXED_FAMILY_TYPES, RelationshipIndex
+from python_gedcom_2.reader import count_lines, decode_lines, find_shard_offsets, iter_raw_lines, map_file, read_lines
+from python_gedcom_2.tokenizer import GedcomFormatViolationError, iter_tokens, tokenize_bytes_line, tokenize_line  # noqa: F401
+from python_gedcom_2.writer import DEFAULT_ENCODING as DEFAULT_WRITE_ENCODING, track_records, write_elements, \
+    write_records
+from python_gedcom_2.year_index import YEAR_INDEX_BIRTH, YEAR_INDEX_DEATH, YEAR_INDEX_MARRIAGE, build_year_indexes
 import python_gedcom_2.tags
 
 FAMILY_MEMBERS_TYPE_ALL = "ALL"
@@ -20,12 +27,35 @@ FAMILY_MEMBERS_TYPE_HUSBAND = python_gedcom_2.tags.GEDCOM_TAG_HUSBAND
 FAMILY_MEMBERS_TYPE_PARENTS = "PARENTS"
 FAMILY_MEMBERS_TYPE_WIFE = python_gedcom_2.tags.GEDCOM_TAG_WIFE
 
+RELATION_TYPE_PARENT = "PARENT"
+RELATION_TYPE_CHILD = "CHILD"
+RELATION_TYPE_SPOUSE = "SPOUSE"
+RELATION_TYPE_SIBLING = "SIBLING"
+
+# Relation of an individual to another one, given the relation of the other one to that individual
+_INVERSE_RELATION_TYPES = {
+    RELATION_TYPE_PARENT: RELATION_TYPE_CHILD,
+    RELATION_TYPE_CHILD: RELATION_TYPE_PARENT,
+    RELATION_TYPE_SPOUSE: RELATION_TYPE_SPOUSE,
+    RELATION_TYPE_SIBLING: RELATION_TYPE_SIBLING,
+}
+
+# Tags of the members returned by `Parser.get_family_members()` for each type
+_FAMILY_MEMBER_TAGS_BY_TYPE = {
+    FAMILY_MEMBERS_TYPE_ALL: (python_gedcom_2.tags.GEDCOM_TAG_HUSBAND, python_gedcom_2.tags.GEDCOM_TAG_WIFE,
+                              python_gedcom_2.tags.GEDCOM_TAG_CHILD),
+    FAMILY_MEMBERS_TYPE_PARENTS: (python_gedcom_2.tags.GEDCOM_TAG_HUSBAND, python_gedcom_2.tags.GEDCOM_TAG_WIFE),
+    FAMILY_MEMBERS_TYPE_HUSBAND: (python_gedcom_2.tags.GEDCOM_TAG_HUSBAND,),
+    FAMILY_MEMBERS_TYPE_WIFE: (python_gedcom_2.tags.GEDCOM_TAG_WIFE,),
+    FAMILY_MEMBERS_TYPE_CHILDREN: (python_gedcom_2.tags.GEDCOM_TAG_CHILD,),
+}
 
-class GedcomFormatViolationError(Exception):
+
+class PointerNotFoundException(Exception):
     pass
 
 
-class PointerNotFoundException(Exception):
+class PedigreeCycleError(Exception):
     pass
 
 
@@ -40,21 +70,62 @@ class Parser(object):
 
     * a `list` through `gedcom.parser.Parser.get_element_list()`
     * a `dict` through `gedcom.parser.Parser.get_element_dictionary()`
+
+    Tags are always interned. Pass a `gedcom.interning.ValuePool` to also share equal values, e.g. `M`
+    or repeated places, between all elements created by this parser.
     """
 
-    def __init__(self):
+    def __init__(self, value_pool=None):
+        """
+        :type value_pool: ValuePool
+        """
+        self.__value_pool = value_pool
         self.__element_list = []
         self.__element_dictionary = {}
+        self.__relationship_index = None
+        self.__individual_index = None
+        self.__year_indexes = None
         self.__root_element = RootElement()
+        self.__lazy_records = None
+        self.__lazy_record_dictionary = None
+        self.__record_source = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        """Unmaps and closes the file of lazy mode (see `gedcom.parser.Parser.parse_file()`), which leaves this parser
+        without any records. Does nothing if not in lazy mode.
+
+        A parser can be used as a context manager, which calls this method on exit.
+        """
+        if self.__lazy_records is not None:
+            self.__reset()
+
+    def get_value_pool(self):
+        """Returns the pool sharing equal values between elements, or `None` if values are not pooled
+        :rtype: ValuePool
+        """
+        return self.__value_pool
 
     def invalidate_cache(self):
         """Empties the element list and dictionary to cause `gedcom.parser.Parser.get_element_list()`
         and `gedcom.parser.Parser.get_element_dictionary()` to return updated data.
 
+        The index of links between individuals and families used by the relationship methods,
+        e.g. `gedcom.parser.Parser.get_parents()`, the index used by `gedcom.parser.Parser.find_individuals()`
+        and the year indexes, e.g. of `gedcom.parser.Parser.individuals_born_between()`, get emptied as well.
+
         The update gets deferred until each of the methods actually gets called.
         """
         self.__element_list = []
         self.__element_dictionary = {}
+        self.__relationship_index = None
+        self.__individual_index = None
+        self.__year_indexes = None
 
     def get_element_by_pointer(self, pointer):
         """Returns the element that has the provided pointer. Raises an exception if that pointer doesn't exist.
@@ -96,8 +167,14 @@ class Parser(object):
         database was modified, you should call `invalidate_cache()` once to let
         this method return updated data.
 
+        In lazy mode (see `gedcom.parser.Parser.parse_file()`) a read-only mapping is returned,
+        which creates the records when they get accessed.
+
         :rtype: dict[str, Element]
         """
+        if self.__lazy_records is not None:
+            return self.__lazy_record_dictionary
+
         if not self.__element_dictionary:
             self.__element_dictionary = {
                 element.get_pointer(): element for element in self.get_root_child_elements() if element.get_pointer()
@@ -110,8 +187,16 @@ class Parser(object):
 
         When printed, this element converts to an empty string.
 
+        In lazy mode (see `gedcom.parser.Parser.parse_file()`) all records get created and added to
+        the root element, which ends lazy mode.
+
         :rtype: RootElement
         """
+        if self.__lazy_records is not None:
+            for record in self.__lazy_records:
+                self.__root_element.add_child_element(record)
+            self.__close_lazy_records()
+
         return self.__root_element
 
     def get_root_child_elements(self):
@@ -119,119 +204,342 @@ class Parser(object):
 
         By default, elements are in the same order as they appeared in the file.
 
+        In lazy mode (see `gedcom.parser.Parser.parse_file()`) a read-only sequence is returned,
+        which creates the records when they get accessed.
+
         :rtype: list of Element
         """
+        if self.__lazy_records is not None:
+            return self.__lazy_records
+
         return self.get_root_element().get_child_elements()
 
-    def parse_file(self, file_path, strict=True):
+    def parse_file(self, file_path, strict=True, mmap=False, workers=None, lazy=False, cache_size=DEFAULT_CACHE_SIZE,
+                   track_changes=False, collapse_multi_line=False):
         """Opens and parses a file, from the given file path, as GEDCOM 5.5 formatted data
+
+        With `mmap` the file gets memory-mapped and tokenized on its raw bytes, only decoding the
+        pointer, tag and value of each line. The operating system's page cache then is shared by all processes
+        parsing the same file.
+
+        With more than one of `workers` the file gets split into as many ranges of logical records, which are
+        tokenized and validated in a pool of processes, each memory-mapping the file. The elements are then
+        created in their original order.
+
+        With `lazy` the file gets memory-mapped and only the offset and pointer of each logical record gets
+        stored. `gedcom.parser.Parser.get_root_child_elements()`, `gedcom.parser.Parser.get_element_dictionary()` and
+        `gedcom.parser.Parser.get_element_by_pointer()` then create records when they get accessed, keeping at most
+        `cache_size` of the most recently used ones in memory. Lines get validated when their record is created.
+        As dropped records are created anew, changes to them may get lost, so lazy mode is meant for reading.
+        `gedcom.parser.Parser.get_root_element()` and `gedcom.parser.Parser.get_element_list()` still create
+        all records. `mmap` and `workers` don't apply to lazy mode. The file stays open until lazy mode ends or
+        `gedcom.parser.Parser.close()` gets called.
+
+        With `track_changes` the byte range of each logical record in the file is remembered and the dirty flags
+        of the records get cleared, see `gedcom.element.element.Element.is_dirty()`.
+        `gedcom.parser.Parser.save_gedcom()` then copies the records which weren't changed from the file as they
+        are, and only writes the changed ones anew. `track_changes` doesn't apply to lazy mode.
+
+        With `collapse_multi_line` no elements are created for concatenation and continuation (`CONC` and `CONT`)
+        lines. Their values are joined into the value of the element they belong to instead,
+        see `gedcom.element.element.Element.is_collapsed()`. When saved, the values get split into lines again.
+
         :type file_path: str
         :type strict: bool
+        :type mmap: bool
+        :type workers: int
+        :type lazy: bool
+        :type cache_size: int
+        :type track_changes: bool
+        :type collapse_multi_line: bool
         """
-        with open(file_path, 'rb') as gedcom_stream:
-            self.parse(gedcom_stream, strict)
+        if lazy:
+            self.__reset()
+            self.__lazy_records = LazyRecordList(
+                file_path,
+                lambda data, start, end, line_number: self.__load_record(data, start, end, line_number, strict,
+                                                                         collapse_multi_line),
+                cache_size
+            )
+            self.__lazy_record_dictionary = LazyRecordDictionary(self.__lazy_records)
+        elif workers is not None and workers > 1:
+            self.__parse_file_in_shards(file_path, strict, workers, collapse_multi_line)
+        elif mmap:
+            with map_file(file_path) as mapped_file:
+                self.__parse_lines(iter_raw_lines(mapped_file), strict, collapse_multi_line, tokenize_bytes_line)
+        else:
+            with open(file_path, 'rb') as gedcom_stream:
+                self.__parse_lines(read_lines(gedcom_stream), strict, collapse_multi_line)
+
+        if track_changes and not lazy:
+            self.__record_source = track_records(file_path, self.get_root_child_elements())
 
-    def parse(self, gedcom_stream, strict=True):
+    def parse(self, gedcom_stream, strict=True, collapse_multi_line=False):
         """Parses a stream, or an array of lines, as GEDCOM 5.5 formatted data
-        :type gedcom_stream: a file stream, or str array of lines with new line at the end
+
+        Lines may be given as `bytes`, which get decoded as UTF-8, or as already decoded `str`.
+        See `gedcom.parser.Parser.parse_file()` for `collapse_multi_line`.
+
+        :type gedcom_stream: a file stream, or bytes or str array of lines with new line at the end
+        :type strict: bool
+        :type collapse_multi_line: bool
+        """
+        self.__parse_lines(decode_lines(gedcom_stream), strict, collapse_multi_line)
+
+    def __parse_lines(self, lines, strict, collapse_multi_line=False, tokenize=tokenize_line):
+        """Parses lines into the tree of this parser
+        :type lines: collections.abc.Iterable[str]
         :type strict: bool
+        :type collapse_multi_line: bool
+        :type tokenize: collections.abc.Callable
         """
+        self.__reset()
+
+        tokens = self.__pool_values(iter_tokens(lines, strict, tokenize))
+        self.__add_elements(self.get_root_element(), tokens, collapse_multi_line)
+
+    def __load_record(self, data, start, end, line_number, strict, collapse_multi_line=False):
+        """Parses the logical record between two offsets of memory-mapped data, for lazy mode
+        :type data: mmap.mmap
+        :type start: int
+        :type end: int
+        :type line_number: int
+        :type strict: bool
+        :type collapse_multi_line: bool
+        :rtype: Element
+        """
+        root_element = RootElement()
+
+        tokens = iter_tokens(iter_raw_lines(data, start, end), strict, tokenize_bytes_line, line_number)
+        self.__add_elements(root_element, self.__pool_values(tokens), collapse_multi_line)
+
+        record = root_element.get_child_elements()[0]
+        record.set_parent_element(self.__root_element)
+        return record
+
+    def __pool_values(self, tokens):
+        """Replaces the values of tokens by the ones of the value pool of this parser, if there is one
+        :type tokens: collections.abc.Iterable[tuple]
+        :rtype: collections.abc.Iterable[tuple]
+        """
+        if self.__value_pool is None:
+            return tokens
+        return self.__value_pool.intern_tokens(tokens)
+
+    def __reset(self):
+        """Removes all records from this parser before parsing new data"""
         self.invalidate_cache()
         self.__root_element = RootElement()
+        self.__close_lazy_records()
+        self.__record_source = None
 
-        line_number = 1
-        last_element = self.get_root_element()
+    def __close_lazy_records(self):
+        if self.__lazy_records is not None:
+            self.__lazy_records.close()
+            self.__lazy_records = None
+            self.__lazy_record_dictionary = None
+            # The indexes refer to the records and the dictionary of lazy mode
+            self.invalidate_cache()
 
-        for line in gedcom_stream:
-            last_element = self.__parse_line(line_number, line.decode('utf-8-sig'), last_element, strict)
-            line_number += 1
+    def __parse_file_in_shards(self, file_path, strict, workers, collapse_multi_line=False):
+        """Parses ranges of logical records of a file in a pool of processes into the tree of this parser
 
-    # Private methods
+        The processes only tokenize and validate the lines, as transferring elements between processes costs
+        more than creating them.
 
-    @staticmethod
-    def __parse_line(line_number, line, last_element, strict=True):
-        """Parse a line from a GEDCOM 5.5 formatted document
+        :type file_path: str
+        :type strict: bool
+        :type workers: int
+        :type collapse_multi_line: bool
+        """
+        self.__reset()
 
-        Each line should have the following (bracketed items optional):
-        level + ' ' + [pointer + ' ' +] tag + [' ' + line_value]
+        with map_file(file_path) as mapped_file:
+            offsets = find_shard_offsets(mapped_file, workers)
+            line_numbers = [1]
+            for start, end in zip(offsets[:-2], offsets[1:-1]):
+                line_numbers.append(line_numbers[-1] + count_lines(mapped_file, start, end))
 
-        :type line_number: int
-        :type line: str
-        :type last_element: Element
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            shards = [executor.submit(_tokenize_file_shard, file_path, start, end, line_number, strict)
+                      for start, end, line_number in zip(offsets[:-1], offsets[1:], line_numbers)]
+
+            tokens = (token for shard in shards for token in zip(*shard.result()))
+            self.__add_elements(self.get_root_element(), self.__pool_values(tokens), collapse_multi_line)
+
+    def iter_records_from_file(self, file_path, strict=True, mmap=False):
+        """Opens a file, from the given file path, and yields its logical records one at a time
+
+        See `gedcom.parser.Parser.iter_records()` and, for `mmap`, `gedcom.parser.Parser.parse_file()`.
+
+        :type file_path: str
         :type strict: bool
+        :type mmap: bool
+        :rtype: collections.abc.Iterator[Element]
+        """
+        if mmap:
+            with map_file(file_path) as mapped_file:
+                for record in self.__iter_records(iter_raw_lines(mapped_file), strict, tokenize_bytes_line):
+                    yield record
+        else:
+            with open(file_path, 'rb') as gedcom_stream:
+                for record in self.__iter_records(read_lines(gedcom_stream), strict):
+                    yield record
 
-        :rtype: Element
+    def iter_records(self, gedcom_stream, strict=True):
+        """Parses a stream, or an array of lines, as GEDCOM 5.5 formatted data and yields its logical records one at a time
+
+        Each record is a complete level 0 element (e.g. an `IndividualElement` or `FamilyElement`) including
+        all of its sub-elements. A record is yielded as soon as the next record starts and isn't kept by the parser,
+        so memory usage doesn't grow with the size of the data. The tree of this parser isn't modified.
+
+        :type gedcom_stream: a file stream, or bytes or str array of lines with new line at the end
+        :type strict: bool
+        :rtype: collections.abc.Iterator[Element]
         """
+        return self.__iter_records(decode_lines(gedcom_stream), strict)
 
-        # Level must start with non-negative int, no leading zeros.
-        level_regex = '^(0|[1-9]+[0-9]*) '
+    def __iter_records(self, lines, strict, tokenize=tokenize_line):
+        """Parses lines and yields their logical records one at a time
+        :type lines: collections.abc.Iterable[str]
+        :type strict: bool
+        :type tokenize: collections.abc.Callable
+        :rtype: collections.abc.Iterator[Element]
+        """
+        root_element = RootElement()
+        records = root_element.get_child_elements()
 
-        # Pointer optional, if it exists it must be flanked by `@`
-        pointer_regex = '(@[^@]+@ |)'
+        last_element = root_element
 
-        # Tag must be an alphanumeric string
-        tag_regex = '([A-Za-z0-9_]+)'
+        for level, pointer, tag, value, crlf in self.__pool_values(iter_tokens(lines, strict, tokenize)):
+            last_element = self.__add_element(last_element, level, pointer, tag, value, crlf)
 
-        # Value optional, consists of anything after a space to end of line
-        value_regex = '( [^\n\r]*|)'
+            # A new record started, so the previous one is complete.
+            if len(records) > 1:
+                yield records.pop(0)
 
-        # End of line defined by `\n` or `\r`
-        end_of_line_regex = '([\r\n]{1,2})'
+        while records:
+            yield records.pop(0)
 
-        # Complete regex
-        gedcom_line_regex = level_regex + pointer_regex + tag_regex + value_regex + end_of_line_regex
-        regex_match = regex.match(gedcom_line_regex, line)
+    def parse_file_events(self, file_path, handler, strict=True, mmap=False):
+        """Opens a file, from the given file path, and reports its lines to a handler
 
-        if regex_match is None:
-            if strict:
-                error_message = ("Line <%d:%s> of document violates GEDCOM format 5.5" % (line_number, line)
-                                 + "\nSee: https://chronoplexsoftware.com/gedcomvalidator/gedcom/gedcom-5.5.pdf")
-                raise GedcomFormatViolationError(error_message)
-            else:
-                # Quirk check - see if this is a line without a CRLF (which could be the last line)
-                last_line_regex = level_regex + pointer_regex + tag_regex + value_regex
-                regex_match = regex.match(last_line_regex, line)
-                if regex_match is not None:
-                    line_parts = regex_match.groups()
-
-                    level = int(line_parts[0])
-                    pointer = line_parts[1].rstrip(' ')
-                    tag = line_parts[2]
-                    value = line_parts[3].strip()
-                    crlf = '\n'
-                else:
-                    # Quirk check - Sometimes a gedcom has a text field with a CR.
-                    # This creates a line without the standard level and pointer.
-                    # If this is detected then turn it into a CONC or CONT.
-                    line_regex = '([^\n\r]*|)'
-                    cont_line_regex = line_regex + end_of_line_regex
-                    regex_match = regex.match(cont_line_regex, line)
-                    line_parts = regex_match.groups()
-                    level = last_element.get_level()
-                    tag = last_element.get_tag()
-                    pointer = None
-                    value = line_parts[0].strip()
-                    crlf = line_parts[1]
-                    if tag != python_gedcom_2.tags.GEDCOM_TAG_CONTINUED and tag != python_gedcom_2.tags.GEDCOM_TAG_CONCATENATION:
-                        # Increment level and change this line to a CONC
-                        level += 1
-                        tag = python_gedcom_2.tags.GEDCOM_TAG_CONCATENATION
+        See `gedcom.parser.Parser.parse_events()` and, for `mmap`, `gedcom.parser.Parser.parse_file()`.
+
+        :type file_path: str
+        :type handler: GedcomHandler
+        :type strict: bool
+        :type mmap: bool
+        """
+        if mmap:
+            with map_file(file_path) as mapped_file:
+                self.__parse_events(iter_raw_lines(mapped_file), handler, strict, tokenize_bytes_line)
         else:
-            line_parts = regex_match.groups()
+            with open(file_path, 'rb') as gedcom_stream:
+                self.__parse_events(read_lines(gedcom_stream), handler, strict)
+
+    def parse_events(self, gedcom_stream, handler, strict=True):
+        """Parses a stream, or an array of lines, as GEDCOM 5.5 formatted data and reports each line to a handler
+
+        No elements are created and the tree of this parser isn't modified. Lines are validated
+        in the same way as in `gedcom.parser.Parser.parse()`.
+
+        :type gedcom_stream: a file stream, or bytes or str array of lines with new line at the end
+        :type handler: GedcomHandler
+        :type strict: bool
+        """
+        self.__parse_events(decode_lines(gedcom_stream), handler, strict)
+
+    @staticmethod
+    def __parse_events(lines, handler, strict, tokenize=tokenize_line):
+        """Reports lines to a handler
+        :type lines: collections.abc.Iterable[str]
+        :type handler: GedcomHandler
+        :type strict: bool
+        :type tokenize: collections.abc.Callable
+        """
+        start_element = handler.start_element
+        end_element = handler.end_element
+
+        # Elements whose end has not been reported yet, as tuples of (level, pointer, tag)
+        open_elements = []
+
+        for level, pointer, tag, value, crlf in iter_tokens(lines, strict, tokenize):
+            while open_elements and open_elements[-1][0] >= level:
+                end_element(*open_elements.pop())
 
-            level = int(line_parts[0])
-            pointer = line_parts[1].rstrip(' ')
-            tag = line_parts[2]
-            value = line_parts[3].strip()
-            crlf = line_parts[4]
+            start_element(level, pointer, tag, value)
+            open_elements.append((level, pointer, tag))
 
-        # Check level: should never be more than one higher than previous line.
-        if level > last_element.get_level() + 1:
-            error_message = ("Line %d of document violates GEDCOM format 5.5" % line_number
-                             + "\nLines must be no more than one level higher than previous line."
-                             + "\nSee: https://chronoplexsoftware.com/gedcomvalidator/gedcom/gedcom-5.5.pdf")
-            raise GedcomFormatViolationError(error_message)
+        while open_elements:
+            end_element(*open_elements.pop())
 
+    # Private methods
+
+    @staticmethod
+    def __add_elements(last_element, tokens, collapse_multi_line=False):
+        """Creates the elements of tokenized lines and adds them to the tree, see `__add_element()`
+
+        With `collapse_multi_line` the values of concatenation and continuation lines are joined into the
+        value of the element they belong to, which gets collapsed (see `gedcom.element.element.Element.is_collapsed()`),
+        instead of creating elements for them. As in `gedcom.element.element.Element.get_multi_line_value()`,
+        a continuation is joined with the line break of the preceding line.
+
+        :type last_element: Element
+        :type tokens: collections.abc.Iterable[tuple]
+        :type collapse_multi_line: bool
+        :rtype: Element
+        """
+        add_element = Parser.__add_element
+
+        if not collapse_multi_line:
+            for level, pointer, tag, value, crlf in tokens:
+                last_element = add_element(last_element, level, pointer, tag, value, crlf)
+            return last_element
+
+        concatenation_tag = python_gedcom_2.tags.GEDCOM_TAG_CONCATENATION
+        continued_tag = python_gedcom_2.tags.GEDCOM_TAG_CONTINUED
+
+        # Values of the lines joined into the last element and the line break of the last of them
+        parts = None
+        last_crlf = None
+
+        for level, pointer, tag, value, crlf in tokens:
+            if (tag == concatenation_tag or tag == continued_tag) and level == last_element.get_level() + 1:
+                if parts is None:
+                    parts = [last_element.get_value()]
+                    last_crlf = last_element.get_crlf()
+                if tag == continued_tag:
+                    parts.append(last_crlf)
+                parts.append(value)
+                last_crlf = crlf
+                continue
+
+            if parts is not None:
+                last_element.set_multi_line_value(''.join(parts), collapse=True)
+                parts = None
+            last_element = add_element(last_element, level, pointer, tag, value, crlf)
+
+        if parts is not None:
+            last_element.set_multi_line_value(''.join(parts), collapse=True)
+        return last_element
+
+    @staticmethod
+    def __add_element(last_element, level, pointer, tag, value, crlf):
+        """Creates the element of a tokenized line from a GEDCOM 5.5 formatted document and adds it to the tree
+
+        Each line should have the following (bracketed items optional):
+        level + ' ' + [pointer + ' ' +] tag + [' ' + line_value]
+
+        :type last_element: Element
+        :type level: int
+        :type pointer: str
+        :type tag: str
+        :type value: str
+        :type crlf: str
+
+        :rtype: Element
+        """
         element = ElementCreator.create_element(level, pointer, tag, value, crlf, is_multiline=False)
 
         # Start with last element as parent, back up if necessary.
@@ -339,6 +647,84 @@ class Parser(object):
                 return True
         return False
 
+    def individuals_born_between(self, from_year, to_year):
+        """Returns the individuals born from `from_year` to `to_year`, including both, ordered by birth year
+
+        Like `gedcom.element.individual.IndividualElement.birth_range_match()`, but answered by bisecting a
+        sorted index of all birth years, see `gedcom.parser.Parser.get_year_index()`.
+
+        :type from_year: int
+        :type to_year: int
+        :rtype: list of IndividualElement
+        """
+        return self.get_year_index(YEAR_INDEX_BIRTH).get_between(from_year, to_year)
+
+    def individuals_died_between(self, from_year, to_year):
+        """Returns the individuals who died from `from_year` to `to_year`, including both, ordered by death year
+
+        Like `gedcom.element.individual.IndividualElement.death_range_match()`, but answered by bisecting a
+        sorted index of all death years, see `gedcom.parser.Parser.get_year_index()`.
+
+        :type from_year: int
+        :type to_year: int
+        :rtype: list of IndividualElement
+        """
+        return self.get_year_index(YEAR_INDEX_DEATH).get_between(from_year, to_year)
+
+    def individuals_married_between(self, from_year, to_year):
+        """Returns the individuals married from `from_year` to `to_year`, including both, ordered by marriage year
+
+        Like `gedcom.parser.Parser.marriage_range_match()`, but answered by bisecting a sorted index of all
+        marriage years, see `gedcom.parser.Parser.get_year_index()`.
+
+        :type from_year: int
+        :type to_year: int
+        :rtype: list of IndividualElement
+        """
+        return self.get_year_index(YEAR_INDEX_MARRIAGE).get_between(from_year, to_year)
+
+    def get_year_index(self, year_index_type):
+        """Returns the sorted index of birth, death or marriage years of all individuals
+
+        `year_index_type` is one of `gedcom.year_index.YEAR_INDEX_BIRTH`, `gedcom.year_index.YEAR_INDEX_DEATH`
+        and `gedcom.year_index.YEAR_INDEX_MARRIAGE`. All three indexes get built in one pass over all records on
+        first use, if the data was modified call `gedcom.parser.Parser.invalidate_cache()`.
+
+        :type year_index_type: str
+        :rtype: YearIndex
+        """
+        if self.__year_indexes is None:
+            self.__year_indexes = build_year_indexes(self.get_root_child_elements(), self.get_element_dictionary())
+        return self.__year_indexes[year_index_type]
+
+    def find_individuals(self, criteria):
+        """Returns all individuals matching the criteria, in the order of the file
+
+        See `gedcom.element.individual.IndividualElement.criteria_match()` for the criteria and
+        `gedcom.parser.Parser.prepare_query()` for how they get evaluated.
+
+        :type criteria: str
+        :rtype: list of IndividualElement
+        """
+        return self.prepare_query(criteria).execute()
+
+    def prepare_query(self, criteria):
+        """Compiles criteria into a query over all individuals, without executing it yet
+
+        The query looks up the candidates of its most selective criterion in an index of all individuals by
+        name, surname, birth year and death year, and only matches those against the other criteria.
+        `gedcom.query.PreparedQuery.explain()` describes the chosen plan. The index gets built on first use,
+        if the data was modified call `gedcom.parser.Parser.invalidate_cache()`.
+
+        :type criteria: str
+        :rtype: PreparedQuery
+        """
+        if self.__individual_index is None:
+            self.__individual_index = IndividualIndex([
+                element for element in self.get_root_child_elements() if isinstance(element, IndividualElement)
+            ])
+        return PreparedQuery(compile_criteria(criteria), self.__individual_index)
+
     def get_families(self, individual, family_type=python_gedcom_2.tags.GEDCOM_TAG_FAMILY_SPOUSE):
         """Return family elements listed for an individual
 
@@ -355,25 +741,33 @@ class Parser(object):
                 "Operation only valid for elements with %s tag" % python_gedcom_2.tags.GEDCOM_TAG_INDIVIDUAL
             )
 
+        if family_type in INDEXED_FAMILY_TYPES:
+            return self.__get_relationship_index().get_families(individual, family_type)
+
         families = []
         element_dictionary = self.get_element_dictionary()
 
-        for child_element in individual.get_child_elements():
-            is_family = (child_element.get_tag() == family_type
-                         and child_element.get_value() in element_dictionary)
-            if is_family:
+        for child_element in individual.get_child_elements_by_tag(family_type):
+            if child_element.get_value() in element_dictionary:
                 families.append(element_dictionary[child_element.get_value()])
 
         return families
 
-    def get_ancestors(self, individual, ancestor_type="ALL"):
+    def get_ancestors(self, individual, ancestor_type="ALL", max_generations=None):
         """Return elements corresponding to ancestors of an individual
 
         Optional `ancestor_type`. Default "ALL" returns all ancestors, "NAT" can be
         used to specify only natural (genetic) ancestors.
 
+        Each ancestor is returned once, even if it is an ancestor through several lines (pedigree collapse).
+        Ancestors are ordered by generation, starting with the parents. Optional `max_generations` limits
+        the number of generations, e.g. 2 returns parents and grandparents only.
+
+        Raises a `PedigreeCycleError` if an ancestor turns out to be its own ancestor.
+
         :type individual: IndividualElement
         :type ancestor_type: str
+        :type max_generations: int
         :rtype: list of Element
         """
         if not isinstance(individual, IndividualElement):
@@ -381,14 +775,106 @@ class Parser(object):
                 "Operation only valid for elements with %s tag" % python_gedcom_2.tags.GEDCOM_TAG_INDIVIDUAL
             )
 
-        parents = self.get_parents(individual, ancestor_type)
+        ancestors, parents_by_pointer = self.__collect_ancestors(individual, ancestor_type, max_generations)
+        return ancestors
+
+    def get_ancestor_generations(self, individual, ancestor_type="ALL", max_generations=None):
+        """Return ancestors of an individual together with all generations they belong to
+
+        Returns a list of tuples (`IndividualElement` ancestor, `list` of `int` generations) in the same order as
+        `gedcom.parser.Parser.get_ancestors()`. Parents are generation 1, grandparents generation 2 and so on.
+        An ancestor through several lines of different length (pedigree collapse) has several generations.
+
+        Raises a `PedigreeCycleError` if an ancestor turns out to be its own ancestor.
+
+        :type individual: IndividualElement
+        :type ancestor_type: str
+        :type max_generations: int
+        :rtype: list of tuple
+        """
+        if not isinstance(individual, IndividualElement):
+            raise NotAnActualIndividualError(
+                "Operation only valid for elements with %s tag" % python_gedcom_2.tags.GEDCOM_TAG_INDIVIDUAL
+            )
+
+        ancestors, parents_by_pointer = self.__collect_ancestors(individual, ancestor_type, max_generations)
+        generations = {ancestor.get_pointer(): [] for ancestor in ancestors}
+
+        # As there are no cycles, every line of ancestors ends. Each generation holds every ancestor once.
+        generation = 0
+        pointers = [individual.get_pointer()]
+        while pointers and (max_generations is None or generation < max_generations):
+            generation += 1
+            next_pointers = {}
+            for pointer in pointers:
+                for parent in parents_by_pointer.get(pointer, ()):
+                    next_pointers[parent.get_pointer()] = True
+
+            pointers = list(next_pointers)
+            for pointer in pointers:
+                generations[pointer].append(generation)
+
+        return [(ancestor, generations[ancestor.get_pointer()]) for ancestor in ancestors]
+
+    def __collect_ancestors(self, individual, ancestor_type, max_generations):
+        """Collects the distinct ancestors of an individual generation by generation and checks them for cycles
+
+        Returns the ancestors and a dictionary of the parents of each individual whose parents were looked up,
+        identified by its pointer.
+
+        :type individual: IndividualElement
+        :type ancestor_type: str
+        :type max_generations: int
+        :rtype: tuple
+        """
         ancestors = []
-        ancestors.extend(parents)
+        parents_by_pointer = {}
+        visited_pointers = {individual.get_pointer()}
+
+        generation = 0
+        individuals = [individual]
+        while individuals and (max_generations is None or generation < max_generations):
+            generation += 1
+            parents_of_generation = []
+            for child in individuals:
+                parents = self.get_parents(child, ancestor_type)
+                parents_by_pointer[child.get_pointer()] = parents
+
+                for parent in parents:
+                    if parent.get_pointer() not in visited_pointers:
+                        visited_pointers.add(parent.get_pointer())
+                        ancestors.append(parent)
+                        parents_of_generation.append(parent)
+            individuals = parents_of_generation
+
+        self.__check_for_pedigree_cycle(individual.get_pointer(), parents_by_pointer)
+        return ancestors, parents_by_pointer
 
-        for parent in parents:
-            ancestors.extend(self.get_ancestors(parent, ancestor_type))
+    @staticmethod
+    def __check_for_pedigree_cycle(pointer, parents_by_pointer):
+        """Raises a `PedigreeCycleError` if any of the ancestors reachable from a pointer is its own ancestor
 
-        return ancestors
+        Uses an iterative depth-first search, where an ancestor is `True` while its own ancestors are searched.
+
+        :type pointer: str
+        :type parents_by_pointer: dict[str, list of IndividualElement]
+        """
+        in_search = {pointer: True}
+        path = [(pointer, iter(parents_by_pointer.get(pointer, ())))]
+
+        while path:
+            for parent in path[-1][1]:
+                parent_pointer = parent.get_pointer()
+                if in_search.get(parent_pointer) is None:
+                    in_search[parent_pointer] = True
+                    path.append((parent_pointer, iter(parents_by_pointer.get(parent_pointer, ()))))
+                    break
+                if in_search[parent_pointer]:
+                    pointers = [path_pointer for path_pointer, parents in path]
+                    cycle = pointers[pointers.index(parent_pointer):] + [parent_pointer]
+                    raise PedigreeCycleError("Individual %s is its own ancestor: %s" % (parent_pointer, " -> ".join(cycle)))
+            else:
+                in_search[path.pop()[0]] = False
 
     def get_parents(self, individual, parent_type="ALL"):
         """Return elements corresponding to parents of an individual
@@ -410,17 +896,13 @@ class Parser(object):
 
         for family in families:
             if parent_type == "NAT":
-                for family_member in family.get_child_elements():
-
-                    if family_member.get_tag() == python_gedcom_2.tags.GEDCOM_TAG_CHILD \
-                       and family_member.get_value() == individual.get_pointer():
-
-                        for child in family_member.get_child_elements():
-                            if child.get_value() == "Natural":
-                                if child.get_tag() == python_gedcom_2.tags.GEDCOM_PROGRAM_DEFINED_TAG_MREL:
-                                    parents += self.get_family_members(family, python_gedcom_2.tags.GEDCOM_TAG_WIFE)
-                                elif child.get_tag() == python_gedcom_2.tags.GEDCOM_PROGRAM_DEFINED_TAG_FREL:
-                                    parents += self.get_family_members(family, python_gedcom_2.tags.GEDCOM_TAG_HUSBAND)
+                family_links = self.__get_relationship_index().get_family_links(family)
+                for child_pointer, pedigree_tag in family_links.natural_child_links:
+                    if child_pointer == individual.get_pointer():
+                        if pedigree_tag == python_gedcom_2.tags.GEDCOM_PROGRAM_DEFINED_TAG_MREL:
+                            parents += self.get_family_members(family, python_gedcom_2.tags.GEDCOM_TAG_WIFE)
+                        else:
+                            parents += self.get_family_members(family, python_gedcom_2.tags.GEDCOM_TAG_HUSBAND)
             else:
                 parents += self.get_family_members(family, "PARENTS")
 
@@ -446,49 +928,228 @@ class Parser(object):
 
         for family in families:
             if child_type == "NAT":
+                family_links = self.__get_relationship_index().get_family_links(family)
+
                 # Find our relationship to the children - is this parent male or female?
-                type_of_our_individual = None
-                for family_member in family.get_child_elements():  # Will look like "1 HUSB @I1@", "1 WIFE @I2@", or "1 CHIL @I3@"
-                    if family_member.get_value() == individual.get_pointer():
-                        if family_member.get_tag() == python_gedcom_2.tags.GEDCOM_TAG_WIFE:
-                            type_of_our_individual = python_gedcom_2.tags.GEDCOM_PROGRAM_DEFINED_TAG_MREL
-                        elif family_member.get_tag() == python_gedcom_2.tags.GEDCOM_TAG_HUSBAND:
-                            type_of_our_individual = python_gedcom_2.tags.GEDCOM_PROGRAM_DEFINED_TAG_FREL
-
-                for family_member in family.get_child_elements():  # Will look like "1 HUSB @I1@", "1 WIFE @I2@", or "1 CHIL @I3@"
-                    if family_member.get_tag() == python_gedcom_2.tags.GEDCOM_TAG_CHILD:
-                        for child in family_member.get_child_elements():
-                            if child.get_value() == "Natural":
-                                if child.get_tag() == type_of_our_individual:
-                                    children.append(self.get_element_by_pointer(family_member.get_value()))
+                type_of_our_individual = family_links.spouse_pedigree_tags.get(individual.get_pointer())
+
+                for child_pointer, pedigree_tag in family_links.natural_child_links:
+                    if pedigree_tag == type_of_our_individual:
+                        children.append(self.get_element_by_pointer(child_pointer))
             else:
                 children += self.get_family_members(family, python_gedcom_2.tags.GEDCOM_TAG_CHILD)
 
         return children
 
+    def get_descendants(self, individual, child_type="ALL", max_generations=None):
+        """Yields descendants of an individual as tuples (`IndividualElement` descendant, `int` generation)
+
+        Optional `child_type`. Default "ALL" follows all children, "NAT" can be used to follow only natural
+        (genetic) children, see `gedcom.parser.Parser.get_children()`. Optional `max_generations` limits the
+        number of generations, e.g. 2 yields children and grandchildren only.
+
+        Descendants are yielded generation by generation, children being generation 1. Each descendant is
+        yielded once, with the lowest generation it belongs to. As the descendants are looked up while
+        iterating, stopping early saves looking up the remaining ones.
+
+        :type individual: IndividualElement
+        :type child_type: str
+        :type max_generations: int
+        :rtype: collections.abc.Iterator[tuple]
+        """
+        if not isinstance(individual, IndividualElement):
+            raise NotAnActualIndividualError(
+                "Operation only valid for elements with %s tag" % python_gedcom_2.tags.GEDCOM_TAG_INDIVIDUAL
+            )
+
+        return self.__iter_descendants(individual, child_type, max_generations)
+
+    def __iter_descendants(self, individual, child_type, max_generations):
+        visited_pointers = {individual.get_pointer()}
+
+        generation = 0
+        individuals = [individual]
+        while individuals and (max_generations is None or generation < max_generations):
+            generation += 1
+            children_of_generation = []
+            for parent in individuals:
+                for child in self.get_children(parent, child_type):
+                    if child.get_pointer() not in visited_pointers:
+                        visited_pointers.add(child.get_pointer())
+                        children_of_generation.append(child)
+                        yield child, generation
+            individuals = children_of_generation
+
     def find_path_to_ancestor(self, descendant, ancestor, path=None):
         """Return path from descendant to ancestor
-        :rtype: object
+
+        The path is the shortest list of individuals from `descendant` to `ancestor`, each being a natural parent
+        of the one before, or `None` if `ancestor` isn't a natural ancestor of `descendant`. It is searched
+        from both ends at once, following the families in which an individual is a child towards the ancestor and
+        the ones in which an individual is a spouse towards the descendant. If a `path` ending with `descendant`
+        is given, the returned path continues it.
+
+        :type descendant: IndividualElement
+        :type ancestor: IndividualElement
+        :type path: list of IndividualElement
+        :rtype: list of IndividualElement
         """
         if not isinstance(descendant, IndividualElement) or not isinstance(ancestor, IndividualElement):
             raise NotAnActualIndividualError(
                 "Operation only valid for elements with %s tag." % python_gedcom_2.tags.GEDCOM_TAG_INDIVIDUAL
             )
 
-        if not path:
-            path = [descendant]
+        def get_parent_steps(individual):
+            return [(parent, RELATION_TYPE_PARENT) for parent in self.get_parents(individual, "NAT")]
 
-        if path[-1].get_pointer() == ancestor.get_pointer():
-            return path
-        else:
-            parents = self.get_parents(descendant, "NAT")
-            for parent in parents:
-                potential_path = self.find_path_to_ancestor(parent, ancestor, path + [parent])
-                if potential_path is not None:
-                    return potential_path
+        relationship_index = self.__get_relationship_index()
+
+        def get_child_steps(individual):
+            # Only children of which the individual is a natural parent, as seen from the child
+            return [(child, RELATION_TYPE_PARENT) for child in self.get_children(individual, "NAT")
+                    if individual.get_pointer() in relationship_index.get_natural_parent_pointers(child)]
+
+        steps = self.__find_shortest_path(descendant, ancestor, get_parent_steps, get_child_steps)
+        if steps is None:
+            return None
+
+        individuals = [individual for individual, relation_type in steps]
+        return path + individuals[1:] if path else individuals
+
+    def find_relationship_path(self, individual, relative):
+        """Return the shortest path of relations between two individuals
+
+        Each step of the path goes to a parent, a child, a spouse (another husband or wife of a family in which an
+        individual is a spouse) or a sibling (another child of a family in which an individual is a child).
+
+        Returns a list of tuples (`IndividualElement` individual, `str` relation type), starting with
+        (`individual`, `None`) and ending with `relative`, or `None` if they aren't related. The relation type is one
+        of `RELATION_TYPE_PARENT`, `RELATION_TYPE_CHILD`, `RELATION_TYPE_SPOUSE` or `RELATION_TYPE_SIBLING` and tells
+        what the individual of a step is to the individual of the step before, e.g. `RELATION_TYPE_PARENT` for a
+        step from a child to its father. The path is searched from both individuals at once.
+
+        :type individual: IndividualElement
+        :type relative: IndividualElement
+        :rtype: list of tuple
+        """
+        if not isinstance(individual, IndividualElement) or not isinstance(relative, IndividualElement):
+            raise NotAnActualIndividualError(
+                "Operation only valid for elements with %s tag." % python_gedcom_2.tags.GEDCOM_TAG_INDIVIDUAL
+            )
+
+        def get_inverse_steps(step_individual):
+            return [(related_individual, _INVERSE_RELATION_TYPES[relation_type])
+                    for related_individual, relation_type in self.__get_relations(step_individual)]
+
+        return self.__find_shortest_path(individual, relative, self.__get_relations, get_inverse_steps)
+
+    def __get_relations(self, individual):
+        """Returns tuples (`IndividualElement` relative, `str` relation type) of all parents, children, spouses
+        and siblings of an individual
+        :type individual: IndividualElement
+        :rtype: list of tuple
+        """
+        relations = [(parent, RELATION_TYPE_PARENT) for parent in self.get_parents(individual)]
+        relations += [(child, RELATION_TYPE_CHILD) for child in self.get_children(individual)]
+
+        for family in self.get_families(individual, python_gedcom_2.tags.GEDCOM_TAG_FAMILY_SPOUSE):
+            if isinstance(family, FamilyElement):
+                relations += [(spouse, RELATION_TYPE_SPOUSE) for spouse in self.get_family_members(family, FAMILY_MEMBERS_TYPE_PARENTS)
+                              if spouse.get_pointer() != individual.get_pointer()]
+
+        for family in self.get_families(individual, python_gedcom_2.tags.GEDCOM_TAG_FAMILY_CHILD):
+            if isinstance(family, FamilyElement):
+                relations += [(sibling, RELATION_TYPE_SIBLING) for sibling in self.get_family_members(family, FAMILY_MEMBERS_TYPE_CHILDREN)
+                              if sibling.get_pointer() != individual.get_pointer()]
+
+        return relations
+
+    @staticmethod
+    def __find_shortest_path(start, goal, get_forward_steps, get_backward_steps):
+        """Searches the shortest path between two individuals with a breadth-first search from both of them
+
+        `get_forward_steps(individual)` returns tuples (next individual, relation type of it to the individual).
+        `get_backward_steps(individual)` returns tuples (previous individual, relation type of the individual to it),
+        i.e. the steps that lead to the individual. Always the side with the smaller frontier gets expanded by a whole
+        generation. The search ends as soon as one side runs out of individuals.
+
+        Returns a list of tuples (individual, relation type) from `start` to `goal`, or `None` if there is no path.
+
+        :type start: IndividualElement
+        :type goal: IndividualElement
+        :type get_forward_steps: collections.abc.Callable
+        :type get_backward_steps: collections.abc.Callable
+        :rtype: list of tuple
+        """
+        if start.get_pointer() == goal.get_pointer():
+            return [(start, None)]
+
+        individuals = {start.get_pointer(): start, goal.get_pointer(): goal}
+
+        # Predecessor maps of the visited individuals: pointer -> (pointer of the step towards start or goal,
+        # relation type, number of steps to start or goal)
+        forward_steps = {start.get_pointer(): (None, None, 0)}
+        backward_steps = {goal.get_pointer(): (None, None, 0)}
+        forward_frontier = [start]
+        backward_frontier = [goal]
+
+        while forward_frontier and backward_frontier:
+            if len(backward_frontier) < len(forward_frontier):
+                frontier, get_steps, steps, other_steps = backward_frontier, get_backward_steps, backward_steps, forward_steps
+            else:
+                frontier, get_steps, steps, other_steps = forward_frontier, get_forward_steps, forward_steps, backward_steps
+
+            next_frontier = []
+            meeting_pointer = None
+            for individual in frontier:
+                distance = steps[individual.get_pointer()][2] + 1
+                for next_individual, relation_type in get_steps(individual):
+                    pointer = next_individual.get_pointer()
+                    if pointer in steps:
+                        continue
+
+                    steps[pointer] = (individual.get_pointer(), relation_type, distance)
+                    individuals[pointer] = next_individual
+                    next_frontier.append(next_individual)
+
+                    if pointer in other_steps and (meeting_pointer is None
+                                                   or other_steps[pointer][2] < other_steps[meeting_pointer][2]):
+                        meeting_pointer = pointer
+
+            if meeting_pointer is not None:
+                return Parser.__join_path(meeting_pointer, individuals, forward_steps, backward_steps)
+
+            if steps is forward_steps:
+                forward_frontier = next_frontier
+            else:
+                backward_frontier = next_frontier
 
         return None
 
+    @staticmethod
+    def __join_path(meeting_pointer, individuals, forward_steps, backward_steps):
+        """Joins the paths from the start and from the goal of `gedcom.parser.Parser.__find_shortest_path()`
+        :type meeting_pointer: str
+        :type individuals: dict[str, IndividualElement]
+        :type forward_steps: dict[str, tuple]
+        :type backward_steps: dict[str, tuple]
+        :rtype: list of tuple
+        """
+        path = []
+        pointer = meeting_pointer
+        while pointer is not None:
+            previous_pointer, relation_type, distance = forward_steps[pointer]
+            path.append((individuals[pointer], relation_type))
+            pointer = previous_pointer
+        path.reverse()
+
+        next_pointer, relation_type, distance = backward_steps[meeting_pointer]
+        while next_pointer is not None:
+            path.append((individuals[next_pointer], relation_type))
+            next_pointer, relation_type, distance = backward_steps[next_pointer]
+
+        return path
+
     def get_family_members(self, family, members_type=FAMILY_MEMBERS_TYPE_ALL):
         """Return array of family members: individual, spouse, and children
 
@@ -509,42 +1170,61 @@ class Parser(object):
                 "Operation only valid for element with %s tag." % python_gedcom_2.tags.GEDCOM_TAG_FAMILY
             )
 
-        family_members = []
-        element_dictionary = self.get_element_dictionary()
-
-        for child_element in family.get_child_elements():
-            # Default is ALL
-            is_family = (child_element.get_tag() == python_gedcom_2.tags.GEDCOM_TAG_HUSBAND
-                         or child_element.get_tag() == python_gedcom_2.tags.GEDCOM_TAG_WIFE
-                         or child_element.get_tag() == python_gedcom_2.tags.GEDCOM_TAG_CHILD)
-
-            if members_type == FAMILY_MEMBERS_TYPE_PARENTS:
-                is_family = (child_element.get_tag() == python_gedcom_2.tags.GEDCOM_TAG_HUSBAND
-                             or child_element.get_tag() == python_gedcom_2.tags.GEDCOM_TAG_WIFE)
-            elif members_type == FAMILY_MEMBERS_TYPE_HUSBAND:
-                is_family = child_element.get_tag() == python_gedcom_2.tags.GEDCOM_TAG_HUSBAND
-            elif members_type == FAMILY_MEMBERS_TYPE_WIFE:
-                is_family = child_element.get_tag() == python_gedcom_2.tags.GEDCOM_TAG_WIFE
-            elif members_type == FAMILY_MEMBERS_TYPE_CHILDREN:
-                is_family = child_element.get_tag() == python_gedcom_2.tags.GEDCOM_TAG_CHILD
+        # Default is ALL
+        member_tags = _FAMILY_MEMBER_TAGS_BY_TYPE.get(members_type, _FAMILY_MEMBER_TAGS_BY_TYPE[FAMILY_MEMBERS_TYPE_ALL])
 
-            if is_family and child_element.get_value() in element_dictionary:
-                family_members.append(element_dictionary[child_element.get_value()])
+        return self.__get_relationship_index().get_family_members(family, member_tags)
 
-        return family_members
+    def __get_relationship_index(self):
+        """Returns the index of links between individuals and families, creating it if necessary
+        :rtype: RelationshipIndex
+        """
+        if self.__relationship_index is None:
+            self.__relationship_index = RelationshipIndex(self.get_element_dictionary())
+        return self.__relationship_index
 
     # Other methods
 
-    def print_gedcom(self):
-        """Write GEDCOM data to stdout"""
+    def print_gedcom(self, line_terminator=None):
+        """Write GEDCOM data to stdout
+        :type line_terminator: str | None
+        """
         from sys import stdout
-        self.save_gedcom(stdout)
+        self.save_gedcom(stdout, line_terminator=line_terminator)
 
-    def save_gedcom(self, open_file):
+    def save_gedcom(self, open_file, encoding=DEFAULT_WRITE_ENCODING, line_terminator=None):
         """Save GEDCOM data to a file
+
+        The lines are streamed to the file in large buffers, see `gedcom.writer.write_elements()`. A binary file
+        stream is written with `encoding`. Each line ends with the line break it was parsed with, unless
+        a `line_terminator` like `\\r\\n` is given.
+
+        If the data was parsed with `track_changes` (see `gedcom.parser.Parser.parse_file()`), records which
+        weren't changed get copied from the parsed file, see `gedcom.writer.write_records()`.
+
         :type open_file: file
+        :type encoding: str
+        :type line_terminator: str | None
         """
-        if version_info[0] >= 3:
-            open_file.write(self.get_root_element().to_gedcom_string(True))
+        if self.__record_source is not None:
+            write_records(self.get_root_child_elements(), open_file, self.__record_source, encoding, line_terminator)
         else:
-            open_file.write(self.get_root_element().to_gedcom_string(True).encode('utf-8-sig'))
+            write_elements(self.get_root_element(), open_file, encoding, line_terminator)
+
+
+def _tokenize_file_shard(file_path, start, end, line_number, strict):
+    """Tokenizes the logical records between two offsets of a file, in a worker process of `gedcom.parser.Parser.parse_file()`
+
+    Returns the levels, pointers, tags, values and line breaks of all lines as separate lists, which are cheaper
+    to transfer than a list of tuples.
+
+    :type file_path: str
+    :type start: int
+    :type end: int
+    :type line_number: int
+    :type strict: bool
+    :rtype: tuple of list
+    """
+    with map_file(file_path) as mapped_file:
+        tokens = list(iter_tokens(iter_raw_lines(mapped_file, start, end), strict, tokenize_bytes_line, line_number))
+    return tuple(list(column) for column in zip(*tokens)) if tokens else ([], [], [], [], [])
@@ -0,0 +1,277 @@
+"""
+Module containing the compiled form of the criteria of `gedcom.element.individual.IndividualElement.criteria_match()`
+and the index of individuals that `gedcom.parser.Parser.find_individuals()` evaluates it with.
+"""
+
+from functools import lru_cache
+import re as regex
+
+FIELD_GIVEN_NAME = "given name"
+FIELD_SURNAME = "surname"
+FIELD_BIRTH_YEAR = "birth year"
+FIELD_DEATH_YEAR = "death year"
+
+_NAME_FIELDS_BY_KEY = {
+    "surname": FIELD_SURNAME,
+    "name": FIELD_GIVEN_NAME,
+}
+
+_YEAR_FIELDS_BY_KEY = {
+    "birth": FIELD_BIRTH_YEAR,
+    "birth_range": FIELD_BIRTH_YEAR,
+    "death": FIELD_DEATH_YEAR,
+    "death_range": FIELD_DEATH_YEAR,
+}
+
+
+class Criterion(object):
+    """A single `key=value` item of the criteria, with its regular expression or years parsed
+
+    `field` is the value of an individual the criterion tests, one of the `FIELD_` constants, or `None` for
+    a criterion which never matches because its years aren't numeric.
+    """
+
+    __slots__ = ('key', 'value', 'field', 'pattern', 'from_year', 'to_year')
+
+    def __init__(self, key, value):
+        """
+        :type key: str
+        :type value: str
+        """
+        self.key = key
+        self.value = value
+        self.field = None
+        self.pattern = None
+        self.from_year = None
+        self.to_year = None
+
+        if key in _NAME_FIELDS_BY_KEY:
+            self.field = _NAME_FIELDS_BY_KEY[key]
+            self.pattern = regex.compile(value, regex.IGNORECASE)
+            return
+
+        try:
+            if key.endswith("_range"):
+                from_year, to_year = value.split('-')
+                self.from_year = int(from_year)
+                self.to_year = int(to_year)
+            else:
+                self.from_year = self.to_year = int(value)
+        except ValueError:
+            return
+        self.field = _YEAR_FIELDS_BY_KEY[key]
+
+    def matches(self, value):
+        """Checks if the value of the field of an individual matches this criterion
+        :type value: str | int
+        :rtype: bool
+        """
+        if self.field is None:
+            return False
+        if self.pattern is not None:
+            return self.pattern.search(value) is not None
+        return self.from_year <= value <= self.to_year
+
+    def describe(self):
+        """Returns a human readable description of this criterion
+        :rtype: str
+        """
+        if self.field is None:
+            return "%s=%s never matches" % (self.key, self.value)
+        if self.pattern is not None:
+            return "%s matches %r" % (self.field, self.value)
+        if self.from_year == self.to_year:
+            return "%s = %d" % (self.field, self.from_year)
+        return "%s between %d and %d" % (self.field, self.from_year, self.to_year)
+
+
+class CompiledQuery(object):
+    """Criteria as described by `gedcom.element.individual.IndividualElement.criteria_match()`, parsed once
+
+    Regular expressions and years are parsed on compilation. Matching an individual reads each of its names
+    and years at most once and stops at the first criterion that doesn't match. Unknown keys are ignored.
+    """
+
+    def __init__(self, criteria):
+        """
+        :type criteria: str
+        """
+        self.__criteria = criteria
+        self.__criterion_list = []
+
+        # Criteria without a `=` never match.
+        self.__is_valid = all("=" in criterion for criterion in criteria.split(':'))
+        if not self.__is_valid:
+            return
+
+        for criterion in criteria.split(':'):
+            key, value = criterion.split('=')
+            if key in _NAME_FIELDS_BY_KEY or key in _YEAR_FIELDS_BY_KEY:
+                self.__criterion_list.append(Criterion(key, value))
+
+    def get_criteria(self):
+        """Returns the criteria this query was compiled from
+        :rtype: str
+        """
+        return self.__criteria
+
+    def get_criterion_list(self):
+        """Returns the known criteria, empty if the criteria are invalid
+        :rtype: list of Criterion
+        """
+        return self.__criterion_list
+
+    def is_valid(self):
+        """Checks if each criterion has the form `key=value`, otherwise no individual matches
+        :rtype: bool
+        """
+        return self.__is_valid
+
+    def match(self, individual):
+        """Checks if an individual matches all criteria
+        :type individual: IndividualElement
+        :rtype: bool
+        """
+        return self.__is_valid and match_criteria(individual, self.__criterion_list)
+
+
+@lru_cache(maxsize=256)
+def compile_criteria(criteria):
+    """Returns the compiled query of criteria, which is kept for the most recently used criteria
+    :type criteria: str
+    :rtype: CompiledQuery
+    """
+    return CompiledQuery(criteria)
+
+
+def match_criteria(individual, criterion_list):
+    """Checks if an individual matches all of the given criteria
+    :type individual: IndividualElement
+    :type criterion_list: list of Criterion
+    :rtype: bool
+    """
+    values = {}
+    for criterion in criterion_list:
+        if criterion.field is None:
+            return False
+        if criterion.field not in values:
+            values.update(get_field_values(individual, criterion.field))
+        if not criterion.matches(values[criterion.field]):
+            return False
+    return True
+
+
+def get_field_values(individual, field):
+    """Returns the value of a field of an individual, together with the values that are read along with it
+    :type individual: IndividualElement
+    :type field: str
+    :rtype: dict[str, str | int]
+    """
+    if field == FIELD_GIVEN_NAME or field == FIELD_SURNAME:
+        given_name, surname = individual.get_name()
+        return {FIELD_GIVEN_NAME: given_name, FIELD_SURNAME: surname}
+    if field == FIELD_BIRTH_YEAR:
+        return {FIELD_BIRTH_YEAR: individual.get_birth_year()}
+    return {FIELD_DEATH_YEAR: individual.get_death_year()}
+
+
+class IndividualIndex(object):
+    """Index of individuals by their given name, surname, birth year and death year, built in one pass
+
+    Each index maps the distinct values of a field to the individuals having them, in the order of the individuals.
+    """
+
+    def __init__(self, individuals):
+        """
+        :type individuals: list of IndividualElement
+        """
+        self.__individuals = individuals
+        self.__positions = {}
+        self.__indexes = {FIELD_GIVEN_NAME: {}, FIELD_SURNAME: {}, FIELD_BIRTH_YEAR: {}, FIELD_DEATH_YEAR: {}}
+
+        for position, individual in enumerate(individuals):
+            self.__positions[id(individual)] = position
+            values = get_field_values(individual, FIELD_GIVEN_NAME)
+            values.update(get_field_values(individual, FIELD_BIRTH_YEAR))
+            values.update(get_field_values(individual, FIELD_DEATH_YEAR))
+            for field, value in values.items():
+                self.__indexes[field].setdefault(value, []).append(individual)
+
+    def get_individuals(self):
+        """Returns all individuals of this index
+        :rtype: list of IndividualElement
+        """
+        return self.__individuals
+
+    def find(self, criterion):
+        """Returns the individuals matching a criterion, in the order of the individuals
+        :type criterion: Criterion
+        :rtype: list of IndividualElement
+        """
+        if criterion.field is None:
+            return []
+
+        index = self.__indexes[criterion.field]
+        if criterion.pattern is None and criterion.from_year == criterion.to_year:
+            return list(index.get(criterion.from_year, []))
+
+        # Each distinct value is tested once instead of once per individual.
+        lists = [individuals for value, individuals in index.items() if criterion.matches(value)]
+        if len(lists) == 1:
+            return list(lists[0])
+        return sorted((individual for individuals in lists for individual in individuals),
+                      key=lambda individual: self.__positions[id(individual)])
+
+
+class PreparedQuery(object):
+    """A compiled query together with the plan to evaluate it with an `gedcom.query.IndividualIndex`
+
+    The criterion matching the fewest individuals in the index selects the candidates, which are then
+    matched against the other criteria.
+    """
+
+    def __init__(self, compiled_query, index):
+        """
+        :type compiled_query: CompiledQuery
+        :type index: IndividualIndex
+        """
+        self.__compiled_query = compiled_query
+        self.__index = index
+        self.__driving_criterion = None
+        self.__filter_criteria = []
+        self.__candidates = []
+
+        if not compiled_query.is_valid():
+            return
+
+        criterion_list = compiled_query.get_criterion_list()
+        if not criterion_list:
+            self.__candidates = index.get_individuals()
+            return
+
+        candidates_by_criterion = [(index.find(criterion), criterion) for criterion in criterion_list]
+        self.__candidates, self.__driving_criterion = min(candidates_by_criterion, key=lambda item: len(item[0]))
+        self.__filter_criteria = [criterion for criterion in criterion_list if criterion is not self.__driving_criterion]
+
+    def execute(self):
+        """Returns the individuals matching the query, in the order of the individuals
+        :rtype: list of IndividualElement
+        """
+        if not self.__filter_criteria:
+            return list(self.__candidates)
+        return [individual for individual in self.__candidates if match_criteria(individual, self.__filter_criteria)]
+
+    def explain(self):
+        """Returns a human readable description of the plan of this query
+        :rtype: str
+        """
+        if not self.__compiled_query.is_valid():
+            return "Criteria %r are invalid, no individual matches" % self.__compiled_query.get_criteria()
+
+        if self.__driving_criterion is None:
+            lines = ["Scan all %d individuals" % len(self.__candidates)]
+        else:
+            lines = ["Index lookup of %s: %d candidates" % (self.__driving_criterion.describe(), len(self.__candidates))]
+        for criterion in self.__filter_criteria:
+            lines.append("Filter on %s" % criterion.describe())
+        return "\n".join(lines)
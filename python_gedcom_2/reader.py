@@ -0,0 +1,202 @@
+"""
+Module containing helpers used by `gedcom.parser.Parser` to turn GEDCOM data into decoded lines.
+"""
+
+import codecs
+import contextlib
+import mmap
+import os
+import re as regex
+
+DEFAULT_ENCODING = 'utf-8-sig'
+"""Encoding of GEDCOM files. A byte order mark at the start of the data is skipped."""
+
+DEFAULT_BUFFER_SIZE = 1024 * 1024
+"""Number of bytes read and decoded at once by `gedcom.reader.read_lines()`"""
+
+# Start of a line that the tokenizer reads as level 0 line, also when not in strict mode
+RECORD_START_REGEX = regex.compile(b'0 (?:@[^@\n]+@ )?[A-Za-z0-9_]')
+
+
+def read_lines(binary_stream, encoding=DEFAULT_ENCODING, buffer_size=DEFAULT_BUFFER_SIZE):
+    """Reads a binary stream in large buffers and yields its decoded lines, including their line breaks
+
+    Lines are split at `\\n` only, like iterating over a binary file does, so that a `\\r\\n` stays
+    together and a lone `\\r` is kept within the line. The byte order mark is handled once by the decoder.
+
+    :type binary_stream: a binary file stream
+    :type encoding: str
+    :type buffer_size: int
+    :rtype: collections.abc.Iterator[str]
+    """
+    decoder = codecs.getincrementaldecoder(encoding)()
+    pending = ''
+
+    while True:
+        chunk = binary_stream.read(buffer_size)
+        if not chunk:
+            break
+
+        lines = (pending + decoder.decode(chunk)).split('\n')
+        pending = lines.pop()
+        for line in lines:
+            yield line + '\n'
+
+    pending += decoder.decode(b'', True)
+    if pending:
+        yield pending
+
+
+def decode_lines(lines, encoding=DEFAULT_ENCODING):
+    """Yields decoded lines from an iterable of lines
+
+    Lines that already are a `str` are passed through without decoding. Lines of `bytes` are decoded
+    one by one, each of them may start with a byte order mark. Use `gedcom.reader.read_lines()` to read a
+    binary file stream instead, which decodes in large buffers.
+
+    :type lines: collections.abc.Iterable[bytes or str]
+    :type encoding: str
+    :rtype: collections.abc.Iterator[str]
+    """
+    lines = iter(lines)
+
+    for first_line in lines:
+        if isinstance(first_line, str):
+            yield first_line
+            for line in lines:
+                yield line
+        else:
+            yield first_line.decode(encoding)
+            for line in lines:
+                yield line.decode(encoding)
+        break
+
+
+@contextlib.contextmanager
+def map_file(file_path):
+    """Memory-maps a file, from the given file path, for reading
+
+    Yields the read-only `mmap.mmap`, or empty `bytes` for an empty file, which can't be mapped.
+
+    :type file_path: str
+    :rtype: collections.abc.Iterator[mmap.mmap]
+    """
+    with open(file_path, 'rb') as gedcom_file:
+        if os.fstat(gedcom_file.fileno()).st_size == 0:
+            yield b''
+            return
+
+        mapped_file = mmap.mmap(gedcom_file.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            yield mapped_file
+        finally:
+            mapped_file.close()
+
+
+def get_data_start(data):
+    """Returns the offset of the first line, skipping a UTF-8 byte order mark
+    :type data: bytes or mmap.mmap
+    :rtype: int
+    """
+    return len(codecs.BOM_UTF8) if data[:len(codecs.BOM_UTF8)] == codecs.BOM_UTF8 else 0
+
+
+def iter_raw_lines(data, start=None, end=None):
+    """Yields the undecoded lines, including their line breaks, between two offsets of UTF-8 encoded data
+
+    Lines are split at `\\n` only, like `gedcom.reader.read_lines()` does. By default all lines
+    after the byte order mark are returned.
+
+    :type data: bytes or mmap.mmap
+    :type start: int
+    :type end: int
+    :rtype: collections.abc.Iterator[bytes]
+    """
+    if start is None:
+        start = get_data_start(data)
+    if end is None:
+        end = len(data)
+
+    find = data.find
+    while start < end:
+        line_end = find(b'\n', start, end) + 1
+        if line_end == 0:
+            line_end = end
+        yield data[start:line_end]
+        start = line_end
+
+
+def find_record_start(data, position, end=None):
+    """Returns the offset of the first level 0 line that starts after the given offset, or `end` if there is none
+
+    :type data: bytes or mmap.mmap
+    :type position: int
+    :type end: int
+    :rtype: int
+    """
+    if end is None:
+        end = len(data)
+
+    find = data.find
+    while True:
+        line_start = find(b'\n0 ', position, end) + 1
+        if line_start == 0:
+            return end
+        if RECORD_START_REGEX.match(data[line_start:line_start + 256]):
+            return line_start
+        position = line_start
+
+
+def find_record_offsets(data):
+    """Returns the start offsets of all logical records of UTF-8 encoded data, followed by the end of the data
+    :type data: bytes or mmap.mmap
+    :rtype: list of int
+    """
+    start = get_data_start(data)
+    end = len(data)
+    offsets = []
+
+    while start < end:
+        offsets.append(start)
+        start = find_record_start(data, start, end)
+
+    offsets.append(end)
+    return offsets
+
+
+def find_shard_offsets(data, shard_count):
+    """Splits UTF-8 encoded data into at most `shard_count` ranges of about the same size, each starting with a level 0 line
+
+    Returns the sorted start offsets of all ranges followed by the end of the data.
+
+    :type data: bytes or mmap.mmap
+    :type shard_count: int
+    :rtype: list of int
+    """
+    start = get_data_start(data)
+    end = len(data)
+    offsets = [start]
+
+    for shard in range(1, shard_count):
+        position = start + (end - start) * shard // shard_count
+        offset = find_record_start(data, max(position, offsets[-1]), end)
+        if offset < end:
+            offsets.append(offset)
+
+    offsets.append(end)
+    return offsets
+
+
+def count_lines(data, start, end, buffer_size=DEFAULT_BUFFER_SIZE * 16):
+    """Returns the number of line breaks (`\\n`) between two offsets
+    :type data: bytes or mmap.mmap
+    :type start: int
+    :type end: int
+    :type buffer_size: int
+    :rtype: int
+    """
+    lines = 0
+    while start < end:
+        lines += data[start:min(start + buffer_size, end)].count(b'\n')
+        start += buffer_size
+    return lines
@@ -0,0 +1,304 @@
+"""
+Module containing the `gedcom.relationship.RelationshipCalculator`, which names the blood relationship
+between two individuals (e.g. "2nd cousin once removed") out of their lowest common ancestors.
+"""
+
+from collections import OrderedDict
+
+from python_gedcom_2.element.individual import IndividualElement, NotAnActualIndividualError
+from python_gedcom_2.parser import PedigreeCycleError
+import python_gedcom_2.tags
+
+DEFAULT_CACHE_SIZE = 10000
+"""Number of individuals whose ancestors are kept by default, see `gedcom.relationship.RelationshipCalculator`"""
+
+# Words for a relationship as (gender-neutral word or `None` if there is none, male word, female word)
+_PARENT_WORDS = ("parent", "father", "mother")
+_CHILD_WORDS = ("child", "son", "daughter")
+_SIBLING_WORDS = ("sibling", "brother", "sister")
+_PARENTS_SIBLING_WORDS = (None, "uncle", "aunt")
+_SIBLINGS_CHILD_WORDS = (None, "nephew", "niece")
+
+
+def get_ordinal(number):
+    """Returns a number as an English ordinal, e.g. `2nd`
+    :type number: int
+    :rtype: str
+    """
+    if 10 <= number % 100 <= 20:
+        suffix = "th"
+    else:
+        suffix = {1: "st", 2: "nd", 3: "rd"}.get(number % 10, "th")
+    return "%d%s" % (number, suffix)
+
+
+def get_relationship_name(generations_from_individual, generations_from_relative, is_half=False, gender=""):
+    """Returns what a relative is to an individual, given the generations from both of them to a common ancestor
+
+    E.g. 1 and 1 is a sibling, 2 and 1 an uncle or aunt and 3 and 4 a 2nd cousin once removed. The individual and the
+    relative being the same is named `self`. With `is_half` the name starts with `half-`. `gender` is the
+    `gedcom.tags.GEDCOM_TAG_SEX` of the relative, `M` or `F` result in gender specific words.
+
+    :type generations_from_individual: int
+    :type generations_from_relative: int
+    :type is_half: bool
+    :type gender: str
+    :rtype: str
+    """
+    up = generations_from_individual
+    down = generations_from_relative
+
+    if up == 0 and down == 0:
+        return "self"
+
+    if up == 0:
+        name = _get_lineal_name(_CHILD_WORDS, down, gender)
+    elif down == 0:
+        name = _get_lineal_name(_PARENT_WORDS, up, gender)
+    elif up == 1 and down == 1:
+        name = _get_word(_SIBLING_WORDS, gender, "")
+    elif up == 1:
+        name = _get_collateral_name(_SIBLINGS_CHILD_WORDS, down, gender)
+    elif down == 1:
+        name = _get_collateral_name(_PARENTS_SIBLING_WORDS, up, gender)
+    else:
+        name = "%s cousin" % get_ordinal(min(up, down) - 1)
+        removed = abs(up - down)
+        if removed == 1:
+            name += " once removed"
+        elif removed == 2:
+            name += " twice removed"
+        elif removed > 2:
+            name += " %d times removed" % removed
+
+    return "half-" + name if is_half else name
+
+
+def _get_word(words, gender, prefix):
+    neutral_word, male_word, female_word = words
+    if gender == "M":
+        return prefix + male_word
+    if gender == "F":
+        return prefix + female_word
+    if neutral_word is None:
+        return "%s%s or %s%s" % (prefix, male_word, prefix, female_word)
+    return prefix + neutral_word
+
+
+def _get_lineal_name(words, generations, gender):
+    # parent, grandparent, great-grandparent, 2nd great-grandparent, ...
+    if generations == 1:
+        return _get_word(words, gender, "")
+    if generations == 2:
+        return _get_word(words, gender, "grand")
+    if generations == 3:
+        return _get_word(words, gender, "great-grand")
+    return _get_word(words, gender, "%s great-grand" % get_ordinal(generations - 2))
+
+
+def _get_collateral_name(words, generations, gender):
+    # uncle, granduncle, great-granduncle, 2nd great-granduncle, ...
+    return _get_lineal_name(words, generations - 1, gender)
+
+
+class RelationshipCalculator(object):
+    """Names blood relationships between individuals of a `gedcom.parser.Parser`
+
+    For each individual a dictionary of all of its ancestors with the lowest generation they belong to is
+    computed out of the dictionaries of its parents. Relationships are then found by intersecting the
+    dictionaries of two individuals, so each query costs time in the number of ancestors of the one with fewer of
+    them, not constant time.
+
+    The dictionaries of the `cache_size` most recently used individuals are kept, each taking memory in the number of
+    its ancestors, so the memory of the cache is bounded by `cache_size` times the largest number of ancestors.
+    A dictionary that was dropped gets computed anew, out of the ones of the parents if they are still kept. With a
+    `cache_size` of `None` all dictionaries are kept, which takes memory in the number of individuals times their
+    number of ancestors. `gedcom.relationship.RelationshipCalculator.precompute()` computes the dictionaries of
+    all individuals at once, which is only useful if all of them fit into the cache. The parents of each
+    individual are kept as pointers until `gedcom.relationship.RelationshipCalculator.clear_cache()` gets called.
+
+    The lowest common ancestors are the common ancestors that aren't a parent of another common ancestor. With
+    pedigree collapse two individuals can be related in several ways, e.g. as 1st cousins and as 2nd cousins.
+    Two individuals sharing only one lowest common ancestor at the closest generations (rather than a couple)
+    are named half relatives.
+
+    Data modified after creating the calculator isn't taken into account, create a new calculator instead.
+    """
+
+    def __init__(self, parser, ancestor_type="ALL", cache_size=DEFAULT_CACHE_SIZE):
+        """
+        :type parser: Parser
+        :type ancestor_type: str
+        :type cache_size: int | None
+        """
+        self.__parser = parser
+        self.__ancestor_type = ancestor_type
+        self.__cache_size = cache_size
+        self.__parent_pointers = {}
+        self.__ancestor_generations = OrderedDict()
+
+    def precompute(self):
+        """Computes the ancestors of all individuals of the parser, keeping as many of them as fit into the cache"""
+        for pointer, element in self.__parser.get_element_dictionary().items():
+            if isinstance(element, IndividualElement):
+                self.__get_ancestor_generations(pointer)
+
+    def get_cached_count(self):
+        """Returns the number of individuals whose ancestors are currently kept in memory
+        :rtype: int
+        """
+        return len(self.__ancestor_generations)
+
+    def clear_cache(self):
+        """Drops the ancestors and parents of all individuals"""
+        self.__ancestor_generations.clear()
+        self.__parent_pointers.clear()
+
+    def get_ancestor_generations(self, individual):
+        """Returns the pointers of all ancestors of an individual, including itself as generation 0, together
+        with the lowest generation they belong to
+
+        Raises a `gedcom.parser.PedigreeCycleError` if an ancestor turns out to be its own ancestor.
+        The returned dictionary must not be modified.
+
+        :type individual: IndividualElement
+        :rtype: dict[str, int]
+        """
+        if not isinstance(individual, IndividualElement):
+            raise NotAnActualIndividualError(
+                "Operation only valid for elements with %s tag" % python_gedcom_2.tags.GEDCOM_TAG_INDIVIDUAL
+            )
+        return self.__get_ancestor_generations(individual.get_pointer())
+
+    def get_lowest_common_ancestors(self, individual, relative):
+        """Returns the lowest common ancestors of two individuals
+
+        Returns a list of tuples (`IndividualElement` ancestor, `int` generations from `individual`,
+        `int` generations from `relative`), closest ancestors first. If one of them is an ancestor of the other,
+        it is the only lowest common ancestor.
+
+        :type individual: IndividualElement
+        :type relative: IndividualElement
+        :rtype: list of tuple
+        """
+        individual_generations = self.get_ancestor_generations(individual)
+        relative_generations = self.get_ancestor_generations(relative)
+
+        if len(relative_generations) < len(individual_generations):
+            common_pointers = [pointer for pointer in relative_generations if pointer in individual_generations]
+        else:
+            common_pointers = [pointer for pointer in individual_generations if pointer in relative_generations]
+
+        # Every parent of a common ancestor is a common ancestor, too, but not a lowest one.
+        parents_of_common_ancestors = set()
+        for pointer in common_pointers:
+            parents_of_common_ancestors.update(self.__parent_pointers[pointer])
+
+        lowest_common_ancestors = [
+            (self.__parser.get_element_by_pointer(pointer), individual_generations[pointer], relative_generations[pointer])
+            for pointer in common_pointers if pointer not in parents_of_common_ancestors
+        ]
+        lowest_common_ancestors.sort(key=lambda ancestor: (ancestor[1] + ancestor[2], ancestor[1]))
+        return lowest_common_ancestors
+
+    def get_relationships(self, individual, relative):
+        """Returns the names of all ways in which a relative is related to an individual, closest first
+
+        See `gedcom.relationship.get_relationship_name()` for the names. Returns an empty list if they
+        aren't blood relatives.
+
+        :type individual: IndividualElement
+        :type relative: IndividualElement
+        :rtype: list of str
+        """
+        counts = {}
+        for ancestor, generations_from_individual, generations_from_relative in \
+                self.get_lowest_common_ancestors(individual, relative):
+            generations = (generations_from_individual, generations_from_relative)
+            counts[generations] = counts.get(generations, 0) + 1
+
+        # Dictionaries don't keep their order before Python 3.6, so the closest relationships are sorted first here.
+        closest_first = sorted(counts.items(), key=lambda item: (item[0][0] + item[0][1], item[0][0]))
+
+        gender = relative.get_gender()
+        names = []
+        for (generations_from_individual, generations_from_relative), count in closest_first:
+            is_half = count == 1 and generations_from_individual > 0 and generations_from_relative > 0
+            name = get_relationship_name(generations_from_individual, generations_from_relative, is_half, gender)
+            if name not in names:
+                names.append(name)
+        return names
+
+    def get_relationship(self, individual, relative):
+        """Returns the name of the closest relationship of a relative to an individual, e.g. `2nd cousin once removed`
+
+        Returns `None` if they aren't blood relatives.
+
+        :type individual: IndividualElement
+        :type relative: IndividualElement
+        :rtype: str
+        """
+        names = self.get_relationships(individual, relative)
+        return names[0] if names else None
+
+    def __get_parent_pointers(self, pointer):
+        parent_pointers = self.__parent_pointers.get(pointer)
+        if parent_pointers is None:
+            individual = self.__parser.get_element_by_pointer(pointer)
+            parent_pointers = [parent.get_pointer() for parent in self.__parser.get_parents(individual, self.__ancestor_type)]
+            self.__parent_pointers[pointer] = parent_pointers
+        return parent_pointers
+
+    def __get_ancestor_generations(self, pointer):
+        """Computes the ancestors of an individual after the ones of all of its ancestors, without recursion
+
+        Ancestors computed on the way are kept in a dictionary of their own until the individual is done, so that
+        they can't be dropped from the cache before their descendants were computed.
+
+        :type pointer: str
+        :rtype: dict[str, int]
+        """
+        cache = self.__ancestor_generations
+        if pointer in cache:
+            cache.move_to_end(pointer)
+            return cache[pointer]
+
+        computed = {}
+        # Individuals whose parents are being computed. Everything above one of them on the stack is its ancestor.
+        in_progress = set()
+        stack = [pointer]
+
+        while stack:
+            current = stack[-1]
+            if current in computed or current in cache:
+                stack.pop()
+                continue
+
+            parent_pointers = self.__get_parent_pointers(current)
+            if current not in in_progress:
+                missing_pointers = [parent for parent in parent_pointers if parent not in computed and parent not in cache]
+                if missing_pointers:
+                    in_progress.add(current)
+                    for parent in missing_pointers:
+                        if parent in in_progress or parent == current:
+                            raise PedigreeCycleError("Individual %s is its own ancestor" % parent)
+                        stack.append(parent)
+                    continue
+
+            generations = {current: 0}
+            for parent in parent_pointers:
+                parent_generations = computed[parent] if parent in computed else cache[parent]
+                for ancestor, generation in parent_generations.items():
+                    if generations.get(ancestor, generation + 2) > generation + 1:
+                        generations[ancestor] = generation + 1
+
+            computed[current] = generations
+            in_progress.discard(current)
+            stack.pop()
+
+        # The individual itself was computed last, so it is the most recently used one.
+        cache.update(computed)
+        if self.__cache_size is not None:
+            while len(cache) > self.__cache_size:
+                cache.popitem(last=False)
+        return computed[pointer]
@@ -0,0 +1,171 @@
+"""
+Module containing the index of links between individuals and families, which lets the relationship
+methods of `gedcom.parser.Parser` look up parents, children and family members without scanning records.
+"""
+
+import python_gedcom_2.tags
+
+INDEXED_FAMILY_TYPES = (python_gedcom_2.tags.GEDCOM_TAG_FAMILY_CHILD, python_gedcom_2.tags.GEDCOM_TAG_FAMILY_SPOUSE)
+"""Tags of the links from individuals to families kept by a `gedcom.relationship_index.RelationshipIndex`"""
+
+FAMILY_MEMBER_TAGS = (python_gedcom_2.tags.GEDCOM_TAG_HUSBAND, python_gedcom_2.tags.GEDCOM_TAG_WIFE,
+                      python_gedcom_2.tags.GEDCOM_TAG_CHILD)
+"""Tags of the links from families to their members"""
+
+NATURAL_PEDIGREE = "Natural"
+"""Value of a `gedcom.tags.GEDCOM_PROGRAM_DEFINED_TAG_MREL` or `gedcom.tags.GEDCOM_PROGRAM_DEFINED_TAG_FREL` of a natural child"""
+
+
+class IndividualLinks(object):
+    """Links of an individual to the families in which it is a child or a spouse
+
+    `family_pointers_by_type` holds the pointers of the families that exist, by the tag of the link.
+    `natural_parent_pointers` is `None` until `gedcom.relationship_index.RelationshipIndex.get_natural_parent_pointers()`
+    collected it.
+    """
+
+    __slots__ = ('family_pointers_by_type', 'natural_parent_pointers')
+
+    def __init__(self, individual, element_dictionary):
+        """
+        :type individual: IndividualElement
+        :type element_dictionary: dict[str, Element]
+        """
+        self.natural_parent_pointers = None
+        self.family_pointers_by_type = {}
+        for family_type in INDEXED_FAMILY_TYPES:
+            self.family_pointers_by_type[family_type] = [
+                child.get_value() for child in individual.get_child_elements_by_tag(family_type)
+                if child.get_value() in element_dictionary
+            ]
+
+
+class FamilyLinks(object):
+    """Links of a family to its members, including the pedigree of its children
+
+    `members` holds tuples of (`str` tag, `str` member pointer) for all husbands, wives and children that
+    exist, in their original order. `natural_child_links` holds tuples of (`str` child pointer, `str` tag) for each
+    `gedcom.tags.GEDCOM_PROGRAM_DEFINED_TAG_MREL` or `gedcom.tags.GEDCOM_PROGRAM_DEFINED_TAG_FREL` of a child
+    with a value of `Natural`. `spouse_pedigree_tags` maps the pointer of each husband or wife to the pedigree
+    tag describing the relation of the children to that spouse.
+    """
+
+    __slots__ = ('members', 'natural_child_links', 'spouse_pedigree_tags')
+
+    def __init__(self, family, element_dictionary):
+        """
+        :type family: FamilyElement
+        :type element_dictionary: dict[str, Element]
+        """
+        self.members = []
+        self.natural_child_links = []
+        self.spouse_pedigree_tags = {}
+
+        for child_element in family.get_child_elements():
+            tag = child_element.get_tag()
+            value = child_element.get_value()
+
+            if tag in FAMILY_MEMBER_TAGS and value in element_dictionary:
+                self.members.append((tag, value))
+
+            if tag == python_gedcom_2.tags.GEDCOM_TAG_WIFE:
+                self.spouse_pedigree_tags[value] = python_gedcom_2.tags.GEDCOM_PROGRAM_DEFINED_TAG_MREL
+            elif tag == python_gedcom_2.tags.GEDCOM_TAG_HUSBAND:
+                self.spouse_pedigree_tags[value] = python_gedcom_2.tags.GEDCOM_PROGRAM_DEFINED_TAG_FREL
+            elif tag == python_gedcom_2.tags.GEDCOM_TAG_CHILD:
+                for pedigree in child_element.get_child_elements():
+                    if pedigree.get_value() == NATURAL_PEDIGREE and pedigree.get_tag() in (
+                            python_gedcom_2.tags.GEDCOM_PROGRAM_DEFINED_TAG_MREL,
+                            python_gedcom_2.tags.GEDCOM_PROGRAM_DEFINED_TAG_FREL):
+                        self.natural_child_links.append((value, pedigree.get_tag()))
+
+
+class RelationshipIndex(object):
+    """Index of the links between individuals and families of an element dictionary
+
+    The links of an individual or a family get collected on their first lookup and are kept, so each further
+    lookup costs as much as the number of links. Like the element dictionary itself, the index must be rebuilt
+    after the data was modified, see `gedcom.parser.Parser.invalidate_cache()`.
+
+    Links are kept by pointer and get resolved through the element dictionary on every lookup, so the index holds
+    no elements. In lazy mode (see `gedcom.parser.Parser.parse_file()`) records dropped from the cache therefore
+    aren't kept alive, and the index only grows by the pointers of the looked up records. An element that isn't the
+    one in the element dictionary for its pointer (e.g. a copy) gets its links collected on every lookup instead.
+    """
+
+    def __init__(self, element_dictionary):
+        """
+        :type element_dictionary: dict[str, Element]
+        """
+        self.__element_dictionary = element_dictionary
+        self.__individual_links = {}
+        self.__family_links = {}
+
+    def get_individual_links(self, individual):
+        """Returns the links of an individual
+        :type individual: IndividualElement
+        :rtype: IndividualLinks
+        """
+        return self.__get_links(individual, self.__individual_links, IndividualLinks)
+
+    def get_family_links(self, family):
+        """Returns the links of a family
+        :type family: FamilyElement
+        :rtype: FamilyLinks
+        """
+        return self.__get_links(family, self.__family_links, FamilyLinks)
+
+    def __get_links(self, element, links_by_pointer, links_class):
+        pointer = element.get_pointer()
+        links = links_by_pointer.get(pointer)
+        if links is not None and self.__element_dictionary.get(pointer) is element:
+            return links
+
+        links = links_class(element, self.__element_dictionary)
+        if self.__element_dictionary.get(pointer) is element:
+            links_by_pointer[pointer] = links
+        return links
+
+    def get_families(self, individual, family_type):
+        """Returns the families of an individual linked by the given tag, one of
+        `gedcom.relationship_index.INDEXED_FAMILY_TYPES`
+        :type individual: IndividualElement
+        :type family_type: str
+        :rtype: list of FamilyElement
+        """
+        element_dictionary = self.__element_dictionary
+        return [element_dictionary[pointer]
+                for pointer in self.get_individual_links(individual).family_pointers_by_type[family_type]]
+
+    def get_family_members(self, family, member_tags):
+        """Returns the members of a family linked by one of the given tags, in their original order
+        :type family: FamilyElement
+        :type member_tags: collections.abc.Container[str]
+        :rtype: list of IndividualElement
+        """
+        element_dictionary = self.__element_dictionary
+        return [element_dictionary[pointer] for tag, pointer in self.get_family_links(family).members
+                if tag in member_tags]
+
+    def get_natural_parent_pointers(self, individual):
+        """Returns the pointers of the natural parents of an individual, the ones of
+        `gedcom.parser.Parser.get_parents()` with a parent type of `NAT`
+        :type individual: IndividualElement
+        :rtype: frozenset of str
+        """
+        links = self.get_individual_links(individual)
+        if links.natural_parent_pointers is None:
+            natural_parent_pointers = set()
+            for family_pointer in links.family_pointers_by_type[python_gedcom_2.tags.GEDCOM_TAG_FAMILY_CHILD]:
+                family_links = self.get_family_links(self.__element_dictionary[family_pointer])
+                for child_pointer, pedigree_tag in family_links.natural_child_links:
+                    if child_pointer != individual.get_pointer():
+                        continue
+                    if pedigree_tag == python_gedcom_2.tags.GEDCOM_PROGRAM_DEFINED_TAG_MREL:
+                        parent_tag = python_gedcom_2.tags.GEDCOM_TAG_WIFE
+                    else:
+                        parent_tag = python_gedcom_2.tags.GEDCOM_TAG_HUSBAND
+                    natural_parent_pointers.update(member_pointer for tag, member_pointer in family_links.members
+                                                   if tag == parent_tag)
+            links.natural_parent_pointers = frozenset(natural_parent_pointers)
+        return links.natural_parent_pointers
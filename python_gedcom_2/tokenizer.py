@@ -0,0 +1,148 @@
+"""
+Module containing the line tokenizer used by `gedcom.parser.Parser` to split each line of
+GEDCOM data into its level, pointer, tag, value and line break.
+"""
+
+import re as regex
+
+from python_gedcom_2.interning import intern_bytes_tag, intern_tag
+import python_gedcom_2.tags
+
+
+class GedcomFormatViolationError(Exception):
+    pass
+
+
+# Each line should have the following (bracketed items optional):
+# level + ' ' + [pointer + ' ' +] tag + [' ' + line_value] + end_of_line
+#
+# * Level must start with non-negative int, no leading zeros.
+# * Pointer optional, if it exists it must be flanked by `@`
+# * Tag must be an alphanumeric string
+# * Value optional, consists of anything after a space to end of line
+# * End of line defined by `\n` or `\r`. It is optional here so that lines without a line break (which could
+#   be the last line) are recognized by the same match instead of a second one.
+GEDCOM_LINE_REGEX = regex.compile('^(0|[1-9][0-9]*) (@[^@]+@ |)([A-Za-z0-9_]+)( [^\n\r]*|)([\r\n]{1,2})?')
+
+# The same for lines that have not been decoded yet, see `tokenize_bytes_line()`. The separating
+# spaces are not part of the groups, so that a missing pointer or value results in `None`.
+GEDCOM_BYTES_LINE_REGEX = regex.compile(b'^(0|[1-9][0-9]*) (?:(@[^@]+@) )?([A-Za-z0-9_]+)(?: ([^\n\r]*))?([\r\n]{1,2})')
+
+# All line breaks matched by the regular expressions above
+LINE_BREAKS = {line_break.encode('ascii'): line_break for line_break in
+               ('\r', '\n', '\r\r', '\r\n', '\n\r', '\n\n')}
+
+# A text line without level and pointer, consisting of anything up to an optional end of line
+CONTINUATION_LINE_REGEX = regex.compile('([^\n\r]*)([\r\n]{1,2})?')
+
+SPECIFICATION_HINT = "\nSee: https://chronoplexsoftware.com/gedcomvalidator/gedcom/gedcom-5.5.pdf"
+
+
+def tokenize_line(line_number, line, last_level, last_tag, strict=True):
+    """Splits a line from a GEDCOM 5.5 formatted document into its parts
+
+    Returns a tuple of (`int` level, `str` pointer, `str` tag, `str` value, `str` crlf).
+
+    The tag is interned, see `gedcom.interning.intern_tag()`.
+
+    When not in strict mode two quirks are accepted: a line without a line break is treated as if
+    it had one, and a text line without level and tag (e.g. a note containing a line break) is turned
+    into a `gedcom.tags.GEDCOM_TAG_CONCATENATION` of the previous line. The latter has a pointer of `None`.
+
+    :type line_number: int
+    :type line: str
+    :type last_level: int
+    :type last_tag: str
+    :type strict: bool
+    :rtype: tuple
+    """
+    regex_match = GEDCOM_LINE_REGEX.match(line)
+
+    if regex_match is not None:
+        level, pointer, tag, value, crlf = regex_match.groups()
+        if crlf is not None:
+            return int(level), pointer.rstrip(' '), intern_tag(tag), value.strip(), crlf
+
+    if strict:
+        error_message = ("Line <%d:%s> of document violates GEDCOM format 5.5" % (line_number, line)
+                         + SPECIFICATION_HINT)
+        raise GedcomFormatViolationError(error_message)
+
+    if regex_match is not None:
+        # Quirk check - this is a line without a CRLF (which could be the last line)
+        return int(level), pointer.rstrip(' '), intern_tag(tag), value.strip(), '\n'
+
+    # Quirk check - Sometimes a gedcom has a text field with a CR.
+    # This creates a line without the standard level and pointer.
+    # If this is detected then turn it into a CONC or CONT.
+    value, crlf = CONTINUATION_LINE_REGEX.match(line).groups()
+    level = last_level
+    tag = last_tag
+    if tag != python_gedcom_2.tags.GEDCOM_TAG_CONTINUED and tag != python_gedcom_2.tags.GEDCOM_TAG_CONCATENATION:
+        # Increment level and change this line to a CONC
+        level += 1
+        tag = python_gedcom_2.tags.GEDCOM_TAG_CONCATENATION
+
+    return level, None, tag, value.strip(), crlf if crlf is not None else '\n'
+
+
+def tokenize_bytes_line(line_number, line, last_level, last_tag, strict=True):
+    """Splits a line of UTF-8 encoded GEDCOM data into its parts, decoding only the pointer, tag and value
+
+    Returns the same as `gedcom.tokenizer.tokenize_line()` would for the decoded line.
+
+    :type line_number: int
+    :type line: bytes
+    :type last_level: int
+    :type last_tag: str
+    :type strict: bool
+    :rtype: tuple
+    """
+    regex_match = GEDCOM_BYTES_LINE_REGEX.match(line)
+
+    if regex_match is None:
+        # Quirks and errors are rare, so they are handled on the decoded line.
+        return tokenize_line(line_number, line.decode('utf-8'), last_level, last_tag, strict)
+
+    level, pointer, tag, value, crlf = regex_match.groups()
+    return (int(level), pointer.decode('utf-8') if pointer else '', intern_bytes_tag(tag),
+            value.decode('utf-8').strip() if value else '', LINE_BREAKS[crlf])
+
+
+def validate_level(line_number, level, last_level):
+    """Checks that a line is never more than one level higher than the previous line
+    :type line_number: int
+    :type level: int
+    :type last_level: int
+    """
+    if level > last_level + 1:
+        error_message = ("Line %d of document violates GEDCOM format 5.5" % line_number
+                         + "\nLines must be no more than one level higher than previous line."
+                         + SPECIFICATION_HINT)
+        raise GedcomFormatViolationError(error_message)
+
+
+def iter_tokens(lines, strict=True, tokenize=tokenize_line, line_number=1):
+    """Tokenizes lines which start a new document (or a logical record) and validates their levels
+
+    Yields a tuple like `gedcom.tokenizer.tokenize_line()` for each line.
+
+    :type lines: collections.abc.Iterable[str]
+    :type strict: bool
+    :type tokenize: collections.abc.Callable
+    :type line_number: int
+    :rtype: collections.abc.Iterator[tuple]
+    """
+    # Start like below the virtual root element, which has no tag of interest to the tokenizer
+    last_level = -1
+    last_tag = None
+
+    for line in lines:
+        token = tokenize(line_number, line, last_level, last_tag, strict)
+        level = token[0]
+        validate_level(line_number, level, last_level)
+        yield token
+
+        last_level = level
+        last_tag = token[2]
+        line_number += 1
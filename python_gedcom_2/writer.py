@@ -0,0 +1,370 @@
+"""
+Module containing helpers used by `gedcom.parser.Parser.save_gedcom()` to turn elements back into GEDCOM data.
+"""
+
+import codecs
+import io
+import os
+import re as regex
+
+from python_gedcom_2.reader import find_record_offsets, map_file
+import python_gedcom_2.tags
+
+# Line breaks separating the lines of the value of a collapsed element
+LINE_BREAK_REGEX = regex.compile('\r\n|\r|\n')
+
+DEFAULT_ENCODING = 'utf-8'
+"""Encoding of GEDCOM data written to a binary file stream"""
+
+DEFAULT_BUFFER_SIZE = 1024 * 1024
+"""Number of characters collected before they are encoded and written at once by `gedcom.writer.write_elements()`"""
+
+
+def format_line(element, line_terminator=None):
+    """Formats a single element into a GEDCOM line, including its line break
+
+    A collapsed element is formatted into its line followed by its concatenation and continuation lines.
+
+    :type element: Element
+    :type line_terminator: str | None
+    :rtype: str
+    """
+    pointer = element.get_pointer()
+    value = element.get_value()
+    if value and element.is_collapsed():
+        return ''.join(iter_collapsed_lines(element, element.get_crlf() if line_terminator is None else line_terminator))
+    line = str(element.get_level())
+    if pointer:
+        line += ' ' + pointer
+    line += ' ' + element.get_tag()
+    if value:
+        line += ' ' + value
+    return line + (element.get_crlf() if line_terminator is None else line_terminator)
+
+
+def split_line(line, first_available, available):
+    """Splits a line into chunks of at most `first_available` characters for the first one and `available`
+    characters for the others
+
+    A chunk is cut before trailing spaces, so that no chunk ends with a space, unless the chunk consists
+    of spaces only.
+
+    :type line: str
+    :type first_available: int
+    :type available: int
+    :rtype: list of str
+    """
+    chunks = []
+    index = 0
+    size = len(line)
+    chunk_size = first_available
+    while True:
+        if size - index <= chunk_size:
+            chunks.append(line[index:])
+            return chunks
+        chunk = line[index:index + chunk_size]
+        chunk_length = len(chunk.rstrip(' ')) or chunk_size
+        chunks.append(chunk[:chunk_length])
+        index += chunk_length
+        chunk_size = available
+
+
+def split_multi_line_value(value, line_length, level, crlf, collapsed=False):
+    """Splits a multi-line value into the value of an element and its concatenation and continuation lines
+
+    The value is split into lines like by `str.splitlines()`, so a line break at its end adds no empty continuation
+    line. With `collapsed` the value of a collapsed element is split at each `\\r\\n`, `\\r` or `\\n` only,
+    keeping empty lines at its end, so that it is written like the lines it was joined from.
+
+    Each line of GEDCOM data holds at most 255 characters. `line_length` is the length of the element's line
+    without a value, e.g. `0` for the root element, and `level` the level of the added lines. Returns the value of
+    the element and a list of tuples of (`str` tag, `str` value) for the added lines.
+
+    :type value: str
+    :type line_length: int
+    :type level: int
+    :type crlf: str
+    :type collapsed: bool
+    :rtype: tuple
+    """
+    lines = (LINE_BREAK_REGEX.split(value) if value else []) if collapsed else value.splitlines()
+    if not lines:
+        return '', []
+
+    concatenation_tag = python_gedcom_2.tags.GEDCOM_TAG_CONCATENATION
+    continued_tag = python_gedcom_2.tags.GEDCOM_TAG_CONTINUED
+    concatenation_available = max(255 - len('%d %s%s' % (level, concatenation_tag, crlf)), 0)
+    continued_available = max(255 - len('%d %s%s' % (level, continued_tag, crlf)), 0)
+
+    chunks = split_line(lines[0], max(255 - line_length, 0), concatenation_available)
+    first_value = chunks[0]
+    tags_and_values = [(concatenation_tag, chunk) for chunk in chunks[1:]]
+    for line in lines[1:]:
+        chunks = split_line(line, continued_available, concatenation_available)
+        tags_and_values.append((continued_tag, chunks[0]))
+        tags_and_values.extend((concatenation_tag, chunk) for chunk in chunks[1:])
+    return first_value, tags_and_values
+
+
+def iter_collapsed_lines(element, line_break):
+    """Yields the GEDCOM lines of a collapsed element, split into concatenation and continuation lines
+
+    See `gedcom.element.element.Element.is_collapsed()`.
+
+    :type element: Element
+    :type line_break: str
+    :rtype: collections.abc.Iterator[str]
+    """
+    level = element.get_level()
+    pointer = element.get_pointer()
+    tag = element.get_tag()
+    line = '%d %s %s' % (level, pointer, tag) if pointer else '%d %s' % (level, tag)
+
+    first_value, tags_and_values = split_multi_line_value(element.get_value(), len(line + line_break), level + 1,
+                                                          line_break, collapsed=True)
+    yield '%s %s%s' % (line, first_value, line_break) if first_value else line + line_break
+    for tag, value in tags_and_values:
+        yield '%d %s %s%s' % (level + 1, tag, value, line_break) if value else '%d %s%s' % (level + 1, tag, line_break)
+
+
+def iter_lines(element, line_terminator=None):
+    """Yields the GEDCOM lines of an element and all of its sub-elements, in the order of the file
+
+    The tree is walked with an explicit stack, so that its depth isn't bound by the recursion limit. Elements
+    with a negative level, like the `gedcom.element.root.RootElement`, have no line of their own. Each line
+    ends with the line break it was parsed with, unless a `line_terminator` is given. The value of a collapsed
+    element is split into concatenation and continuation lines, see `gedcom.writer.split_multi_line_value()`.
+
+    :type element: Element
+    :type line_terminator: str | None
+    :rtype: collections.abc.Iterator[str]
+    """
+    stack = [element]
+    pop = stack.pop
+    extend = stack.extend
+    while stack:
+        element = pop()
+        level = element.get_level()
+        if level >= 0:
+            pointer = element.get_pointer()
+            value = element.get_value()
+            line_break = element.get_crlf() if line_terminator is None else line_terminator
+            if value and element.is_collapsed():
+                for line in iter_collapsed_lines(element, line_break):
+                    yield line
+            elif pointer:
+                if value:
+                    yield '%d %s %s %s%s' % (level, pointer, element.get_tag(), value, line_break)
+                else:
+                    yield '%d %s %s%s' % (level, pointer, element.get_tag(), line_break)
+            elif value:
+                yield '%d %s %s%s' % (level, element.get_tag(), value, line_break)
+            else:
+                yield '%d %s%s' % (level, element.get_tag(), line_break)
+        child_elements = element.get_child_elements()
+        if child_elements:
+            extend(reversed(child_elements))
+
+
+def is_binary_stream(open_file):
+    """Checks if a file stream has to be written `bytes` instead of `str`
+
+    :type open_file: a file stream
+    :rtype: bool
+    """
+    if isinstance(open_file, io.TextIOBase):
+        return False
+    return isinstance(open_file, (io.RawIOBase, io.BufferedIOBase)) or 'b' in getattr(open_file, 'mode', '')
+
+
+def write_lines(lines, open_file, encoding=DEFAULT_ENCODING, buffer_size=DEFAULT_BUFFER_SIZE):
+    """Writes lines to a text or binary file stream, joined into buffers of about `buffer_size` characters
+
+    Lines written to a binary file stream are encoded with `encoding`. A byte order mark of the encoding,
+    e.g. of `utf-8-sig`, is written once at the start. Lines may also be given as UTF-8 encoded `bytes`,
+    which are written to a binary file stream as they are.
+
+    :type lines: collections.abc.Iterable[str | bytes]
+    :type open_file: a text or binary file stream
+    :type encoding: str
+    :type buffer_size: int
+    """
+    write = open_file.write
+    if is_binary_stream(open_file):
+        encode = codecs.getincrementalencoder(encoding)().encode
+        byte_order_mark = encode('')
+        if byte_order_mark:
+            write(byte_order_mark)
+    else:
+        encode = None
+
+    buffer = []
+    buffered_characters = 0
+    for line in lines:
+        if isinstance(line, bytes):
+            if buffer:
+                data = ''.join(buffer)
+                write(data if encode is None else encode(data))
+                buffer = []
+                buffered_characters = 0
+            write(line.decode('utf-8') if encode is None else line)
+            continue
+
+        buffer.append(line)
+        buffered_characters += len(line)
+        if buffered_characters >= buffer_size:
+            data = ''.join(buffer)
+            write(data if encode is None else encode(data))
+            buffer = []
+            buffered_characters = 0
+
+    data = ''.join(buffer)
+    if encode is not None:
+        data = encode(data, True)
+    if data:
+        write(data)
+
+
+def write_elements(element, open_file, encoding=DEFAULT_ENCODING, line_terminator=None,
+                   buffer_size=DEFAULT_BUFFER_SIZE):
+    """Writes the GEDCOM lines of an element and all of its sub-elements to a text or binary file stream
+
+    The lines are streamed from `gedcom.writer.iter_lines()` and never held in memory all at once.
+
+    :type element: Element
+    :type open_file: a text or binary file stream
+    :type encoding: str
+    :type line_terminator: str | None
+    :type buffer_size: int
+    """
+    write_lines(iter_lines(element, line_terminator), open_file, encoding, buffer_size)
+
+
+class RecordSource(object):
+    """The byte ranges of the logical records of a parsed file, used to copy unchanged records when saving
+
+    Only records that were parsed from the file and aren't dirty, see `gedcom.element.element.Element.is_dirty()`,
+    get copied. The file must not change in between, which is checked by its size and modification time.
+    """
+
+    def __init__(self, file_path, records, offsets):
+        """
+        :type file_path: str
+        :type records: list of Element
+        :type offsets: list of int
+        """
+        self.__file_path = file_path
+        self.__file_stat = self.__get_file_stat(file_path)
+
+        # The records are kept, so that their ids can't be reused by new elements.
+        self.__records = list(records)
+        self.__indexes = {id(record): index for index, record in enumerate(self.__records)}
+        self.__offsets = offsets
+
+    @staticmethod
+    def __get_file_stat(file_path):
+        file_stat = os.stat(file_path)
+        return file_stat.st_size, file_stat.st_mtime_ns
+
+    def get_file_path(self):
+        """Returns the path of the parsed file
+        :rtype: str
+        """
+        return self.__file_path
+
+    def is_unchanged(self):
+        """Checks if the parsed file still has the same size and modification time
+        :rtype: bool
+        """
+        try:
+            return self.__get_file_stat(self.__file_path) == self.__file_stat
+        except OSError:
+            return False
+
+    def get_byte_range(self, record):
+        """Returns the start and end offset of a record in the parsed file, or `None` if it has to be written anew
+        :type record: Element
+        :rtype: tuple of int | None
+        """
+        index = self.__indexes.get(id(record))
+        if index is None or record.is_dirty():
+            return None
+        return self.__offsets[index], self.__offsets[index + 1]
+
+
+def track_records(file_path, records):
+    """Returns the byte ranges of the records parsed from a file and clears their dirty flags
+
+    Returns `None` if the records don't match the level 0 lines of the file, e.g. when it was parsed leniently.
+    A record is only copied when it ends with a line break, so that no following record can be appended to it.
+
+    :type file_path: str
+    :type records: list of Element
+    :rtype: RecordSource | None
+    """
+    with map_file(file_path) as data:
+        offsets = find_record_offsets(data)
+        if len(offsets) != len(records) + 1:
+            return None
+        if records and data[offsets[-1] - 1:offsets[-1]] != b'\n':
+            records = records[:-1]
+            offsets = offsets[:-1]
+
+    for record in records:
+        record.clear_dirty()
+    return RecordSource(file_path, records, offsets)
+
+
+def iter_record_chunks(records, data, record_source):
+    """Yields the lines of records to write anew, and the bytes of consecutive records copied from the parsed file
+
+    :type records: list of Element
+    :type data: bytes or mmap.mmap
+    :type record_source: RecordSource
+    :rtype: collections.abc.Iterator[str | bytes]
+    """
+    copy_start = copy_end = None
+    for record in records:
+        byte_range = record_source.get_byte_range(record)
+        if byte_range is not None and byte_range[0] == copy_end:
+            copy_end = byte_range[1]
+            continue
+
+        if copy_start is not None:
+            yield data[copy_start:copy_end]
+        if byte_range is not None:
+            copy_start, copy_end = byte_range
+            continue
+
+        copy_start = copy_end = None
+        for line in iter_lines(record):
+            yield line
+
+    if copy_start is not None:
+        yield data[copy_start:copy_end]
+
+
+def write_records(records, open_file, record_source, encoding=DEFAULT_ENCODING, line_terminator=None,
+                  buffer_size=DEFAULT_BUFFER_SIZE):
+    """Writes records to a text or binary file stream, copying the unchanged ones from the file they were parsed from
+
+    Falls back to writing all records anew if the parsed file changed, or if the data has to be written with
+    a `line_terminator` or to a binary file stream with a different encoding than UTF-8.
+
+    :type records: list of Element
+    :type open_file: a text or binary file stream
+    :type record_source: RecordSource
+    :type encoding: str
+    :type line_terminator: str | None
+    :type buffer_size: int
+    """
+    can_copy = line_terminator is None and (
+        not is_binary_stream(open_file) or codecs.lookup(encoding).name in ('utf-8', 'utf-8-sig')
+    )
+    if not can_copy or not record_source.is_unchanged():
+        write_lines((line for record in records for line in iter_lines(record, line_terminator)),
+                    open_file, encoding, buffer_size)
+        return
+
+    with map_file(record_source.get_file_path()) as data:
+        write_lines(iter_record_chunks(records, data, record_source), open_file, encoding, buffer_size)
@@ -0,0 +1,111 @@
+"""
+Module containing the sorted year indexes behind `gedcom.parser.Parser.individuals_born_between()`,
+`gedcom.parser.Parser.individuals_died_between()` and `gedcom.parser.Parser.individuals_married_between()`.
+"""
+
+from array import array
+from bisect import bisect_left, bisect_right
+from operator import itemgetter
+
+from python_gedcom_2.element.individual import IndividualElement
+import python_gedcom_2.tags
+
+YEAR_INDEX_BIRTH = python_gedcom_2.tags.GEDCOM_TAG_BIRTH
+YEAR_INDEX_DEATH = python_gedcom_2.tags.GEDCOM_TAG_DEATH
+YEAR_INDEX_MARRIAGE = python_gedcom_2.tags.GEDCOM_TAG_MARRIAGE
+
+UNKNOWN_YEAR = -1
+"""Year returned by e.g. `gedcom.element.individual.IndividualElement.get_birth_year()` if there is none"""
+
+
+class YearIndex(object):
+    """Elements sorted by a year, answering range queries by bisection
+
+    Years are held in an array parallel to the list of elements. Elements of the same year keep the order in
+    which they were added. An element can be added with several years, e.g. an individual married twice.
+    """
+
+    def __init__(self, years_and_elements):
+        """
+        :type years_and_elements: collections.abc.Iterable[tuple]
+        """
+        pairs = sorted(years_and_elements, key=itemgetter(0))
+        self.__years = array('q', [year for year, element in pairs])
+        self.__elements = [element for year, element in pairs]
+
+    def __len__(self):
+        return len(self.__elements)
+
+    def get_between(self, from_year, to_year):
+        """Returns the elements with a year from `from_year` to `to_year`, including both, ordered by year
+
+        An element with several years in the range is returned once, for the first of them.
+
+        :type from_year: int
+        :type to_year: int
+        :rtype: list of Element
+        """
+        elements = self.__elements[bisect_left(self.__years, from_year):bisect_right(self.__years, to_year)]
+        seen = set()
+        return [element for element in elements if not (id(element) in seen or seen.add(id(element)))]
+
+    def count_between(self, from_year, to_year):
+        """Returns the number of years from `from_year` to `to_year`, including both, without creating any list
+        :type from_year: int
+        :type to_year: int
+        :rtype: int
+        """
+        return bisect_right(self.__years, to_year) - bisect_left(self.__years, from_year)
+
+
+def build_year_indexes(records, element_dictionary):
+    """Builds the year indexes of birth, death and marriage of individuals in one pass over all records
+
+    Individuals without a year aren't indexed. The marriage years are the ones of
+    `gedcom.parser.Parser.get_marriage_years()`, found through the families an individual links to as a spouse.
+
+    :type records: list of Element
+    :type element_dictionary: dict[str, Element]
+    :rtype: dict[str, YearIndex]
+    """
+    birth_years = []
+    death_years = []
+    marriage_years = []
+    # Marriage years of each family, parsed once for all of its spouses
+    family_marriage_years = {}
+
+    for record in records:
+        if not isinstance(record, IndividualElement):
+            continue
+
+        birth_year = record.get_birth_year()
+        if birth_year != UNKNOWN_YEAR:
+            birth_years.append((birth_year, record))
+        death_year = record.get_death_year()
+        if death_year != UNKNOWN_YEAR:
+            death_years.append((death_year, record))
+
+        for family_link in record.get_child_elements_by_tag(python_gedcom_2.tags.GEDCOM_TAG_FAMILY_SPOUSE):
+            family_pointer = family_link.get_value()
+            if family_pointer not in element_dictionary:
+                continue
+            if family_pointer not in family_marriage_years:
+                family_marriage_years[family_pointer] = _get_marriage_years(element_dictionary[family_pointer])
+            marriage_years.extend((year, record) for year in family_marriage_years[family_pointer])
+
+    return {
+        YEAR_INDEX_BIRTH: YearIndex(birth_years),
+        YEAR_INDEX_DEATH: YearIndex(death_years),
+        YEAR_INDEX_MARRIAGE: YearIndex(marriage_years),
+    }
+
+
+def _get_marriage_years(family):
+    years = []
+    for marriage in family.get_child_elements_by_tag(python_gedcom_2.tags.GEDCOM_TAG_MARRIAGE):
+        for date in marriage.get_child_elements_by_tag(python_gedcom_2.tags.GEDCOM_TAG_DATE):
+            try:
+                years.append(int(date.get_value().split()[-1]))
+            except (IndexError, ValueError):
+                continue
+    return years
@@ -36,6 +36,7 @@ setup(
     extras_require={
         'dev': ['setuptools', 'wheel', 'twine', 'pdoc3'],
         'test': ['tox'],
+        'kinship': ['numpy', 'scipy'],
     },
     package_data={},
     data_files=[],
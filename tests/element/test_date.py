@@ -1,7 +1,10 @@
+from contextlib import redirect_stdout
+import io
 import unittest
 
 import python_gedcom_2.tags
 
+from python_gedcom_2.date_value import DATE_KIND_ABOUT
 from python_gedcom_2.element.date import DateElement, RETURN_FIRST_DATE
 
 
@@ -70,3 +73,25 @@ class TestDateElement(unittest.TestCase):
     def test_get_year__should_handle_case_where_year_cannot_be_parsed(self):
         date_element = DateElement(level=2, pointer="", tag=python_gedcom_2.tags.GEDCOM_TAG_DATE, value="banana")
         self.assertEqual(-1, date_element.get_year())
+
+    def test_get_year__should_not_print_anything_for_a_date_range(self):
+        date_element = DateElement(level=2, pointer="", tag=python_gedcom_2.tags.GEDCOM_TAG_DATE, value="BET 1920 AND 1985")
+        with redirect_stdout(io.StringIO()) as output:
+            date_element.get_year()
+        self.assertEqual("", output.getvalue())
+
+    def test_get_year__should_return_the_year_of_an_interpreted_date(self):
+        date_element = DateElement(level=2, pointer="", tag=python_gedcom_2.tags.GEDCOM_TAG_DATE, value="INT 1924 (about then)")
+        self.assertEqual(1924, date_element.get_year())
+
+    def test_get_year__should_fall_back_to_the_last_word_of_a_date_that_cannot_be_parsed(self):
+        date_element = DateElement(level=2, pointer="", tag=python_gedcom_2.tags.GEDCOM_TAG_DATE, value="1 JANUARY 1924")
+        self.assertEqual(1924, date_element.get_year())
+
+    # --------------------- START OF get_date_value TESTING -----------------------
+
+    def test_get_date_value__should_share_the_parsed_value_of_equal_dates(self):
+        date_element = DateElement(level=2, pointer="", tag=python_gedcom_2.tags.GEDCOM_TAG_DATE, value="ABT 5 JUN 1924")
+        other_date_element = DateElement(level=2, pointer="", tag=python_gedcom_2.tags.GEDCOM_TAG_DATE, value="ABT 5 JUN 1924")
+        self.assertIs(date_element.get_date_value(), other_date_element.get_date_value())
+        self.assertEqual(DATE_KIND_ABOUT, date_element.get_date_value().kind)
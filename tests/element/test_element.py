@@ -1,3 +1,4 @@
+import tracemalloc
 import unittest
 
 from python_gedcom_2.element.element import Element
@@ -10,6 +11,7 @@ from python_gedcom_2.element.file import FileElement
 
 from python_gedcom_2.element.family import FamilyElement
 from python_gedcom_2.element.root import RootElement
+from python_gedcom_2.element_creator import ElementCreator
 
 
 class TestElement(unittest.TestCase):
@@ -20,6 +22,22 @@ class TestElement(unittest.TestCase):
     # TODO: test_get_multi_line_value__should_get_and_combine_multiline_values
     # TODO: test_get_multi_line_value__should_return_original_value_passed_into_set_multi_line_value
 
+    def test_get_multi_line_value__should_be_cached_until_a_line_changes(self):
+        element = Element(1, "", "NOTE", "first", "\r\n", multi_line=False)
+        element.new_child_element("CONC", value=" part")
+        continued = element.new_child_element("CONT", value="second")
+
+        multi_line_value = element.get_multi_line_value()
+        self.assertEqual("first part\r\nsecond", multi_line_value)
+        self.assertIs(multi_line_value, element.get_multi_line_value())
+
+        continued.set_value("changed")
+        self.assertEqual("first part\r\nchanged", element.get_multi_line_value())
+        element.new_child_element("CONC", value=" more")
+        self.assertEqual("first part\r\nchanged more", element.get_multi_line_value())
+        element.get_child_elements().pop()
+        self.assertEqual("first part\r\nchanged", element.get_multi_line_value())
+
     # --------------------- START OF set_multi_line_value TESTING -----------------------
 
     def test_set_multi_line_value__should_take_single_line_value_and_put_it_in_value_of_this_element(self):
@@ -66,6 +84,48 @@ class TestElement(unittest.TestCase):
         self.assertEqual(1, len(child_elements))
         self.assertEqual("1 JUN 2019", child_elements[0].get_value())
 
+    def test_set_multi_line_value__should_split_long_lines_into_concatenations_of_at_most_255_characters(self):
+        element = Element(1, "", "NOTE", "", multi_line=False)
+        multiline_value = "x" * 600 + "\n" + "word " * 100
+        element.set_multi_line_value(multiline_value)
+
+        lines = element.to_gedcom_string(True).splitlines(True)
+        self.assertEqual(["1 NOTE", "2 CONC", "2 CONC", "2 CONT", "2 CONC", "2 CONC"], [" ".join(line.split()[:2]) for line in lines])
+        self.assertTrue(all(len(line.rstrip("\n")) <= 255 for line in lines))
+        self.assertEqual(multiline_value, element.get_multi_line_value())
+
+    def test_set_multi_line_value__should_not_end_a_concatenated_line_with_a_space(self):
+        element = Element(1, "", "NOTE", "", multi_line=False)
+        element.set_multi_line_value("x" * 246 + "   y")
+
+        self.assertEqual("x" * 246, element.get_value())
+        self.assertEqual(["   y"], [child.get_value() for child in element.get_child_elements()])
+
+    def test_set_multi_line_value__should_split_lines_like_splitlines(self):
+        element = Element(1, "", "NOTE", "", multi_line=False)
+        element.set_multi_line_value("first\n")
+        self.assertEqual("1 NOTE first\n", element.to_gedcom_string(True))
+
+        element.set_multi_line_value("first\x0bsecond\u2028third\x85fourth")
+        self.assertEqual("1 NOTE first\n2 CONT second\n2 CONT third\n2 CONT fourth\n", element.to_gedcom_string(True))
+
+    def test_set_multi_line_value__should_hold_the_whole_value_when_collapsed(self):
+        element = Element(1, "", "NOTE", "", multi_line=False)
+        element.new_child_element("CONC", value="original concatenation")
+        multiline_value = "x" * 300 + "\nsecond line"
+        element.set_multi_line_value(multiline_value, collapse=True)
+
+        self.assertTrue(element.is_collapsed())
+        self.assertEqual([], element.get_child_elements())
+        self.assertEqual(multiline_value, element.get_value())
+        self.assertEqual(multiline_value, element.get_multi_line_value())
+
+        split_element = Element(1, "", "NOTE", "", multi_line=False)
+        split_element.set_multi_line_value(multiline_value)
+        self.assertFalse(split_element.is_collapsed())
+        self.assertEqual(split_element.to_gedcom_string(True), element.to_gedcom_string(True))
+        self.assertEqual(split_element.to_gedcom_string(True), element.to_gedcom_string())
+
     # --------------------- START OF new_child_element TESTING -----------------------
 
     def test_new_child_element__should_create_a_child_family_element(self):
@@ -100,6 +160,55 @@ class TestElement(unittest.TestCase):
         self.assertEqual("@O1@", child_element.get_pointer())
         self.assertEqual("", child_element.get_value())
 
+    # --------------------- START OF get_child_elements_by_tag TESTING -----------------------
+
+    def test_get_child_elements_by_tag__should_return_children_with_the_tag_in_their_original_order(self):
+        element = IndividualElement(0, "@I1@", "INDI", "")
+        first_name = element.new_child_element("NAME", value="First /Name/")
+        element.new_child_element("SEX", value="M")
+        second_name = element.new_child_element("NAME", value="Second /Name/")
+
+        self.assertEqual([first_name, second_name], element.get_child_elements_by_tag("NAME"))
+        self.assertEqual([], element.get_child_elements_by_tag("BIRT"))
+        self.assertIs(first_name, element.get_first_child("NAME"))
+        self.assertIsNone(element.get_first_child("BIRT"))
+
+    def test_get_child_elements_by_tag__should_stay_consistent_when_adding_children(self):
+        element = IndividualElement(0, "@I1@", "INDI", "")
+        self.assertEqual([], element.get_child_elements_by_tag("SEX"))
+
+        element.new_child_element("SEX", value="M")
+        self.assertEqual("M", element.get_gender())
+        element.add_child_element(Element(1, "", "SEX", "F"))
+        self.assertEqual("F", element.get_gender())
+
+        element.get_child_elements().append(Element(1, "", "OCCU", "Baker"))
+        self.assertEqual("Baker", element.get_occupation())
+
+    def test_get_child_elements_by_tag__should_stay_consistent_when_removing_and_adding_children(self):
+        element = IndividualElement(0, "@I1@", "INDI", "")
+        element.new_child_element("NAME", value="First /Name/")
+        sex = element.new_child_element("SEX", value="M")
+        self.assertEqual("M", element.get_gender())
+
+        element.get_child_elements().remove(sex)
+        female = element.new_child_element("SEX", value="F")
+        self.assertEqual("F", element.get_gender())
+        self.assertEqual([female], element.get_child_elements_by_tag("SEX"))
+
+        element.get_child_elements().remove(female)
+        element.get_child_elements().append(Element(1, "", "SEX", "U"))
+        self.assertEqual("U", element.get_gender())
+
+    def test_get_child_elements_by_tag__should_stay_consistent_when_setting_a_multi_line_value(self):
+        element = RootElement()
+        element.set_multi_line_value("first line\nsecond line")
+        self.assertEqual(1, len(element.get_child_elements_by_tag("CONT")))
+
+        element.set_multi_line_value("single line")
+        self.assertEqual([], element.get_child_elements_by_tag("CONT"))
+        self.assertEqual([], element.get_child_elements_by_tag("CONC"))
+
     # --------------------- START OF to_gedcom_string TESTING -----------------------
 
     def test_to_gedcom_string__should_combine_only_the_mandatory_values_non_recursively_for_an_indi_nodes_values(self):
@@ -126,3 +235,64 @@ class TestElement(unittest.TestCase):
     # TODO: test_to_gedcom_string__should_
     # TODO: test_to_gedcom_string__should_
     # TODO: test_to_gedcom_string__should_
+
+    # --------------------- START OF is_dirty TESTING -----------------------
+
+    def test_is_dirty__should_be_set_up_to_the_record_by_changes_of_a_sub_element(self):
+        root_element = RootElement()
+        record = root_element.new_child_element("INDI", "@I1@")
+        birth = record.new_child_element("BIRT")
+        date = birth.new_child_element("DATE", value="1 JAN 1900")
+        other_record = root_element.new_child_element("INDI", "@I2@")
+        root_element.clear_dirty()
+        self.assertEqual([False, False, False, False], [element.is_dirty() for element in [root_element, record, birth, date]])
+
+        date.set_value("2 JAN 1900")
+        self.assertEqual([True, True, True, True], [element.is_dirty() for element in [root_element, record, birth, date]])
+        self.assertFalse(other_record.is_dirty())
+
+        record.clear_dirty()
+        record.get_child_elements()[0].new_child_element("PLAC", value="Berlin")
+        self.assertEqual([True, True, False], [element.is_dirty() for element in [record, birth, date]])
+
+    # --------------------- START OF memory usage TESTING -----------------------
+
+    def test_element_classes__should_not_have_an_instance_dictionary(self):
+        for tag, element_class in ElementCreator.get_element_classes().items():
+            element = element_class(1, "", tag, "", multi_line=False)
+            self.assertFalse(hasattr(element, '__dict__'), element_class.__name__)
+        self.assertFalse(hasattr(RootElement(), '__dict__'))
+
+    def test_element__should_use_less_memory_per_element_than_with_an_instance_dictionary(self):
+        class DictionaryElement(object):
+            # The same attributes as `Element`, kept in an instance dictionary like before it used `__slots__`
+            def __init__(self, level, pointer, tag, value, crlf):
+                self.level = level
+                self.pointer = pointer
+                self.tag = tag
+                self.value = value
+                self.crlf = crlf
+                self.children = []
+                self.parent = None
+                self.children_by_tag = None
+                self.indexed_child_count = 0
+                self.flags = 0
+                self.multi_line_value = None
+
+        bytes_per_element = self._measure_bytes_per_element(
+            lambda: ElementCreator.create_element(2, "", "DATE", "", "\n", is_multiline=False))
+        bytes_per_dictionary_element = self._measure_bytes_per_element(lambda: DictionaryElement(2, "", "DATE", "", "\n"))
+
+        self.assertLess(bytes_per_element, bytes_per_dictionary_element,
+                        "%.1f bytes per element" % bytes_per_element)
+
+    @staticmethod
+    def _measure_bytes_per_element(create_element, element_count=10000):
+        tracemalloc.start()
+        try:
+            memory_before = tracemalloc.get_traced_memory()[0]
+            elements = [create_element() for _ in range(element_count)]
+            bytes_per_element = (tracemalloc.get_traced_memory()[0] - memory_before) / len(elements)
+        finally:
+            tracemalloc.stop()
+        return bytes_per_element
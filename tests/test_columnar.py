@@ -0,0 +1,104 @@
+import unittest
+from unittest import mock
+
+import python_gedcom_2.columnar
+from python_gedcom_2.columnar import ColumnarTree, NO_INDEX
+from python_gedcom_2.element.individual import IndividualElement
+from python_gedcom_2.parser import Parser, GedcomFormatViolationError
+import python_gedcom_2.tags
+
+
+class TestColumnarTree(unittest.TestCase):
+
+    def setUp(self):
+        self.parser = Parser()
+        self.parser.parse_file('../tests/files/Musterstammbaum.ged')
+        self.tree = ColumnarTree.from_file('../tests/files/Musterstammbaum.ged')
+
+    # --------------------- START OF from_file TESTING -----------------------
+
+    def test_from_file__should_store_every_line_in_the_order_of_the_file(self):
+        elements = self.parser.get_element_list()
+        self.assertEqual(len(elements), len(self.tree))
+        for index, element in enumerate(elements):
+            self.assertEqual(element.get_level(), self.tree.get_level(index))
+            self.assertEqual(element.get_pointer(), self.tree.get_pointer(index))
+            self.assertEqual(element.get_tag(), self.tree.get_tag(index))
+            self.assertEqual(element.get_value(), self.tree.get_value(index))
+
+    def test_from_file__should_store_the_same_tree_when_memory_mapping_the_file(self):
+        mapped_tree = ColumnarTree.from_file('../tests/files/Musterstammbaum.ged', mmap=True)
+        self.assertEqual([record.to_gedcom_string(True) for record in self.tree.get_root_child_elements()],
+                         [record.to_gedcom_string(True) for record in mapped_tree.get_root_child_elements()])
+
+    def test_from_stream__should_raise_an_exception_when_on_strict_mode_and_lines_skip_a_level(self):
+        self.assertRaises(GedcomFormatViolationError, ColumnarTree.from_stream, [b"0 @I1@ INDI\n", b"2 NAME First /Last/\n"])
+
+    # --------------------- START OF structure TESTING -----------------------
+
+    def test_get_root_child_elements__should_format_like_the_records_of_the_parser(self):
+        records = self.parser.get_root_child_elements()
+        columnar_records = self.tree.get_root_child_elements()
+        self.assertEqual(len(records), len(columnar_records))
+        for record, columnar_record in zip(records, columnar_records):
+            self.assertEqual(record.to_gedcom_string(True), columnar_record.to_gedcom_string(True))
+            self.assertIsNone(columnar_record.get_parent_element())
+
+    def test_get_child_indexes__should_follow_first_child_and_next_sibling(self):
+        use_case = [b"0 @I1@ INDI\n", b"1 NAME First /Last/\n", b"1 BIRT\n", b"2 DATE 1 JAN 1900\n", b"0 @F1@ FAM\n"]
+        tree = ColumnarTree.from_stream(use_case)
+
+        self.assertEqual([0, 4], tree.get_record_indexes())
+        self.assertEqual([1, 2], tree.get_child_indexes(0))
+        self.assertEqual(1, tree.get_first_child(0))
+        self.assertEqual(2, tree.get_next_sibling(1))
+        self.assertEqual(NO_INDEX, tree.get_next_sibling(2))
+        self.assertEqual(2, tree.get_parent(3))
+        self.assertEqual(NO_INDEX, tree.get_first_child(4))
+        self.assertEqual(0, tree.get_element(3).get_parent_element().get_parent_element().get_index())
+
+    def test_get_element_by_pointer__should_return_a_view_of_the_record(self):
+        element = self.tree.get_element_by_pointer('@1@')
+        self.assertEqual(self.parser.get_element_by_pointer('@1@').to_gedcom_string(True), element.to_gedcom_string(True))
+        self.assertEqual(element, self.tree.get_element_by_pointer('@1@'))
+        self.assertIsNone(self.tree.get_element_by_pointer('@999@'))
+
+    # --------------------- START OF find_indexes_by_tag TESTING -----------------------
+
+    def test_find_indexes_by_tag__should_find_every_date_of_a_birth(self):
+        expected_dates = [child.get_value() for element in self.parser.get_element_list()
+                          if element.get_tag() == python_gedcom_2.tags.GEDCOM_TAG_BIRTH
+                          for child in element.get_child_elements() if child.get_tag() == python_gedcom_2.tags.GEDCOM_TAG_DATE]
+
+        dates = self.tree.find_elements_by_tag(python_gedcom_2.tags.GEDCOM_TAG_DATE, python_gedcom_2.tags.GEDCOM_TAG_BIRTH)
+        self.assertTrue(expected_dates)
+        self.assertEqual(expected_dates, [date.get_value() for date in dates])
+
+    def test_find_indexes_by_tag__should_return_nothing_for_an_unknown_tag(self):
+        self.assertEqual([], self.tree.find_indexes_by_tag('_UNKNOWN'))
+        self.assertEqual([], self.tree.find_indexes_by_tag(python_gedcom_2.tags.GEDCOM_TAG_DATE, '_UNKNOWN'))
+
+    def test_find_indexes_by_tag__should_find_the_same_indexes_without_numpy(self):
+        for tag, parent_tag in [(python_gedcom_2.tags.GEDCOM_TAG_DATE, python_gedcom_2.tags.GEDCOM_TAG_BIRTH),
+                                (python_gedcom_2.tags.GEDCOM_TAG_INDIVIDUAL, None),
+                                (python_gedcom_2.tags.GEDCOM_TAG_INDIVIDUAL, python_gedcom_2.tags.GEDCOM_TAG_FAMILY)]:
+            indexes = self.tree.find_indexes_by_tag(tag, parent_tag)
+            with mock.patch.object(python_gedcom_2.columnar, 'numpy', None):
+                self.assertEqual(indexes, self.tree.find_indexes_by_tag(tag, parent_tag))
+
+    # --------------------- START OF ColumnarElement TESTING -----------------------
+
+    def test_get_multi_line_value__should_combine_concatenations_and_continuations(self):
+        use_case = [b"0 @N1@ NOTE first\r\n", b"1 CONC  part\r\n", b"1 CONT second line\r\n"]
+        tree = ColumnarTree.from_stream(use_case)
+        parser = Parser()
+        parser.parse(use_case)
+
+        self.assertEqual(parser.get_root_child_elements()[0].get_multi_line_value(),
+                         tree.get_element(0).get_multi_line_value())
+
+    def test_to_element__should_create_an_actual_element_with_all_sub_elements(self):
+        element = self.tree.get_element_by_pointer('@1@').to_element()
+        self.assertTrue(isinstance(element, IndividualElement))
+        self.assertEqual(self.parser.get_element_by_pointer('@1@').to_gedcom_string(True), element.to_gedcom_string(True))
+        self.assertEqual(self.parser.get_element_by_pointer('@1@').get_name(), element.get_name())
@@ -0,0 +1,79 @@
+import unittest
+
+from python_gedcom_2.date_value import CALENDAR_FRENCH, CALENDAR_GREGORIAN, CALENDAR_HEBREW, CALENDAR_JULIAN, \
+    DATE_KIND_AFTER, DATE_KIND_BEFORE, DATE_KIND_BETWEEN, DATE_KIND_EXACT, DATE_KIND_FROM_TO, DATE_KIND_INTERPRETED, \
+    DATE_KIND_INVALID, DATE_KIND_PHRASE, DATE_KIND_TO, NO_YEAR, RETURN_FIRST_DATE, CalendarDate, parse_date
+
+
+class TestDateValue(unittest.TestCase):
+
+    # --------------------- START OF parse_date TESTING -----------------------
+
+    def test_parse_date__should_parse_the_parts_of_a_date(self):
+        date_value = parse_date("5 JUN 1924")
+        self.assertEqual(DATE_KIND_EXACT, date_value.kind)
+        self.assertEqual(CalendarDate(CALENDAR_GREGORIAN, 5, 6, 1924), date_value.first)
+        self.assertIsNone(date_value.second)
+
+    def test_parse_date__should_parse_qualifiers_ranges_and_periods(self):
+        self.assertEqual(DATE_KIND_BEFORE, parse_date("BEF 1900").kind)
+        self.assertEqual(DATE_KIND_AFTER, parse_date("aft MAR 1900").kind)
+        self.assertEqual(DATE_KIND_TO, parse_date("TO 1950").kind)
+        self.assertTrue(parse_date("EST 1900").is_approximated())
+
+        date_value = parse_date("BET JAN 1900 AND @#DJULIAN@ 1950")
+        self.assertEqual(DATE_KIND_BETWEEN, date_value.kind)
+        self.assertEqual(CalendarDate(CALENDAR_JULIAN, 0, 0, 1950), date_value.second)
+
+        date_value = parse_date("FROM 1 JAN 1900 TO DEC 1950")
+        self.assertEqual(DATE_KIND_FROM_TO, date_value.kind)
+        self.assertEqual(1900, date_value.get_year(RETURN_FIRST_DATE))
+        self.assertEqual(1950, date_value.get_year())
+
+    def test_parse_date__should_parse_interpreted_dates_and_phrases(self):
+        date_value = parse_date("INT 1900 (about then)")
+        self.assertEqual(DATE_KIND_INTERPRETED, date_value.kind)
+        self.assertEqual("about then", date_value.phrase)
+        self.assertEqual(1900, date_value.get_year())
+
+        date_value = parse_date("(unknown)")
+        self.assertEqual(DATE_KIND_PHRASE, date_value.kind)
+        self.assertEqual(NO_YEAR, date_value.get_year())
+        self.assertIsNone(date_value.get_julian_day_range())
+
+    def test_parse_date__should_parse_dual_years_and_years_before_christ(self):
+        date_value = parse_date("5 FEB 1699/00")
+        self.assertEqual(1699, date_value.first.year)
+        self.assertEqual(1700, date_value.first.dual_year)
+        self.assertEqual(parse_date("5 FEB 1700").get_julian_day_range(), date_value.get_julian_day_range())
+
+        self.assertTrue(parse_date("44 B.C.").first.is_bc)
+        self.assertEqual(NO_YEAR, parse_date("44 B.C.").get_year())
+
+    def test_parse_date__should_mark_dates_that_cannot_be_parsed_as_invalid(self):
+        for value in ["", "  ", "banana", "1 JANUARY 1900", "29 FEB 1900", "BET 1900", "32 JAN 1900"]:
+            self.assertEqual(DATE_KIND_INVALID, parse_date(value).kind, value)
+            self.assertFalse(parse_date(value).is_valid(), value)
+
+    def test_parse_date__should_return_the_same_value_for_equal_strings(self):
+        self.assertIs(parse_date("ABT 1924"), parse_date("ABT 1924"))
+
+    # --------------------- START OF get_julian_day_range TESTING -----------------------
+
+    def test_get_julian_day_range__should_convert_each_calendar(self):
+        # 16 SEP 2023, the Hebrew new year 5784 and 24 SEP 1803, the French new year 12
+        self.assertEqual((2460204, 2460204), parse_date("16 SEP 2023").get_julian_day_range())
+        self.assertEqual((2460204, 2460204), parse_date("@#DJULIAN@ 3 SEP 2023").get_julian_day_range())
+        self.assertEqual((2460204, 2460204), parse_date("%s 1 TSH 5784" % CALENDAR_HEBREW).get_julian_day_range())
+        self.assertEqual((2379858, 2379858), parse_date("%s 1 VEND 12" % CALENDAR_FRENCH).get_julian_day_range())
+
+    def test_get_julian_day_range__should_cover_the_whole_month_or_year(self):
+        self.assertEqual((2415021, 2415385), parse_date("1900").get_julian_day_range())
+        self.assertEqual((2415052, 2415079), parse_date("FEB 1900").get_julian_day_range())
+        self.assertEqual((None, 2415385), parse_date("BEF 1900").get_julian_day_range())
+        self.assertEqual((2415021, None), parse_date("AFT 1900").get_julian_day_range())
+
+    def test_get_sort_key__should_sort_dates_chronologically(self):
+        values = ["(unknown)", "1901", "@#DJULIAN@ 1 DEC 1900", "BEF 1 JAN 1900", "ABT JUN 1900"]
+        self.assertEqual(["BEF 1 JAN 1900", "ABT JUN 1900", "@#DJULIAN@ 1 DEC 1900", "1901", "(unknown)"],
+                         sorted(values, key=lambda value: parse_date(value).get_sort_key()))
@@ -20,6 +20,7 @@ from python_gedcom_2.element.date import DateElement
 from python_gedcom_2.element.death import DeathElement
 from python_gedcom_2.element.divorce import DivorceElement
 from python_gedcom_2.element.divorce_filed import DivorceFiledElement
+from python_gedcom_2.element.element import Element
 from python_gedcom_2.element.education import EducationElement
 from python_gedcom_2.element.emigration import EmigrationElement
 from python_gedcom_2.element.engagement import EngagementElement
@@ -254,3 +255,47 @@ class TestElementCreator(unittest.TestCase):
     def test_create_element__can_create_a_will_element(self):
         element = ElementCreator.create_element(0, "", tags.GEDCOM_TAG_WILL, "", "\n")
         self.assertTrue(isinstance(element, WillElement), element)
+
+    def test_create_element__can_create_a_plain_element_for_an_unknown_tag(self):
+        element = ElementCreator.create_element(0, "", "_UNKNOWN", "", "\n")
+        self.assertIs(Element, type(element))
+
+    # --------------------- START OF register_element_class TESTING -----------------------
+
+    def test_register_element_class__can_create_a_registered_element_for_a_program_defined_tag(self):
+        class MilitaryServiceElement(Element):
+            pass
+
+        ElementCreator.register_element_class("_MILT", MilitaryServiceElement)
+        try:
+            element = ElementCreator.create_element(1, "", "_MILT", "", "\n")
+            self.assertTrue(isinstance(element, MilitaryServiceElement), element)
+            self.assertIs(MilitaryServiceElement, ElementCreator.get_element_classes()["_MILT"])
+        finally:
+            ElementCreator.unregister_element_class("_MILT")
+
+        self.assertIs(Element, type(ElementCreator.create_element(1, "", "_MILT", "", "\n")))
+
+    def test_unregister_element_class__should_restore_the_built_in_element_class(self):
+        class CustomIndividualElement(IndividualElement):
+            pass
+
+        ElementCreator.register_element_class(tags.GEDCOM_TAG_INDIVIDUAL, CustomIndividualElement)
+        try:
+            element = ElementCreator.create_element(0, "@I1@", tags.GEDCOM_TAG_INDIVIDUAL, "", "\n")
+            self.assertIs(CustomIndividualElement, type(element))
+        finally:
+            ElementCreator.unregister_element_class(tags.GEDCOM_TAG_INDIVIDUAL)
+
+        element = ElementCreator.create_element(0, "@I1@", tags.GEDCOM_TAG_INDIVIDUAL, "", "\n")
+        self.assertIs(IndividualElement, type(element))
+        self.assertIs(IndividualElement, ElementCreator.get_element_classes()[tags.GEDCOM_TAG_INDIVIDUAL])
+
+    def test_register_element_class__should_raise_an_exception_if_not_passed_an_element_class(self):
+        self.assertRaises(TypeError, ElementCreator.register_element_class, "_MILT", object)
+
+    def test_get_element_classes__should_not_be_modifiable(self):
+        element_classes = ElementCreator.get_element_classes()
+        self.assertIs(BirthElement, element_classes[tags.GEDCOM_TAG_BIRTH])
+        with self.assertRaises(TypeError):
+            element_classes["_MILT"] = Element
@@ -0,0 +1,72 @@
+import unittest
+
+from python_gedcom_2.handler import GedcomHandler
+from python_gedcom_2.parser import Parser, GedcomFormatViolationError
+
+
+class RecordingHandler(GedcomHandler):
+
+    def __init__(self):
+        self.events = []
+
+    def start_element(self, level, pointer, tag, value):
+        self.events.append(("start", level, pointer, tag, value))
+
+    def end_element(self, level, pointer, tag):
+        self.events.append(("end", level, pointer, tag))
+
+
+class TestGedcomHandler(unittest.TestCase):
+
+    def test_parse_events__should_report_nested_start_and_end_events_in_order(self):
+        use_case = """
+            0 @I1@ INDI
+                1 NAME First /Last/
+                1 BIRT
+                    2 DATE 1 JAN 1900
+            0 @F1@ FAM
+            """
+        handler = RecordingHandler()
+        Parser().parse_events(self._convert_gedcom_string_into_parsable_content(use_case), handler)
+        self.assertEqual([
+            ("start", 0, "@I1@", "INDI", ""),
+            ("start", 1, "", "NAME", "First /Last/"),
+            ("end", 1, "", "NAME"),
+            ("start", 1, "", "BIRT", ""),
+            ("start", 2, "", "DATE", "1 JAN 1900"),
+            ("end", 2, "", "DATE"),
+            ("end", 1, "", "BIRT"),
+            ("end", 0, "@I1@", "INDI"),
+            ("start", 0, "@F1@", "FAM", ""),
+            ("end", 0, "@F1@", "FAM"),
+        ], handler.events)
+
+    def test_parse_events__should_turn_a_line_without_level_into_a_concatenation(self):
+        use_case = """
+            0 @I5@ INDI
+                1 NOTE This is a note field
+                that is continued on the next line.
+            """
+        handler = RecordingHandler()
+        Parser().parse_events(self._convert_gedcom_string_into_parsable_content(use_case), handler, strict=False)
+        self.assertIn(("start", 2, None, "CONC", "that is continued on the next line."), handler.events)
+
+    def test_parse_events__should_raise_an_exception_when_a_line_jumps_one_or_more_levels(self):
+        mismatched_levels_use_case = """
+            0 @I5@ INDI
+                    2 NAME First /Last/
+            """
+        self.assertRaises(GedcomFormatViolationError, Parser().parse_events,
+                          self._convert_gedcom_string_into_parsable_content(mismatched_levels_use_case), GedcomHandler())
+
+    def test_parse_file_events__should_report_every_line(self):
+        handler = RecordingHandler()
+        Parser().parse_file_events('../tests/files/Musterstammbaum.ged', handler)
+        self.assertEqual(396, len([event for event in handler.events if event[0] == "start"]))
+        self.assertEqual(396, len([event for event in handler.events if event[0] == "end"]))
+
+    # ------------------------------ START OF HELPER METHODS -----------------------
+
+    @staticmethod
+    def _convert_gedcom_string_into_parsable_content(gedcom_file_contents_test_string):
+        return [(a.strip() + '\n').encode('utf-8-sig') for a in gedcom_file_contents_test_string.strip().splitlines()]
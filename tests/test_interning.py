@@ -0,0 +1,64 @@
+import unittest
+
+from python_gedcom_2.interning import ValuePool, intern_bytes_tag, intern_tag
+import python_gedcom_2.tags
+
+
+class TestInterning(unittest.TestCase):
+
+    # --------------------- START OF intern_tag TESTING -----------------------
+
+    def test_intern_tag__should_return_the_constant_of_a_known_tag(self):
+        tag = "".join(["NA", "ME"])
+        self.assertIsNot(python_gedcom_2.tags.GEDCOM_TAG_NAME, tag)
+        self.assertIs(python_gedcom_2.tags.GEDCOM_TAG_NAME, intern_tag(tag))
+
+    def test_intern_tag__should_return_the_same_object_for_equal_unknown_tags(self):
+        self.assertIs(intern_tag("".join(["_CUS", "TOM"])), intern_tag("".join(["_CU", "STOM"])))
+
+    def test_intern_bytes_tag__should_decode_a_tag_to_its_constant(self):
+        self.assertIs(python_gedcom_2.tags.GEDCOM_TAG_DATE, intern_bytes_tag(b"DATE"))
+        self.assertEqual("_CUSTOM", intern_bytes_tag(b"_CUSTOM"))
+
+    # --------------------- START OF ValuePool TESTING -----------------------
+
+    def test_intern__should_return_the_pooled_value_for_equal_values(self):
+        pool = ValuePool()
+        first_value = pool.intern("".join(["Nat", "ural"]))
+        self.assertIs(first_value, pool.intern("".join(["Natu", "ral"])))
+        self.assertEqual(1, len(pool))
+
+    def test_intern__should_not_pool_more_than_max_size_values(self):
+        pool = ValuePool(max_size=2)
+        for value in ("Natural", "Adopted", "Foster"):
+            pool.intern(value)
+
+        unpooled_value = "".join(["Fos", "ter"])
+        self.assertIs(unpooled_value, pool.intern(unpooled_value))
+        self.assertEqual(2, len(pool))
+
+    def test_intern__should_not_pool_values_longer_than_max_length(self):
+        pool = ValuePool(max_length=3)
+        pool.intern("long value")
+        self.assertEqual(0, len(pool))
+
+    def test_get_statistics__should_count_deduplicated_values(self):
+        pool = ValuePool()
+        for value in ("M", "F", "M", "", "M"):
+            pool.intern(value)
+
+        statistics = pool.get_statistics()
+        self.assertEqual(4, statistics['values'])
+        self.assertEqual(2, statistics['deduplicated_values'])
+        self.assertEqual(2, statistics['deduplicated_characters'])
+        self.assertEqual(2, statistics['pool_size'])
+        self.assertTrue(pool.get_report().startswith("Deduplicated 2 of 4 values (50.0%), 2 of 4 characters (50.0%)"))
+
+    def test_clear__should_empty_the_pool_and_reset_the_statistics(self):
+        pool = ValuePool()
+        pool.intern("M")
+        pool.intern("M")
+        pool.clear()
+
+        self.assertEqual(0, len(pool))
+        self.assertEqual(0, pool.get_statistics()['values'])
@@ -0,0 +1,164 @@
+import unittest
+from unittest import mock
+
+from python_gedcom_2.element.individual import NotAnActualIndividualError
+import python_gedcom_2.kinship
+from python_gedcom_2.kinship import KinshipCalculator
+from python_gedcom_2.parser import Parser, PedigreeCycleError
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+try:
+    import scipy.sparse
+except ImportError:
+    scipy = None
+
+
+class TestKinship(unittest.TestCase):
+
+    def setUp(self):
+        self.parser = Parser()
+        self.parser.parse(self._convert_gedcom_string_into_parsable_content(self.PEDIGREE_USE_CASE))
+        self.calculator = KinshipCalculator(self.parser)
+
+    # --------------------- START OF get_kinship TESTING -----------------------
+
+    def test_get_kinship__should_compute_the_coefficients_of_known_relationships(self):
+        expected_coefficients = [
+            ("@G1@", "@G1@", 0.5),
+            ("@G1@", "@G2@", 0.0),
+            ("@G1@", "@P1@", 0.25),
+            ("@P1@", "@P2@", 0.25),
+            ("@P1@", "@P3@", 0.125),
+            ("@C1@", "@C2@", 0.0625),
+            ("@C2@", "@C1@", 0.0625),
+            ("@G1@", "@C1@", 0.125),
+            ("@C1@", "@X@", 0.28125),
+            ("@X@", "@X@", 0.53125),
+        ]
+        for individual, relative, coefficient in expected_coefficients:
+            self.assertAlmostEqual(coefficient, self.calculator.get_kinship(self.parser.get_element_by_pointer(individual),
+                                                                            self.parser.get_element_by_pointer(relative)),
+                                   msg=(individual, relative))
+
+    def test_get_kinship__should_raise_an_exception_if_not_passed_an_individual(self):
+        self.assertRaises(NotAnActualIndividualError, self.calculator.get_kinship,
+                          self.parser.get_element_by_pointer("@G1@"), self.parser.get_element_by_pointer("@F1@"))
+
+    def test_get_kinship__should_raise_an_exception_for_a_cycle(self):
+        cycle_use_case = """
+            0 @I1@ INDI
+                1 FAMC @F1@
+            0 @I2@ INDI
+                1 FAMC @F2@
+            0 @F1@ FAM
+                1 HUSB @I2@
+                1 CHIL @I1@
+            0 @F2@ FAM
+                1 HUSB @I1@
+                1 CHIL @I2@
+        """
+        parser = Parser()
+        parser.parse(self._convert_gedcom_string_into_parsable_content(cycle_use_case))
+        calculator = KinshipCalculator(parser)
+        self.assertRaises(PedigreeCycleError, calculator.get_inbreeding, parser.get_element_by_pointer("@I1@"))
+
+    # --------------------- START OF get_inbreeding TESTING -----------------------
+
+    def test_get_inbreeding__should_be_the_kinship_of_the_parents(self):
+        self.assertEqual(0.0, self.calculator.get_inbreeding(self.parser.get_element_by_pointer("@G1@")))
+        self.assertEqual(0.0, self.calculator.get_inbreeding(self.parser.get_element_by_pointer("@C1@")))
+        self.assertAlmostEqual(0.0625, self.calculator.get_inbreeding(self.parser.get_element_by_pointer("@X@")))
+
+    def test_get_inbreeding_coefficients__should_return_every_individual(self):
+        coefficients = self.calculator.get_inbreeding_coefficients()
+        self.assertEqual(11, len(coefficients))
+        self.assertEqual(["@X@"], [pointer for pointer, coefficient in coefficients.items() if coefficient > 0])
+
+    # --------------------- START OF get_kinship_matrix TESTING -----------------------
+
+    @unittest.skipIf(numpy is None, "NumPy is not installed")
+    def test_get_kinship_matrix__should_equal_the_coefficients_of_each_pair(self):
+        individuals = [element for element in self.parser.get_root_child_elements() if element.get_tag() == "INDI"]
+        individuals.reverse()
+        matrix = self.calculator.get_kinship_matrix(individuals)
+
+        self.assertEqual((11, 11), matrix.shape)
+        for row, individual in enumerate(individuals):
+            for column, relative in enumerate(individuals):
+                self.assertAlmostEqual(self.calculator.get_kinship(individual, relative), matrix[row, column])
+
+    @unittest.skipIf(scipy is None, "SciPy is not installed")
+    def test_get_kinship_matrix__should_return_a_sparse_matrix_of_only_the_given_individuals(self):
+        individuals = [self.parser.get_element_by_pointer("@C1@"), self.parser.get_element_by_pointer("@X@")]
+        matrix = self.calculator.get_kinship_matrix(individuals, sparse=True)
+
+        self.assertTrue(scipy.sparse.issparse(matrix))
+        self.assertEqual([[0.5, 0.28125], [0.28125, 0.53125]], matrix.toarray().tolist())
+
+    @unittest.skipIf(numpy is None or scipy is None, "NumPy or SciPy is not installed")
+    def test_get_kinship_matrix__should_compute_a_sparse_matrix_without_a_dense_one(self):
+        individuals = [element for element in self.parser.get_root_child_elements() if element.get_tag() == "INDI"]
+        dense_matrix = self.calculator.get_kinship_matrix(individuals)
+
+        # Without NumPy the kinship module can't create a dense array.
+        with mock.patch.object(python_gedcom_2.kinship, 'numpy', None):
+            sparse_matrix = KinshipCalculator(self.parser).get_kinship_matrix(individuals, sparse=True)
+
+        self.assertTrue(scipy.sparse.issparse(sparse_matrix))
+        self.assertTrue(numpy.allclose(dense_matrix, sparse_matrix.toarray()))
+        self.assertEqual(numpy.count_nonzero(dense_matrix), sparse_matrix.nnz)
+
+    # --------------------- HELPER METHODS -----------------------
+
+    # G1 and G2 have the children P1 and P2. G1 and G3 have the child P3. C1 is the child of P1 and S1, C2 of P2 and
+    # S2, so C1 and C2 are 1st cousins, and X is their child.
+    PEDIGREE_USE_CASE = """
+        0 @X@ INDI
+            1 FAMC @F5@
+        0 @C1@ INDI
+            1 FAMC @F3@
+        0 @C2@ INDI
+            1 FAMC @F4@
+        0 @P1@ INDI
+            1 FAMC @F1@
+        0 @P2@ INDI
+            1 FAMC @F1@
+        0 @P3@ INDI
+            1 FAMC @F2@
+        0 @S1@ INDI
+        0 @S2@ INDI
+        0 @G1@ INDI
+        0 @G2@ INDI
+        0 @G3@ INDI
+        0 @F1@ FAM
+            1 HUSB @G1@
+            1 WIFE @G2@
+            1 CHIL @P1@
+            1 CHIL @P2@
+        0 @F2@ FAM
+            1 HUSB @G1@
+            1 WIFE @G3@
+            1 CHIL @P3@
+        0 @F3@ FAM
+            1 HUSB @P1@
+            1 WIFE @S1@
+            1 CHIL @C1@
+        0 @F4@ FAM
+            1 HUSB @S2@
+            1 WIFE @P2@
+            1 CHIL @C2@
+        0 @F5@ FAM
+            1 HUSB @C1@
+            1 WIFE @C2@
+            1 CHIL @X@
+    """
+
+    @staticmethod
+    def _convert_gedcom_string_into_parsable_content(gedcom_file_contents_test_string):
+        # Ignores whitespace "lines" at the start and end of the string - allows prettier presentation in the tests.
+        # Ignores leading and trailing whitespace on each line - allows for indentation of lines to show clearer test strings.
+        return [(a.strip() + '\n').encode('utf-8-sig') for a in gedcom_file_contents_test_string.strip().splitlines()]
@@ -1,12 +1,20 @@
+import gc
+import io
+import os
+import tempfile
 import unittest
 
 from python_gedcom_2.element.family import NotAnActualFamilyError
 
+from python_gedcom_2.element.element import Element
 from python_gedcom_2.element.object import ObjectElement
 from python_gedcom_2.element.individual import IndividualElement, NotAnActualIndividualError
 from python_gedcom_2.element.root import RootElement
+from python_gedcom_2.interning import ValuePool
+import python_gedcom_2.tags
 from python_gedcom_2.parser import Parser, GedcomFormatViolationError, FAMILY_MEMBERS_TYPE_PARENTS, FAMILY_MEMBERS_TYPE_HUSBAND, FAMILY_MEMBERS_TYPE_WIFE, \
-    FAMILY_MEMBERS_TYPE_CHILDREN, PointerNotFoundException
+    FAMILY_MEMBERS_TYPE_CHILDREN, PedigreeCycleError, PointerNotFoundException, \
+    RELATION_TYPE_CHILD, RELATION_TYPE_PARENT, RELATION_TYPE_SIBLING, RELATION_TYPE_SPOUSE
 
 
 class TestParser(unittest.TestCase):
@@ -72,6 +80,161 @@ class TestParser(unittest.TestCase):
                 individuals_in_element_list += 1
         self.assertEqual(20, individuals_in_element_list)
 
+    def test_parse_file__should_create_the_same_elements_when_memory_mapping_the_file(self):
+        parser = Parser()
+        parser.parse_file('../tests/files/Musterstammbaum.ged')
+        mapped_parser = Parser()
+        mapped_parser.parse_file('../tests/files/Musterstammbaum.ged', mmap=True)
+
+        self.assertEqual(len(parser.get_element_list()), len(mapped_parser.get_element_list()))
+        for element, mapped_element in zip(parser.get_element_list(), mapped_parser.get_element_list()):
+            self.assertIs(type(element), type(mapped_element))
+            self.assertEqual(element.to_gedcom_string(), mapped_element.to_gedcom_string())
+
+    def test_parse_file__should_create_the_same_elements_in_the_same_order_when_using_workers(self):
+        parser = Parser()
+        parser.parse_file('../tests/files/Musterstammbaum.ged')
+        sharded_parser = Parser()
+        sharded_parser.parse_file('../tests/files/Musterstammbaum.ged', workers=3)
+
+        self.assertEqual(len(parser.get_element_list()), len(sharded_parser.get_element_list()))
+        for element, sharded_element in zip(parser.get_element_list(), sharded_parser.get_element_list()):
+            self.assertIs(type(element), type(sharded_element))
+            self.assertEqual(element.to_gedcom_string(), sharded_element.to_gedcom_string())
+        for record in sharded_parser.get_root_child_elements():
+            self.assertIs(sharded_parser.get_root_element(), record.get_parent_element())
+
+    def test_parse_file__should_raise_an_exception_with_the_line_number_of_the_file_when_using_workers(self):
+        gedcom_lines = [u"0 @I%d@ INDI\n1 NAME Name /Number%d/\n" % (number, number) for number in range(100)]
+        gedcom_lines.append(u"0 @I100@ INDI\n2 NAME Name /Number100/\n")
+        with tempfile.TemporaryDirectory() as directory:
+            file_path = os.path.join(directory, 'mismatched_levels.ged')
+            with open(file_path, 'wb') as gedcom_file:
+                gedcom_file.write(u"".join(gedcom_lines).encode('utf-8'))
+
+            with self.assertRaises(GedcomFormatViolationError) as context:
+                Parser().parse_file(file_path, workers=4)
+        self.assertTrue(str(context.exception).startswith("Line 202 of document"), str(context.exception))
+
+    def test_parse_file__should_create_the_same_records_when_lazy(self):
+        parser = Parser()
+        parser.parse_file('../tests/files/Musterstammbaum.ged')
+        lazy_parser = Parser()
+        lazy_parser.parse_file('../tests/files/Musterstammbaum.ged', lazy=True, cache_size=2)
+
+        self.assertEqual(len(parser.get_root_child_elements()), len(lazy_parser.get_root_child_elements()))
+        for record, lazy_record in zip(parser.get_root_child_elements(), lazy_parser.get_root_child_elements()):
+            self.assertIs(type(record), type(lazy_record))
+            self.assertEqual(record.to_gedcom_string(True), lazy_record.to_gedcom_string(True))
+        self.assertEqual(sorted(parser.get_element_dictionary()), sorted(lazy_parser.get_element_dictionary()))
+
+    def test_parse_file__should_create_records_on_access_and_keep_only_the_most_recently_used_when_lazy(self):
+        parser = Parser()
+        parser.parse_file('../tests/files/Musterstammbaum.ged', lazy=True, cache_size=2)
+        records = parser.get_root_child_elements()
+        self.assertEqual(0, records.get_cached_count())
+
+        individual = parser.get_element_by_pointer('@1@')
+        self.assertTrue(isinstance(individual, IndividualElement))
+        self.assertIs(individual, parser.get_element_by_pointer('@1@'))
+        self.assertTrue(isinstance(individual.get_parent_element(), RootElement))
+
+        for record in records:
+            pass
+        self.assertEqual(2, records.get_cached_count())
+        self.assertRaises(PointerNotFoundException, parser.get_element_by_pointer, '@999@')
+
+    def test_parse_file__should_add_all_records_to_the_root_element_when_lazy(self):
+        parser = Parser()
+        parser.parse_file('../tests/files/Musterstammbaum.ged', lazy=True, cache_size=2)
+        root_element = parser.get_root_element()
+
+        self.assertEqual(34, len(root_element.get_child_elements()))
+        self.assertIs(root_element.get_child_elements(), parser.get_root_child_elements())
+        self.assertEqual(396, len(parser.get_element_list()))
+
+    def test_parse_file__should_keep_one_element_dictionary_when_lazy(self):
+        parser = Parser()
+        parser.parse_file('../tests/files/Musterstammbaum.ged', lazy=True)
+        self.assertIs(parser.get_element_dictionary(), parser.get_element_dictionary())
+
+    def test_close__should_release_the_file_when_lazy(self):
+        with Parser() as parser:
+            parser.parse_file('../tests/files/Musterstammbaum.ged', lazy=True)
+            records = parser.get_root_child_elements()
+            self.assertTrue(isinstance(parser.get_element_by_pointer('@1@'), IndividualElement))
+
+        self.assertRaises(ValueError, records.__getitem__, 0)
+        self.assertEqual([], parser.get_root_child_elements())
+        self.assertEqual({}, parser.get_element_dictionary())
+
+    def test_parse_file__should_rebuild_the_indexes_after_adding_all_records_to_the_root_element_when_lazy(self):
+        parser = Parser()
+        parser.parse_file('../tests/files/Musterstammbaum.ged', lazy=True, cache_size=2)
+        parents = parser.get_parents(parser.get_element_by_pointer('@1@'))
+        births = parser.individuals_born_between(1900, 2000)
+        parser.get_root_element()
+
+        self.assertEqual(self._convert_element_list_to_pointer_list(parents),
+                         self._convert_element_list_to_pointer_list(parser.get_parents(parser.get_element_by_pointer('@1@'))))
+        self.assertEqual(self._convert_element_list_to_pointer_list(births),
+                         self._convert_element_list_to_pointer_list(parser.individuals_born_between(1900, 2000)))
+        self.assertTrue(parser.find_individuals("surname=Muster"))
+
+    def test_parse_file__should_not_keep_dropped_records_for_relationship_queries_when_lazy(self):
+        parser = Parser()
+        parser.parse_file('../tests/files/Musterstammbaum.ged', lazy=True, cache_size=2)
+        root_element = parser.get_element_by_pointer('@1@').get_parent_element()
+        pointers = [pointer for pointer in parser.get_element_dictionary() if pointer.startswith('@')]
+        for pointer in pointers:
+            individual = parser.get_element_by_pointer(pointer)
+            if isinstance(individual, IndividualElement):
+                parser.get_parents(individual)
+                parser.get_children(individual, "NAT")
+        individual = None
+
+        gc.collect()
+        records = [element for element in gc.get_objects() if isinstance(element, Element)
+                   and element.get_parent_element() is root_element]
+        self.assertTrue(len(records) <= 2, len(records))
+
+    def test_parse_file__should_raise_an_exception_with_the_line_number_of_the_file_when_accessing_a_record_when_lazy(self):
+        gedcom_lines = [u"0 @I%d@ INDI\n1 NAME Name /Number%d/\n" % (number, number) for number in range(100)]
+        gedcom_lines.append(u"0 @I100@ INDI\n2 NAME Name /Number100/\n")
+        with tempfile.TemporaryDirectory() as directory:
+            file_path = os.path.join(directory, 'mismatched_levels.ged')
+            with open(file_path, 'wb') as gedcom_file:
+                gedcom_file.write(u"".join(gedcom_lines).encode('utf-8'))
+
+            parser = Parser()
+            parser.parse_file(file_path, lazy=True)
+            self.assertEqual(('Name', 'Number99'), parser.get_element_by_pointer('@I99@').get_name())
+            with self.assertRaises(GedcomFormatViolationError) as context:
+                parser.get_element_by_pointer('@I100@')
+        self.assertTrue(str(context.exception).startswith("Line 202 of document"), str(context.exception))
+
+    def test_parse_file__should_share_equal_values_when_using_a_value_pool(self):
+        parser = Parser(ValuePool())
+        parser.parse_file('../tests/files/Musterstammbaum.ged')
+
+        sexes = [element.get_value() for element in parser.get_element_list()
+                 if element.get_tag() == python_gedcom_2.tags.GEDCOM_TAG_SEX and element.get_value() == "M"]
+        self.assertTrue(len(sexes) > 1)
+        for sex in sexes:
+            self.assertIs(sexes[0], sex)
+        self.assertTrue(parser.get_value_pool().get_statistics()['deduplicated_values'] > 0)
+
+    def test_parse__should_be_able_to_parse_lines_that_are_already_decoded(self):
+        single_individual_use_case = """
+            0 @I5@ INDI
+                1 NAME First /Last/
+            """
+        gedcom_parser = Parser()
+        gedcom_parser.parse([a.strip() + '\n' for a in single_individual_use_case.strip().splitlines()])
+        element_1 = gedcom_parser.get_root_child_elements()[0]
+        self.assertTrue(isinstance(element_1, IndividualElement))
+        self.assertEqual(('First', 'Last'), element_1.get_name())
+
     def test_parse__should_raise_an_exception_when_on_strict_mode_and_the_line_does_not_start_with_a_number(self):
         mismatched_levels_use_case = """
             @I5@ INDI
@@ -211,6 +374,55 @@ class TestParser(unittest.TestCase):
         self.assertEqual(7, len(element_1_children))
         self.assertEqual('FORM', element_1_children[0].get_tag())
 
+    # ------------------- START OF iter_records TESTING ----------------
+
+    def test_iter_records__should_yield_each_complete_record_in_order(self):
+        use_case = """
+            0 @I1@ INDI
+                1 NAME First /Last/
+                1 BIRT
+                    2 DATE 1 JAN 1900
+            0 @I2@ INDI
+                1 NAME Second /Last/
+            0 @F1@ FAM
+                1 HUSB @I1@
+            """
+        gedcom_parser = Parser()
+        records = list(gedcom_parser.iter_records(self._convert_gedcom_string_into_parsable_content(use_case)))
+        self.assertEqual(["@I1@", "@I2@", "@F1@"], self._convert_element_list_to_pointer_list(records))
+        self.assertTrue(isinstance(records[0], IndividualElement))
+        self.assertEqual(2, len(records[0].get_child_elements()))
+        self.assertEqual("1 JAN 1900", records[0].get_child_elements()[1].get_child_elements()[0].get_value())
+        self.assertEqual(0, len(gedcom_parser.get_root_child_elements()))
+
+    def test_iter_records__should_yield_a_record_before_the_rest_of_the_stream_is_read(self):
+        use_case = """
+            0 @I1@ INDI
+                1 NAME First /Last/
+            0 @I2@ INDI
+            """
+        lines = iter(self._convert_gedcom_string_into_parsable_content(use_case))
+        record = next(Parser().iter_records(lines))
+        self.assertEqual("@I1@", record.get_pointer())
+        self.assertEqual(0, len(list(lines)))
+
+    def test_iter_records__should_raise_an_exception_with_the_line_number_when_a_line_jumps_one_or_more_levels(self):
+        mismatched_levels_use_case = """
+            0 @I1@ INDI
+            0 @I5@ INDI
+                    2 NAME First /Last/
+            """
+        records = Parser().iter_records(self._convert_gedcom_string_into_parsable_content(mismatched_levels_use_case))
+        self.assertEqual("@I1@", next(records).get_pointer())
+        with self.assertRaises(GedcomFormatViolationError) as context:
+            next(records)
+        self.assertTrue(str(context.exception).startswith("Line 3 of document"))
+
+    def test_iter_records_from_file(self):
+        records = list(Parser().iter_records_from_file('../tests/files/Musterstammbaum.ged'))
+        self.assertEqual(34, len(records))
+        self.assertEqual(20, len([record for record in records if isinstance(record, IndividualElement)]))
+
     def test_get_marriages__should_raise_exception_if_not_passed_an_individual(self):
         single_individual_use_case = """
             0 @I5@ INDI
@@ -487,6 +699,69 @@ class TestParser(unittest.TestCase):
         self.assertEqual("@I2@", ancestors[0].get_pointer())
         self.assertEqual("@I3@", ancestors[1].get_pointer())
 
+    def test_get_ancestors__should_return_ancestors_of_several_lines_once(self):
+        gedcom_parser = Parser()
+        gedcom_parser.parse(self._convert_gedcom_string_into_parsable_content(self.PEDIGREE_COLLAPSE_USE_CASE))
+        individual = gedcom_parser.get_element_by_pointer("@I1@")
+
+        ancestors = gedcom_parser.get_ancestors(individual)
+        self.assertEqual(["@I2@", "@I3@", "@I4@", "@I5@", "@I6@"], [ancestor.get_pointer() for ancestor in ancestors])
+
+    def test_get_ancestors__should_stop_after_max_generations(self):
+        gedcom_parser = Parser()
+        gedcom_parser.parse(self._convert_gedcom_string_into_parsable_content(self.PEDIGREE_COLLAPSE_USE_CASE))
+        individual = gedcom_parser.get_element_by_pointer("@I1@")
+
+        self.assertEqual([], gedcom_parser.get_ancestors(individual, max_generations=0))
+        self.assertEqual(["@I2@", "@I3@"],
+                         [ancestor.get_pointer() for ancestor in gedcom_parser.get_ancestors(individual, max_generations=1)])
+        self.assertEqual(["@I2@", "@I3@", "@I4@", "@I5@"],
+                         [ancestor.get_pointer() for ancestor in gedcom_parser.get_ancestors(individual, max_generations=2)])
+
+    def test_get_ancestors__should_raise_exception_if_an_ancestor_is_its_own_ancestor(self):
+        use_case = """
+            0 @I1@ INDI
+                1 FAMC @F1@
+            0 @I2@ INDI
+                1 FAMS @F1@
+                1 FAMC @F2@
+            0 @I3@ INDI
+                1 FAMS @F2@
+                1 FAMC @F3@
+            0 @F1@ FAM
+                1 HUSB @I2@
+                1 CHIL @I1@
+            0 @F2@ FAM
+                1 HUSB @I3@
+                1 CHIL @I2@
+            0 @F3@ FAM
+                1 HUSB @I2@
+                1 CHIL @I3@
+        """
+        gedcom_parser = Parser()
+        gedcom_parser.parse(self._convert_gedcom_string_into_parsable_content(use_case))
+
+        with self.assertRaises(PedigreeCycleError) as context:
+            gedcom_parser.get_ancestors(gedcom_parser.get_element_by_pointer("@I1@"))
+        self.assertEqual("Individual @I2@ is its own ancestor: @I2@ -> @I3@ -> @I2@", str(context.exception))
+        self.assertEqual(["@I2@"], [ancestor.get_pointer() for ancestor in
+                                    gedcom_parser.get_ancestors(gedcom_parser.get_element_by_pointer("@I1@"), max_generations=1)])
+
+    # ------------------- START OF get_ancestor_generations TESTING ----------------
+
+    def test_get_ancestor_generations__should_return_every_generation_of_an_ancestor(self):
+        gedcom_parser = Parser()
+        gedcom_parser.parse(self._convert_gedcom_string_into_parsable_content(self.PEDIGREE_COLLAPSE_USE_CASE))
+        individual = gedcom_parser.get_element_by_pointer("@I1@")
+
+        generations = gedcom_parser.get_ancestor_generations(individual)
+        self.assertEqual([("@I2@", [1]), ("@I3@", [1]), ("@I4@", [2]), ("@I5@", [2, 3]), ("@I6@", [3, 4])],
+                         [(ancestor.get_pointer(), ancestor_generations) for ancestor, ancestor_generations in generations])
+
+        generations = gedcom_parser.get_ancestor_generations(individual, max_generations=2)
+        self.assertEqual([("@I2@", [1]), ("@I3@", [1]), ("@I4@", [2]), ("@I5@", [2])],
+                         [(ancestor.get_pointer(), ancestor_generations) for ancestor, ancestor_generations in generations])
+
     # ------------------- START OF get_parents TESTING ----------------
 
     def test_get_parents__should_raise_exception_if_not_passed_an_individual_element(self):
@@ -532,6 +807,36 @@ class TestParser(unittest.TestCase):
         self.assertEqual("@I2@", parents[0].get_pointer())
         self.assertEqual("@I3@", parents[1].get_pointer())
 
+    def test_get_parents__should_return_updated_parents_after_invalidating_the_cache(self):
+        use_case = """
+            0 @I1@ INDI
+                1 NAME Kid /Last/
+                1 FAMC @F1@
+            0 @I2@ INDI
+                1 NAME Dad /Last/
+                1 FAMS @F1@
+            0 @I3@ INDI
+                1 NAME Mom /Maiden/
+                1 FAMS @F1@
+            0 @F1@ FAM
+                1 HUSB @I2@
+                1 CHIL @I1@
+                    2 _FREL Natural
+        """
+        gedcom_parser = Parser()
+        gedcom_parser.parse(self._convert_gedcom_string_into_parsable_content(use_case))
+        individual = gedcom_parser.get_element_by_pointer("@I1@")
+        self.assertEqual(["@I2@"], [parent.get_pointer() for parent in gedcom_parser.get_parents(individual, "NAT")])
+
+        family = gedcom_parser.get_element_by_pointer("@F1@")
+        family.new_child_element("WIFE", value="@I3@")
+        family.get_child_elements()[1].new_child_element("_MREL", value="Natural")
+        gedcom_parser.invalidate_cache()
+
+        self.assertEqual(["@I2@", "@I3@"], [parent.get_pointer() for parent in gedcom_parser.get_parents(individual, "NAT")])
+        self.assertEqual(["@I1@"], [child.get_pointer() for child in
+                                    gedcom_parser.get_children(gedcom_parser.get_element_by_pointer("@I3@"), "NAT")])
+
     def test_get_parents__should_only_return_the_indicated_childs_parents_when_getting_natural_parents_only(self):
         use_case = """
             0 @I1@ INDI
@@ -793,6 +1098,61 @@ class TestParser(unittest.TestCase):
         children = parser.get_children(parent, child_type="NAT")
         self.assertEqual(0, len(children))
 
+    # ------------------- START OF get_descendants TESTING ----------------
+
+    def test_get_descendants__should_raise_exception_if_not_passed_an_individual_element(self):
+        gedcom_parser = Parser()
+        gedcom_parser.parse(self._convert_gedcom_string_into_parsable_content(""))
+        self.assertRaises(NotAnActualIndividualError, gedcom_parser.get_descendants, "@I5@")
+
+    def test_get_descendants__should_yield_each_descendant_once_with_its_lowest_generation(self):
+        gedcom_parser = Parser()
+        gedcom_parser.parse(self._convert_gedcom_string_into_parsable_content(self.PEDIGREE_COLLAPSE_USE_CASE))
+        individual = gedcom_parser.get_element_by_pointer("@I6@")
+
+        descendants = [(descendant.get_pointer(), generation) for descendant, generation in gedcom_parser.get_descendants(individual)]
+        self.assertEqual([("@I5@", 1), ("@I3@", 2), ("@I4@", 2), ("@I1@", 3)], descendants)
+
+    def test_get_descendants__should_stop_after_max_generations(self):
+        gedcom_parser = Parser()
+        gedcom_parser.parse(self._convert_gedcom_string_into_parsable_content(self.PEDIGREE_COLLAPSE_USE_CASE))
+        individual = gedcom_parser.get_element_by_pointer("@I6@")
+
+        descendants = [(descendant.get_pointer(), generation)
+                       for descendant, generation in gedcom_parser.get_descendants(individual, max_generations=2)]
+        self.assertEqual([("@I5@", 1), ("@I3@", 2), ("@I4@", 2)], descendants)
+
+    def test_get_descendants__should_only_follow_natural_children_when_getting_natural_descendants_only(self):
+        use_case = """
+            0 @I1@ INDI
+                1 FAMS @F1@
+            0 @I2@ INDI
+                1 FAMC @F1@
+                1 FAMS @F2@
+            0 @I3@ INDI
+                1 FAMC @F1@
+            0 @I4@ INDI
+                1 FAMC @F2@
+            0 @F1@ FAM
+                1 HUSB @I1@
+                1 CHIL @I2@
+                    2 _FREL Adopted
+                1 CHIL @I3@
+                    2 _FREL Natural
+            0 @F2@ FAM
+                1 HUSB @I2@
+                1 CHIL @I4@
+                    2 _FREL Natural
+        """
+        gedcom_parser = Parser()
+        gedcom_parser.parse(self._convert_gedcom_string_into_parsable_content(use_case))
+        individual = gedcom_parser.get_element_by_pointer("@I1@")
+
+        self.assertEqual([("@I2@", 1), ("@I3@", 1), ("@I4@", 2)],
+                         [(descendant.get_pointer(), generation) for descendant, generation in gedcom_parser.get_descendants(individual)])
+        self.assertEqual([("@I3@", 1)],
+                         [(descendant.get_pointer(), generation) for descendant, generation in gedcom_parser.get_descendants(individual, "NAT")])
+
     # ------------------- START OF find_path_to_ancestor TESTING ----------------
 
     def test_find_path_to_ancestor__should_raise_exception_if_not_passed_an_individual_element_for_the_descendant(self):
@@ -916,6 +1276,123 @@ class TestParser(unittest.TestCase):
 
         self.assertEqual(None, path)
 
+    def test_find_path_to_ancestor__should_return_the_shortest_path(self):
+        use_case = """
+            0 @I1@ INDI
+                1 FAMC @F1@
+            0 @I2@ INDI
+                1 FAMC @F2@
+                1 FAMS @F1@
+            0 @I3@ INDI
+                1 FAMC @F3@
+                1 FAMS @F1@
+            0 @I4@ INDI
+                1 FAMC @F3@
+                1 FAMS @F2@
+            0 @I5@ INDI
+                1 FAMS @F3@
+            0 @F1@ FAM
+                1 HUSB @I2@
+                1 WIFE @I3@
+                1 CHIL @I1@
+                    2 _FREL Natural
+                    2 _MREL Natural
+            0 @F2@ FAM
+                1 HUSB @I4@
+                1 CHIL @I2@
+                    2 _FREL Natural
+            0 @F3@ FAM
+                1 HUSB @I5@
+                1 CHIL @I4@
+                    2 _FREL Natural
+                1 CHIL @I3@
+                    2 _FREL Natural
+        """
+        gedcom_parser = Parser()
+        gedcom_parser.parse(self._convert_gedcom_string_into_parsable_content(use_case))
+        descendant = gedcom_parser.get_element_by_pointer("@I1@")
+        ancestor = gedcom_parser.get_element_by_pointer("@I5@")
+
+        path = gedcom_parser.find_path_to_ancestor(descendant, ancestor)
+        self.assertEqual(["@I1@", "@I3@", "@I5@"], [individual.get_pointer() for individual in path])
+        self.assertIsNone(gedcom_parser.find_path_to_ancestor(ancestor, descendant))
+
+        path = gedcom_parser.find_path_to_ancestor(gedcom_parser.get_element_by_pointer("@I2@"), ancestor, [descendant, gedcom_parser.get_element_by_pointer("@I2@")])
+        self.assertEqual(["@I1@", "@I2@", "@I4@", "@I5@"], [individual.get_pointer() for individual in path])
+
+    def test_find_path_to_ancestor__should_only_follow_children_linking_back_to_the_family(self):
+        use_case = """
+            0 @I1@ INDI
+            0 @I2@ INDI
+                1 FAMS @F1@
+            0 @F1@ FAM
+                1 HUSB @I2@
+                1 CHIL @I1@
+                    2 _FREL Natural
+        """
+        gedcom_parser = Parser()
+        gedcom_parser.parse(self._convert_gedcom_string_into_parsable_content(use_case))
+        descendant = gedcom_parser.get_element_by_pointer("@I1@")
+        ancestor = gedcom_parser.get_element_by_pointer("@I2@")
+
+        self.assertEqual([descendant], gedcom_parser.get_children(ancestor, "NAT"))
+        self.assertIsNone(gedcom_parser.find_path_to_ancestor(descendant, ancestor))
+
+        descendant.new_child_element(python_gedcom_2.tags.GEDCOM_TAG_FAMILY_CHILD, value="@F1@")
+        gedcom_parser.invalidate_cache()
+        path = gedcom_parser.find_path_to_ancestor(descendant, ancestor)
+        self.assertEqual(["@I1@", "@I2@"], [individual.get_pointer() for individual in path])
+
+    # ------------------- START OF find_relationship_path TESTING ----------------
+
+    def test_find_relationship_path__should_raise_exception_if_not_passed_individual_elements(self):
+        gedcom_parser = Parser()
+        gedcom_parser.parse(self._convert_gedcom_string_into_parsable_content(self.PEDIGREE_COLLAPSE_USE_CASE))
+        individual = gedcom_parser.get_element_by_pointer("@I1@")
+        self.assertRaises(NotAnActualIndividualError, gedcom_parser.find_relationship_path, individual, "@I2@")
+        self.assertRaises(NotAnActualIndividualError, gedcom_parser.find_relationship_path, "@I2@", individual)
+
+    def test_find_relationship_path__should_go_through_spouses_and_siblings(self):
+        use_case = """
+            0 @I1@ INDI
+                1 FAMC @F1@
+            0 @I2@ INDI
+                1 FAMC @F1@
+                1 FAMS @F2@
+            0 @I3@ INDI
+                1 FAMS @F2@
+            0 @I4@ INDI
+            0 @F1@ FAM
+                1 CHIL @I1@
+                1 CHIL @I2@
+            0 @F2@ FAM
+                1 HUSB @I2@
+                1 WIFE @I3@
+        """
+        gedcom_parser = Parser()
+        gedcom_parser.parse(self._convert_gedcom_string_into_parsable_content(use_case))
+        individual = gedcom_parser.get_element_by_pointer("@I1@")
+
+        path = gedcom_parser.find_relationship_path(individual, gedcom_parser.get_element_by_pointer("@I3@"))
+        self.assertEqual([("@I1@", None), ("@I2@", RELATION_TYPE_SIBLING), ("@I3@", RELATION_TYPE_SPOUSE)],
+                         [(step.get_pointer(), relation_type) for step, relation_type in path])
+        self.assertEqual([(individual, None)], gedcom_parser.find_relationship_path(individual, individual))
+        self.assertIsNone(gedcom_parser.find_relationship_path(individual, gedcom_parser.get_element_by_pointer("@I4@")))
+
+    def test_find_relationship_path__should_return_the_shortest_path_through_parents_and_children(self):
+        gedcom_parser = Parser()
+        gedcom_parser.parse(self._convert_gedcom_string_into_parsable_content(self.PEDIGREE_COLLAPSE_USE_CASE))
+
+        path = gedcom_parser.find_relationship_path(gedcom_parser.get_element_by_pointer("@I1@"),
+                                                    gedcom_parser.get_element_by_pointer("@I4@"))
+        self.assertEqual([("@I1@", None), ("@I3@", RELATION_TYPE_PARENT), ("@I4@", RELATION_TYPE_PARENT)],
+                         [(step.get_pointer(), relation_type) for step, relation_type in path])
+
+        path = gedcom_parser.find_relationship_path(gedcom_parser.get_element_by_pointer("@I6@"),
+                                                    gedcom_parser.get_element_by_pointer("@I1@"))
+        self.assertEqual([("@I6@", None), ("@I5@", RELATION_TYPE_CHILD), ("@I3@", RELATION_TYPE_CHILD), ("@I1@", RELATION_TYPE_CHILD)],
+                         [(step.get_pointer(), relation_type) for step, relation_type in path])
+
     # ------------------- START OF get_family_members TESTING ----------------
 
     def test_get_family_members__should_raise_exception_if_not_passed_a_family_element(self):
@@ -985,8 +1462,224 @@ class TestParser(unittest.TestCase):
         family_members = gedcom_parser.get_family_members(family_element, members_type=FAMILY_MEMBERS_TYPE_CHILDREN)
         self.assertEqual(["@I1@"], self._convert_element_list_to_pointer_list(family_members))
 
+    # ------------------- START OF individuals_born_between TESTING ----------------
+
+    def test_individuals_born_between__should_find_the_same_individuals_as_the_range_matches(self):
+        gedcom_parser = Parser()
+        gedcom_parser.parse_file('../tests/files/Musterstammbaum.ged')
+        individuals = [element for element in gedcom_parser.get_root_child_elements() if isinstance(element, IndividualElement)]
+
+        for from_year, to_year in [(1900, 1935), (1959, 1959), (1975, 2020), (2000, 1900), (0, 3000)]:
+            self.assertEqual(
+                sorted(self._convert_element_list_to_pointer_list([individual for individual in individuals if individual.birth_range_match(from_year, to_year)])),
+                sorted(self._convert_element_list_to_pointer_list(gedcom_parser.individuals_born_between(from_year, to_year))))
+            self.assertEqual(
+                sorted(self._convert_element_list_to_pointer_list([individual for individual in individuals if individual.death_range_match(from_year, to_year)])),
+                sorted(self._convert_element_list_to_pointer_list(gedcom_parser.individuals_died_between(from_year, to_year))))
+            self.assertEqual(
+                sorted(self._convert_element_list_to_pointer_list([individual for individual in individuals if gedcom_parser.marriage_range_match(individual, from_year, to_year)])),
+                sorted(self._convert_element_list_to_pointer_list(gedcom_parser.individuals_married_between(from_year, to_year))))
+
+    def test_individuals_born_between__should_order_the_individuals_by_year(self):
+        gedcom_parser = Parser()
+        gedcom_parser.parse_file('../tests/files/Musterstammbaum.ged')
+
+        individuals = gedcom_parser.individuals_born_between(1925, 1932)
+        self.assertEqual(["@8@", "@5@", "@19@", "@20@", "@11@", "@6@"], self._convert_element_list_to_pointer_list(individuals))
+
+    def test_individuals_married_between__should_return_an_individual_married_several_times_once(self):
+        gedcom_parser = Parser()
+        gedcom_parser.parse_file('../tests/files/Musterstammbaum.ged')
+
+        individuals = gedcom_parser.individuals_married_between(1950, 1980)
+        self.assertEqual(["@19@", "@20@", "@3@", "@4@", "@5@", "@9@", "@10@"], self._convert_element_list_to_pointer_list(individuals))
+
+    def test_individuals_married_between__should_only_use_the_families_linked_from_the_individual(self):
+        one_sided_links_use_case = """
+            0 @I1@ INDI
+                1 FAMS @F1@
+            0 @I2@ INDI
+            0 @I3@ INDI
+                1 FAMS @F2@
+            0 @F1@ FAM
+                1 HUSB @I1@
+                1 WIFE @I2@
+                1 MARR
+                    2 DATE 1 JAN 1950
+            0 @F2@ FAM
+                1 MARR
+                    2 DATE 1960
+        """
+        gedcom_parser = Parser()
+        gedcom_parser.parse(self._convert_gedcom_string_into_parsable_content(one_sided_links_use_case))
+        individuals = [element for element in gedcom_parser.get_root_child_elements() if isinstance(element, IndividualElement)]
+
+        self.assertEqual(["@I1@", "@I3@"], self._convert_element_list_to_pointer_list(gedcom_parser.individuals_married_between(1900, 2000)))
+        self.assertEqual([individual for individual in individuals if gedcom_parser.marriage_range_match(individual, 1900, 2000)],
+                         gedcom_parser.individuals_married_between(1900, 2000))
+
+    # ------------------- START OF find_individuals TESTING ----------------
+
+    def test_find_individuals__should_find_the_same_individuals_as_criteria_match(self):
+        gedcom_parser = Parser()
+        gedcom_parser.parse_file('../tests/files/Musterstammbaum.ged')
+        individuals = [element for element in gedcom_parser.get_root_child_elements() if isinstance(element, IndividualElement)]
+
+        for criteria in ["surname=Musterberg", "surname=muster:birth_range=1900-1950", "birth=1930", "death=-1",
+                         "name=^a:death_range=1900-2000", "birth_range=1950", "unknown=value", "surname"]:
+            expected_individuals = [individual for individual in individuals if individual.criteria_match(criteria)]
+            self.assertEqual(expected_individuals, gedcom_parser.find_individuals(criteria), criteria)
+
+    def test_find_individuals__should_return_updated_individuals_after_invalidating_the_cache(self):
+        gedcom_parser = Parser()
+        gedcom_parser.parse_file('../tests/files/Musterstammbaum.ged')
+        self.assertEqual(["@1@"], self._convert_element_list_to_pointer_list(gedcom_parser.find_individuals("name=Max")))
+
+        gedcom_parser.get_element_by_pointer("@2@").get_child_elements_by_tag(python_gedcom_2.tags.GEDCOM_TAG_NAME)[0].set_value("Max /Mustertyp/")
+        gedcom_parser.invalidate_cache()
+        self.assertEqual(["@1@", "@2@"], self._convert_element_list_to_pointer_list(gedcom_parser.find_individuals("name=Max")))
+
+    def test_prepare_query__should_look_up_the_most_selective_criterion(self):
+        gedcom_parser = Parser()
+        gedcom_parser.parse_file('../tests/files/Musterstammbaum.ged')
+
+        query = gedcom_parser.prepare_query("surname=Muster:birth=1930")
+        self.assertEqual("Index lookup of birth year = 1930: 3 candidates\nFilter on surname matches 'Muster'", query.explain())
+        self.assertEqual(["@5@", "@19@", "@20@"], self._convert_element_list_to_pointer_list(query.execute()))
+
+        self.assertEqual("Scan all 20 individuals", gedcom_parser.prepare_query("unknown=value").explain())
+        self.assertEqual("Criteria 'surname' are invalid, no individual matches", gedcom_parser.prepare_query("surname").explain())
+
+    # ------------------- START OF save_gedcom TESTING ----------------
+
+    def test_save_gedcom__should_write_the_parsed_file_unchanged(self):
+        with open('../tests/files/Musterstammbaum.ged', 'rb') as gedcom_file:
+            data = gedcom_file.read()
+        gedcom_parser = Parser()
+        gedcom_parser.parse_file('../tests/files/Musterstammbaum.ged')
+
+        binary_stream = io.BytesIO()
+        gedcom_parser.save_gedcom(binary_stream, encoding='utf-8-sig')
+        self.assertEqual(data, binary_stream.getvalue())
+
+        text_stream = io.StringIO()
+        gedcom_parser.save_gedcom(text_stream)
+        self.assertEqual(data.decode('utf-8-sig'), text_stream.getvalue())
+
+    def test_save_gedcom__should_end_each_line_with_the_given_line_terminator(self):
+        gedcom_parser = Parser()
+        gedcom_parser.parse([b"0 HEAD\n", b"0 @I1@ INDI\r\n", b"1 NOTE first\n", b"2 CONT second\r\n", b"0 TRLR\n"])
+
+        binary_stream = io.BytesIO()
+        gedcom_parser.save_gedcom(binary_stream, line_terminator="\r\n")
+        self.assertEqual(b"0 HEAD\r\n0 @I1@ INDI\r\n1 NOTE first\r\n2 CONT second\r\n0 TRLR\r\n", binary_stream.getvalue())
+
+    def test_save_gedcom__should_copy_unchanged_records_from_the_parsed_file_when_tracking_changes(self):
+        gedcom_data = b"0 HEAD\n0 @I1@ INDI\n1 NAME  First /Name/\n0 @I2@ INDI\n1 NAME Second /Name/\n0 TRLR"
+        with tempfile.TemporaryDirectory() as directory:
+            file_path = os.path.join(directory, 'tracked.ged')
+            with open(file_path, 'wb') as gedcom_file:
+                gedcom_file.write(gedcom_data)
+
+            gedcom_parser = Parser()
+            gedcom_parser.parse_file(file_path, strict=False, track_changes=True)
+            self.assertFalse(any(record.is_dirty() for record in gedcom_parser.get_root_child_elements()))
+
+            # The double space of the unchanged name is kept, the changed record and the last one without
+            # a line break are written anew.
+            gedcom_parser.get_element_by_pointer("@I2@").new_child_element("SEX", value="F")
+            binary_stream = io.BytesIO()
+            gedcom_parser.save_gedcom(binary_stream)
+            self.assertEqual(b"0 HEAD\n0 @I1@ INDI\n1 NAME  First /Name/\n0 @I2@ INDI\n1 NAME Second /Name/\n1 SEX F\n0 TRLR\n",
+                             binary_stream.getvalue())
+
+            # Once the parsed file changed, all records are written anew.
+            with open(file_path, 'ab') as gedcom_file:
+                gedcom_file.write(b"\n")
+            os.utime(file_path, ns=(0, 0))
+            text_stream = io.StringIO()
+            gedcom_parser.save_gedcom(text_stream)
+            self.assertTrue(text_stream.getvalue().startswith("0 HEAD\n0 @I1@ INDI\n1 NAME First /Name/\n"))
+
+    # ------------------- START OF collapse_multi_line TESTING ----------------
+
+    def test_parse__should_collapse_concatenations_and_continuations_into_their_element(self):
+        gedcom_lines = """
+            0 @N1@ NOTE First line
+            1 CONC  of the note
+            1 CONT
+            1 CONT Third line
+            1 SOUR @S1@
+            2 PAGE 1
+            3 CONC 2
+            0 TRLR
+        """
+        gedcom_parser = Parser()
+        gedcom_parser.parse(self._convert_gedcom_string_into_parsable_content(gedcom_lines))
+        collapsing_parser = Parser()
+        collapsing_parser.parse(self._convert_gedcom_string_into_parsable_content(gedcom_lines), collapse_multi_line=True)
+
+        note = collapsing_parser.get_element_by_pointer("@N1@")
+        self.assertTrue(note.is_collapsed())
+        self.assertEqual("First lineof the note\n\nThird line", note.get_value())
+        self.assertEqual(["SOUR"], [child.get_tag() for child in note.get_child_elements()])
+        self.assertEqual("12", note.get_child_elements()[0].get_child_elements()[0].get_value())
+        self.assertEqual([element.get_multi_line_value() for element in gedcom_parser.get_element_list()
+                          if element.get_tag() not in ("CONC", "CONT")],
+                         [element.get_multi_line_value() for element in collapsing_parser.get_element_list()])
+
+        text_stream = io.StringIO()
+        collapsing_parser.save_gedcom(text_stream)
+        self.assertEqual("0 @N1@ NOTE First lineof the note\n1 CONT\n1 CONT Third line\n1 SOUR @S1@\n2 PAGE 12\n0 TRLR\n",
+                         text_stream.getvalue())
+
+    def test_save_gedcom__should_keep_empty_continuations_of_collapsed_elements(self):
+        gedcom_data = "0 @N1@ NOTE first\n1 CONT\n1 CONT\n0 @N2@ NOTE\n1 CONT\n0 @N3@ NOTE a\n1 CONT\n1 CONT\n1 CONT b\n0 TRLR\n"
+        gedcom_parser = Parser()
+        gedcom_parser.parse(gedcom_data.splitlines(True), collapse_multi_line=True)
+        self.assertEqual("first\n\n", gedcom_parser.get_element_by_pointer("@N1@").get_multi_line_value())
+
+        text_stream = io.StringIO()
+        gedcom_parser.save_gedcom(text_stream)
+        self.assertEqual(gedcom_data, text_stream.getvalue())
+
     # ------------------------------ START OF HELPER METHODS -----------------------
 
+    # @I1@ is the child of @I2@ and @I3@. @I5@ is a parent of @I3@ and a grandparent through @I4@, the other parent
+    # of @I3@. @I6@ is the parent of @I5@.
+    PEDIGREE_COLLAPSE_USE_CASE = """
+        0 @I1@ INDI
+            1 FAMC @F1@
+        0 @I2@ INDI
+            1 FAMS @F1@
+        0 @I3@ INDI
+            1 FAMS @F1@
+            1 FAMC @F2@
+        0 @I4@ INDI
+            1 FAMS @F2@
+            1 FAMC @F3@
+        0 @I5@ INDI
+            1 FAMS @F2@
+            1 FAMS @F3@
+            1 FAMC @F4@
+        0 @I6@ INDI
+            1 FAMS @F4@
+        0 @F1@ FAM
+            1 HUSB @I2@
+            1 WIFE @I3@
+            1 CHIL @I1@
+        0 @F2@ FAM
+            1 HUSB @I4@
+            1 WIFE @I5@
+            1 CHIL @I3@
+        0 @F3@ FAM
+            1 WIFE @I5@
+            1 CHIL @I4@
+        0 @F4@ FAM
+            1 HUSB @I6@
+            1 CHIL @I5@
+    """
+
     @staticmethod
     def _convert_gedcom_string_into_parsable_content(gedcom_file_contents_test_string):
         # Ignores whitespace "lines" at the start and end of the string - allows prettier presentation in the tests.
@@ -0,0 +1,39 @@
+import unittest
+
+from python_gedcom_2.query import CompiledQuery, Criterion, FIELD_BIRTH_YEAR, FIELD_SURNAME, compile_criteria
+
+
+class TestQuery(unittest.TestCase):
+
+    # --------------------- START OF Criterion TESTING -----------------------
+
+    def test_criterion__should_parse_the_years_once(self):
+        criterion = Criterion("birth_range", "1900-1950")
+        self.assertEqual(FIELD_BIRTH_YEAR, criterion.field)
+        self.assertEqual((1900, 1950), (criterion.from_year, criterion.to_year))
+        self.assertTrue(criterion.matches(1950))
+        self.assertFalse(criterion.matches(1951))
+        self.assertEqual("birth year between 1900 and 1950", criterion.describe())
+
+    def test_criterion__should_never_match_years_that_are_not_numeric(self):
+        criterion = Criterion("death", "not_a_number")
+        self.assertIsNone(criterion.field)
+        self.assertFalse(criterion.matches(1950))
+
+    def test_criterion__should_search_names_ignoring_the_case(self):
+        criterion = Criterion("surname", "^mu")
+        self.assertEqual(FIELD_SURNAME, criterion.field)
+        self.assertTrue(criterion.matches("Mustermann"))
+        self.assertFalse(criterion.matches("Alwin Mustermann"))
+
+    # --------------------- START OF compile_criteria TESTING -----------------------
+
+    def test_compile_criteria__should_reuse_the_compiled_query_of_equal_criteria(self):
+        query = compile_criteria("surname=Last:birth=1990")
+        self.assertIs(query, compile_criteria("surname=Last:birth=1990"))
+        self.assertEqual(["surname", "birth"], [criterion.key for criterion in query.get_criterion_list()])
+
+    def test_compiled_query__should_ignore_unknown_keys_and_reject_criteria_without_a_separator(self):
+        self.assertEqual([], CompiledQuery("unknown=value").get_criterion_list())
+        self.assertTrue(CompiledQuery("unknown=value").is_valid())
+        self.assertFalse(CompiledQuery("surname=Last:birth").is_valid())
@@ -0,0 +1,87 @@
+import io
+import unittest
+
+from python_gedcom_2.reader import count_lines, decode_lines, find_record_start, find_shard_offsets, get_data_start, \
+    iter_raw_lines, map_file, read_lines
+
+
+class TestReader(unittest.TestCase):
+
+    # --------------------- START OF read_lines TESTING -----------------------
+
+    def test_read_lines__should_split_lines_like_iterating_over_a_binary_file(self):
+        data = u"\ufeff0 HEAD\r\n1 NOTE a\rb\n0 @I1@ INDI\n1 NAME Jürgen /Müller/\n0 TRLR".encode('utf-8')
+        expected_lines = [line.decode('utf-8-sig') for line in io.BytesIO(data)]
+        self.assertEqual(expected_lines, list(read_lines(io.BytesIO(data), buffer_size=3)))
+
+    def test_read_lines__should_only_remove_the_byte_order_mark_at_the_start(self):
+        data = u"\ufeff0 HEAD\n".encode('utf-8')
+        self.assertEqual(["0 HEAD\n"], list(read_lines(io.BytesIO(data))))
+
+    def test_read_lines__should_handle_empty_data(self):
+        self.assertEqual([], list(read_lines(io.BytesIO(b""))))
+
+    # --------------------- START OF decode_lines TESTING -----------------------
+
+    def test_decode_lines__should_decode_lines_of_bytes(self):
+        lines = [u"\ufeff0 HEAD\n".encode('utf-8'), u"\ufeff1 NAME Jürgen\n".encode('utf-8')]
+        self.assertEqual(["0 HEAD\n", u"1 NAME Jürgen\n"], list(decode_lines(lines)))
+
+    def test_decode_lines__should_pass_through_lines_that_are_already_decoded(self):
+        lines = ["0 HEAD\n", "0 TRLR\n"]
+        self.assertEqual(lines, list(decode_lines(lines)))
+
+    # --------------------- START OF iter_raw_lines TESTING -----------------------
+
+    def test_iter_raw_lines__should_split_lines_like_iterating_over_a_binary_file_after_the_byte_order_mark(self):
+        data = u"\ufeff0 HEAD\r\n1 NOTE a\rb\n0 TRLR".encode('utf-8')
+        self.assertEqual([b"0 HEAD\r\n", b"1 NOTE a\rb\n", b"0 TRLR"], list(iter_raw_lines(data)))
+
+    def test_iter_raw_lines__should_only_return_lines_between_the_offsets(self):
+        data = b"0 HEAD\n0 @I1@ INDI\n1 NAME A\n0 TRLR\n"
+        self.assertEqual([b"0 @I1@ INDI\n", b"1 NAME A\n"], list(iter_raw_lines(data, 7, 28)))
+
+    # --------------------- START OF find_record_start TESTING -----------------------
+
+    def test_find_record_start__should_find_the_next_level_0_line(self):
+        data = b"0 HEAD\n1 CHAR UTF-8\n0 @I1@ INDI\n"
+        self.assertEqual(20, find_record_start(data, 1))
+
+    def test_find_record_start__should_skip_lines_that_are_not_read_as_level_0_line(self):
+        data = b"0 @I1@ INDI\n1 NOTE a\n0 !\n0 TRLR\n"
+        self.assertEqual(25, find_record_start(data, 1))
+
+    def test_find_record_start__should_return_the_end_if_there_is_no_further_record(self):
+        data = b"0 HEAD\n1 CHAR UTF-8\n"
+        self.assertEqual(len(data), find_record_start(data, 1))
+
+    # --------------------- START OF find_shard_offsets TESTING -----------------------
+
+    def test_find_shard_offsets__should_split_at_level_0_lines(self):
+        data = u"\ufeff0 HEAD\n0 @I1@ INDI\n1 NAME A\n0 @I2@ INDI\n0 TRLR\n".encode('utf-8')
+        offsets = find_shard_offsets(data, 3)
+        self.assertEqual(3, offsets[0])
+        self.assertEqual(len(data), offsets[-1])
+        self.assertEqual(sorted(set(offsets)), offsets)
+        for offset in offsets[1:-1]:
+            self.assertEqual(b"0 ", data[offset:offset + 2])
+            self.assertEqual(b"\n", data[offset - 1:offset])
+
+    def test_find_shard_offsets__should_return_a_single_range_for_a_single_record(self):
+        data = b"0 HEAD\n1 CHAR UTF-8\n"
+        self.assertEqual([0, len(data)], find_shard_offsets(data, 4))
+
+    # --------------------- START OF count_lines TESTING -----------------------
+
+    def test_count_lines__should_count_line_breaks_between_the_offsets(self):
+        data = b"0 HEAD\n1 CHAR UTF-8\n0 TRLR\n"
+        self.assertEqual(2, count_lines(data, 0, 20, buffer_size=4))
+
+    # --------------------- START OF map_file TESTING -----------------------
+
+    def test_map_file__should_map_the_whole_file(self):
+        with map_file('../tests/files/Musterstammbaum.ged') as mapped_file:
+            with open('../tests/files/Musterstammbaum.ged', 'rb') as gedcom_file:
+                data = gedcom_file.read()
+            self.assertEqual(data, mapped_file[:])
+            self.assertEqual(get_data_start(data), get_data_start(mapped_file))
@@ -0,0 +1,273 @@
+import unittest
+from unittest import mock
+
+from python_gedcom_2.element.individual import IndividualElement, NotAnActualIndividualError
+from python_gedcom_2.parser import Parser, PedigreeCycleError
+from python_gedcom_2.relationship import RelationshipCalculator, get_ordinal, get_relationship_name
+
+
+class TestRelationship(unittest.TestCase):
+
+    def setUp(self):
+        self.parser = Parser()
+        self.parser.parse(self._convert_gedcom_string_into_parsable_content(self.FAMILY_USE_CASE))
+        self.calculator = RelationshipCalculator(self.parser)
+
+    # --------------------- START OF get_relationship_name TESTING -----------------------
+
+    def test_get_ordinal__should_use_the_english_suffixes(self):
+        self.assertEqual(["1st", "2nd", "3rd", "4th", "11th", "12th", "13th", "21st", "102nd"],
+                         [get_ordinal(number) for number in (1, 2, 3, 4, 11, 12, 13, 21, 102)])
+
+    def test_get_relationship_name__should_name_lineal_relatives(self):
+        self.assertEqual("self", get_relationship_name(0, 0))
+        self.assertEqual("parent", get_relationship_name(1, 0))
+        self.assertEqual("grandmother", get_relationship_name(2, 0, gender="F"))
+        self.assertEqual("great-grandfather", get_relationship_name(3, 0, gender="M"))
+        self.assertEqual("2nd great-grandparent", get_relationship_name(4, 0))
+        self.assertEqual("son", get_relationship_name(0, 1, gender="M"))
+        self.assertEqual("3rd great-grandchild", get_relationship_name(0, 5))
+
+    def test_get_relationship_name__should_name_collateral_relatives(self):
+        self.assertEqual("sister", get_relationship_name(1, 1, gender="F"))
+        self.assertEqual("half-sibling", get_relationship_name(1, 1, is_half=True))
+        self.assertEqual("uncle or aunt", get_relationship_name(2, 1))
+        self.assertEqual("great-granduncle", get_relationship_name(4, 1, gender="M"))
+        self.assertEqual("grandniece", get_relationship_name(1, 3, gender="F"))
+        self.assertEqual("1st cousin", get_relationship_name(2, 2))
+        self.assertEqual("2nd cousin once removed", get_relationship_name(3, 4))
+        self.assertEqual("1st cousin twice removed", get_relationship_name(4, 2))
+        self.assertEqual("half-3rd cousin 3 times removed", get_relationship_name(7, 4, is_half=True))
+
+    # --------------------- START OF RelationshipCalculator TESTING -----------------------
+
+    def test_get_relationship__should_name_the_relationships_of_a_family(self):
+        expected_relationships = [
+            ("@I6@", "@I6@", "self"),
+            ("@I3@", "@I4@", "sister"),
+            ("@I3@", "@I13@", "half-sibling"),
+            ("@I6@", "@I8@", "1st cousin"),
+            ("@I10@", "@I8@", "1st cousin once removed"),
+            ("@I6@", "@I4@", "aunt"),
+            ("@I4@", "@I6@", "nephew"),
+            ("@I10@", "@I1@", "great-grandfather"),
+            ("@I1@", "@I10@", "great-grandchild"),
+            ("@I5@", "@I7@", None),
+        ]
+        for individual, relative, relationship in expected_relationships:
+            self.assertEqual(relationship, self.calculator.get_relationship(
+                self.parser.get_element_by_pointer(individual), self.parser.get_element_by_pointer(relative)
+            ), (individual, relative))
+
+    def test_get_lowest_common_ancestors__should_return_both_parents_of_cousins(self):
+        ancestors = self.calculator.get_lowest_common_ancestors(self.parser.get_element_by_pointer("@I10@"),
+                                                                self.parser.get_element_by_pointer("@I8@"))
+        self.assertEqual([("@I1@", 3, 2), ("@I2@", 3, 2)],
+                         sorted((ancestor.get_pointer(), generations_from_individual, generations_from_relative)
+                                for ancestor, generations_from_individual, generations_from_relative in ancestors))
+
+    def test_get_lowest_common_ancestors__should_return_only_the_ancestor_of_a_descendant(self):
+        ancestors = self.calculator.get_lowest_common_ancestors(self.parser.get_element_by_pointer("@I10@"),
+                                                                self.parser.get_element_by_pointer("@I3@"))
+        self.assertEqual([("@I3@", 2, 0)], [(ancestor.get_pointer(), generations_from_individual, generations_from_relative)
+                                            for ancestor, generations_from_individual, generations_from_relative in ancestors])
+
+    def test_get_relationships__should_return_every_relationship_caused_by_pedigree_collapse(self):
+        parser = Parser()
+        parser.parse(self._convert_gedcom_string_into_parsable_content(self.PEDIGREE_COLLAPSE_USE_CASE))
+        calculator = RelationshipCalculator(parser)
+        calculator.precompute()
+
+        individual = parser.get_element_by_pointer("@A@")
+        relative = parser.get_element_by_pointer("@B@")
+        self.assertEqual(["1st cousin", "2nd cousin"], calculator.get_relationships(individual, relative))
+        self.assertEqual("1st cousin", calculator.get_relationship(individual, relative))
+        self.assertEqual(4, len(calculator.get_lowest_common_ancestors(individual, relative)))
+
+    def test_get_relationship__should_keep_only_the_ancestors_of_the_most_recently_used_individuals(self):
+        calculator = RelationshipCalculator(self.parser, cache_size=2)
+        pointers = [pointer for pointer, element in self.parser.get_element_dictionary().items()
+                    if isinstance(element, IndividualElement)]
+
+        for individual in pointers:
+            for relative in pointers:
+                self.assertEqual(
+                    self.calculator.get_relationships(self.parser.get_element_by_pointer(individual),
+                                                      self.parser.get_element_by_pointer(relative)),
+                    calculator.get_relationships(self.parser.get_element_by_pointer(individual),
+                                                 self.parser.get_element_by_pointer(relative)),
+                    (individual, relative))
+                self.assertTrue(calculator.get_cached_count() <= 2)
+
+        self.assertEqual(len(pointers), self.calculator.get_cached_count())
+        self.calculator.clear_cache()
+        self.assertEqual(0, self.calculator.get_cached_count())
+
+    def test_get_relationships__should_return_the_closest_relationship_first_in_any_order_of_ancestors(self):
+        parser = Parser()
+        parser.parse(self._convert_gedcom_string_into_parsable_content(self.PEDIGREE_COLLAPSE_USE_CASE))
+        calculator = RelationshipCalculator(parser)
+        individual = parser.get_element_by_pointer("@A@")
+        relative = parser.get_element_by_pointer("@B@")
+        ancestors = calculator.get_lowest_common_ancestors(individual, relative)
+        ancestors.reverse()
+
+        with mock.patch.object(calculator, 'get_lowest_common_ancestors', return_value=ancestors):
+            self.assertEqual(["1st cousin", "2nd cousin"], calculator.get_relationships(individual, relative))
+
+    def test_get_ancestor_generations__should_keep_the_lowest_generation(self):
+        generations = self.calculator.get_ancestor_generations(self.parser.get_element_by_pointer("@I10@"))
+        self.assertEqual({"@I10@": 0, "@I6@": 1, "@I9@": 1, "@I3@": 2, "@I5@": 2, "@I1@": 3, "@I2@": 3}, generations)
+
+    def test_get_ancestor_generations__should_raise_an_exception_for_a_cycle(self):
+        cycle_use_case = """
+            0 @I1@ INDI
+                1 FAMC @F1@
+            0 @I2@ INDI
+                1 FAMC @F2@
+            0 @F1@ FAM
+                1 HUSB @I2@
+                1 CHIL @I1@
+            0 @F2@ FAM
+                1 HUSB @I1@
+                1 CHIL @I2@
+        """
+        parser = Parser()
+        parser.parse(self._convert_gedcom_string_into_parsable_content(cycle_use_case))
+        calculator = RelationshipCalculator(parser)
+        self.assertRaises(PedigreeCycleError, calculator.get_ancestor_generations, parser.get_element_by_pointer("@I1@"))
+
+    def test_get_ancestor_generations__should_raise_an_exception_if_not_passed_an_individual(self):
+        self.assertRaises(NotAnActualIndividualError, self.calculator.get_ancestor_generations,
+                          self.parser.get_element_by_pointer("@F1@"))
+
+    # --------------------- HELPER METHODS -----------------------
+
+    # I1 and I2 have the children I3 and I4, I1 and I12 the child I13. I6 is the child of I3 and I5, I8 of I4 and I7
+    # and I10 of I6 and I9.
+    FAMILY_USE_CASE = """
+        0 @I1@ INDI
+            1 SEX M
+            1 FAMS @F1@
+            1 FAMS @F6@
+        0 @I2@ INDI
+            1 SEX F
+            1 FAMS @F1@
+        0 @I3@ INDI
+            1 SEX M
+            1 FAMC @F1@
+            1 FAMS @F2@
+        0 @I4@ INDI
+            1 SEX F
+            1 FAMC @F1@
+            1 FAMS @F3@
+        0 @I5@ INDI
+            1 SEX F
+            1 FAMS @F2@
+        0 @I6@ INDI
+            1 SEX M
+            1 FAMC @F2@
+            1 FAMS @F4@
+        0 @I7@ INDI
+            1 SEX M
+            1 FAMS @F3@
+        0 @I8@ INDI
+            1 SEX F
+            1 FAMC @F3@
+        0 @I9@ INDI
+            1 SEX F
+            1 FAMS @F4@
+        0 @I10@ INDI
+            1 FAMC @F4@
+        0 @I12@ INDI
+            1 SEX F
+            1 FAMS @F6@
+        0 @I13@ INDI
+            1 FAMC @F6@
+        0 @F1@ FAM
+            1 HUSB @I1@
+            1 WIFE @I2@
+            1 CHIL @I3@
+            1 CHIL @I4@
+        0 @F2@ FAM
+            1 HUSB @I3@
+            1 WIFE @I5@
+            1 CHIL @I6@
+        0 @F3@ FAM
+            1 HUSB @I7@
+            1 WIFE @I4@
+            1 CHIL @I8@
+        0 @F4@ FAM
+            1 HUSB @I6@
+            1 WIFE @I9@
+            1 CHIL @I10@
+        0 @F6@ FAM
+            1 HUSB @I1@
+            1 WIFE @I12@
+            1 CHIL @I13@
+    """
+
+    # The parents of A and B are siblings (children of G1 and G2), the other parents of A and B are 1st cousins
+    # (grandchildren of G3 and G4), so A and B are 1st cousins as well as 2nd cousins.
+    PEDIGREE_COLLAPSE_USE_CASE = """
+        0 @A@ INDI
+            1 FAMC @FA@
+        0 @B@ INDI
+            1 FAMC @FB@
+        0 @M1@ INDI
+            1 FAMC @FG12@
+            1 FAMS @FA@
+        0 @N1@ INDI
+            1 FAMC @FG12@
+            1 FAMS @FB@
+        0 @M2@ INDI
+            1 FAMC @FH@
+            1 FAMS @FA@
+        0 @N2@ INDI
+            1 FAMC @FK@
+            1 FAMS @FB@
+        0 @H1@ INDI
+            1 FAMC @FG34@
+            1 FAMS @FH@
+        0 @K1@ INDI
+            1 FAMC @FG34@
+            1 FAMS @FK@
+        0 @G1@ INDI
+            1 FAMS @FG12@
+        0 @G2@ INDI
+            1 FAMS @FG12@
+        0 @G3@ INDI
+            1 FAMS @FG34@
+        0 @G4@ INDI
+            1 FAMS @FG34@
+        0 @FA@ FAM
+            1 HUSB @M1@
+            1 WIFE @M2@
+            1 CHIL @A@
+        0 @FB@ FAM
+            1 HUSB @N1@
+            1 WIFE @N2@
+            1 CHIL @B@
+        0 @FG12@ FAM
+            1 HUSB @G1@
+            1 WIFE @G2@
+            1 CHIL @M1@
+            1 CHIL @N1@
+        0 @FH@ FAM
+            1 WIFE @H1@
+            1 CHIL @M2@
+        0 @FK@ FAM
+            1 WIFE @K1@
+            1 CHIL @N2@
+        0 @FG34@ FAM
+            1 HUSB @G3@
+            1 WIFE @G4@
+            1 CHIL @H1@
+            1 CHIL @K1@
+    """
+
+    @staticmethod
+    def _convert_gedcom_string_into_parsable_content(gedcom_file_contents_test_string):
+        # Ignores whitespace "lines" at the start and end of the string - allows prettier presentation in the tests.
+        # Ignores leading and trailing whitespace on each line - allows for indentation of lines to show clearer test strings.
+        return [(a.strip() + '\n').encode('utf-8-sig') for a in gedcom_file_contents_test_string.strip().splitlines()]
@@ -0,0 +1,60 @@
+import unittest
+
+from python_gedcom_2.tokenizer import GedcomFormatViolationError, tokenize_bytes_line, tokenize_line, validate_level
+
+
+class TestTokenizer(unittest.TestCase):
+
+    # --------------------- START OF tokenize_line TESTING -----------------------
+
+    def test_tokenize_line__should_split_a_line_with_pointer(self):
+        self.assertEqual((0, "@I1@", "INDI", "", "\n"), tokenize_line(1, "0 @I1@ INDI\n", -1, "ROOT"))
+
+    def test_tokenize_line__should_split_a_line_with_value(self):
+        self.assertEqual((1, "", "NAME", "First /Last/", "\r\n"), tokenize_line(2, "1 NAME First /Last/ \r\n", 0, "INDI"))
+
+    def test_tokenize_line__should_raise_an_exception_when_on_strict_mode_and_the_line_does_not_start_with_a_number(self):
+        with self.assertRaises(GedcomFormatViolationError) as context:
+            tokenize_line(3, "@I5@ INDI\n", 0, "INDI")
+        self.assertEqual("Line <3:@I5@ INDI\n> of document violates GEDCOM format 5.5"
+                         "\nSee: https://chronoplexsoftware.com/gedcomvalidator/gedcom/gedcom-5.5.pdf", str(context.exception))
+
+    def test_tokenize_line__should_raise_an_exception_when_on_strict_mode_and_the_line_has_no_line_break(self):
+        self.assertRaises(GedcomFormatViolationError, tokenize_line, 1, "0 @I5@ INDI", -1, "ROOT")
+
+    def test_tokenize_line__first_quirk_check(self):
+        self.assertEqual((0, "@I5@", "INDI", "", "\n"), tokenize_line(1, "0 @I5@ INDI", -1, "ROOT", strict=False))
+
+    def test_tokenize_line__second_quirk_check(self):
+        self.assertEqual((2, None, "CONC", "that is continued", "\n"),
+                         tokenize_line(3, "that is continued\n", 1, "NOTE", strict=False))
+
+    def test_tokenize_line__second_quirk_check_but_previous_tag_was_a_continuation(self):
+        self.assertEqual((2, None, "CONT", "on the next line.", "\n"),
+                         tokenize_line(4, "on the next line.\n", 2, "CONT", strict=False))
+
+    # --------------------- START OF tokenize_bytes_line TESTING -----------------------
+
+    def test_tokenize_bytes_line__should_decode_the_parts_of_a_line(self):
+        self.assertEqual((1, "", "NAME", u"Jürgen /Müller/", "\r\n"),
+                         tokenize_bytes_line(2, u"1 NAME Jürgen /Müller/ \r\n".encode('utf-8'), 0, "INDI"))
+
+    def test_tokenize_bytes_line__should_split_a_line_with_pointer(self):
+        self.assertEqual((0, "@I1@", "INDI", "", "\n"), tokenize_bytes_line(1, b"0 @I1@ INDI\n", -1, "ROOT"))
+
+    def test_tokenize_bytes_line__should_raise_the_same_exception_as_for_a_decoded_line(self):
+        with self.assertRaises(GedcomFormatViolationError) as context:
+            tokenize_bytes_line(3, b"@I5@ INDI\n", 0, "INDI")
+        self.assertTrue(str(context.exception).startswith("Line <3:@I5@ INDI\n> of document"))
+
+    def test_tokenize_bytes_line__second_quirk_check(self):
+        self.assertEqual((2, None, "CONC", "that is continued", "\n"),
+                         tokenize_bytes_line(3, b"that is continued\n", 1, "NOTE", strict=False))
+
+    # --------------------- START OF validate_level TESTING -----------------------
+
+    def test_validate_level__should_accept_a_line_one_level_higher_than_the_previous_line(self):
+        validate_level(2, 1, 0)
+
+    def test_validate_level__should_raise_an_exception_when_a_line_jumps_one_or_more_levels(self):
+        self.assertRaises(GedcomFormatViolationError, validate_level, 2, 2, 0)
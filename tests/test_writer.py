@@ -0,0 +1,118 @@
+import io
+import os
+import sys
+import tempfile
+import unittest
+
+from python_gedcom_2.element.element import Element
+from python_gedcom_2.element.root import RootElement
+from python_gedcom_2.parser import Parser
+from python_gedcom_2.writer import format_line, is_binary_stream, iter_lines, iter_record_chunks, split_line, \
+    split_multi_line_value, track_records, write_elements, write_lines
+
+
+class TestWriter(unittest.TestCase):
+
+    # --------------------- START OF format_line TESTING -----------------------
+
+    def test_format_line__should_leave_out_a_missing_pointer_and_value(self):
+        self.assertEqual("1 BIRT\n", format_line(Element(1, "", "BIRT", "")))
+        self.assertEqual("2 CONC more\r\n", format_line(Element(2, None, "CONC", "more", "\r\n")))
+        self.assertEqual("0 @I1@ INDI\r\n", format_line(Element(0, "@I1@", "INDI", ""), "\r\n"))
+
+    # --------------------- START OF split_multi_line_value TESTING -----------------------
+
+    def test_split_line__should_not_end_a_chunk_with_a_space_unless_it_only_has_spaces(self):
+        self.assertEqual(["ab", " cd", "ef"], split_line("ab cdef", 3, 3))
+        self.assertEqual(["   ", " x"], split_line("    x", 3, 3))
+        self.assertEqual(["", "abc"], split_line("abc", 0, 3))
+
+    def test_split_multi_line_value__should_return_the_value_and_the_added_lines(self):
+        self.assertEqual(("", []), split_multi_line_value("", 7, 2, "\n"))
+        self.assertEqual(("a" * 248, [("CONC", "a" * 2), ("CONT", ""), ("CONT", "b")]),
+                         split_multi_line_value("a" * 250 + "\n\nb", 7, 2, "\n"))
+
+    def test_split_multi_line_value__should_split_like_splitlines(self):
+        self.assertEqual(("a", [("CONT", "")]), split_multi_line_value("a\r\n\r", 7, 2, "\n"))
+        self.assertEqual(("", []), split_multi_line_value("\n", 7, 2, "\n"))
+        self.assertEqual(("a", [("CONT", "b"), ("CONT", "c")]), split_multi_line_value("a\x0bb\u2028c", 7, 2, "\n"))
+
+    def test_split_multi_line_value__should_keep_empty_lines_at_the_end_when_collapsed(self):
+        self.assertEqual(("a", [("CONT", ""), ("CONT", "")]), split_multi_line_value("a\r\n\r", 7, 2, "\n", collapsed=True))
+        self.assertEqual(("", [("CONT", "")]), split_multi_line_value("\n", 7, 2, "\n", collapsed=True))
+        self.assertEqual(("", []), split_multi_line_value("", 7, 2, "\n", collapsed=True))
+        self.assertEqual(("a\x0bb", []), split_multi_line_value("a\x0bb", 7, 2, "\n", collapsed=True))
+
+    # --------------------- START OF iter_lines TESTING -----------------------
+
+    def test_iter_lines__should_yield_the_lines_in_the_order_of_the_file(self):
+        root_element = RootElement()
+        individual = root_element.new_child_element("INDI", "@I1@")
+        individual.new_child_element("BIRT").new_child_element("DATE", value="1 JAN 1900")
+        individual.new_child_element("SEX", value="M")
+        root_element.new_child_element("TRLR")
+
+        self.assertEqual(["0 @I1@ INDI\n", "1 BIRT\n", "2 DATE 1 JAN 1900\n", "1 SEX M\n", "0 TRLR\n"],
+                         list(iter_lines(root_element)))
+
+    def test_iter_lines__should_not_be_limited_by_the_recursion_depth(self):
+        element = root_element = RootElement()
+        for level in range(sys.getrecursionlimit() + 10):
+            element = element.new_child_element("NOTE")
+        self.assertEqual(sys.getrecursionlimit() + 10, len(list(iter_lines(root_element))))
+        self.assertEqual(len(root_element.to_gedcom_string(True).splitlines()), sys.getrecursionlimit() + 10)
+
+    # --------------------- START OF write_lines TESTING -----------------------
+
+    def test_write_lines__should_write_str_to_text_and_encoded_bytes_to_binary_streams(self):
+        lines = ["0 HEAD\n", u"1 NAME Jürgen /Müller/\n", "0 TRLR\n"]
+
+        text_stream = io.StringIO()
+        write_lines(lines, text_stream, buffer_size=8)
+        self.assertEqual("".join(lines), text_stream.getvalue())
+
+        binary_stream = io.BytesIO()
+        write_lines(lines, binary_stream, encoding='utf-8-sig', buffer_size=8)
+        self.assertEqual("".join(lines).encode('utf-8-sig'), binary_stream.getvalue())
+
+    def test_is_binary_stream__should_detect_the_type_of_a_file_stream(self):
+        self.assertFalse(is_binary_stream(io.StringIO()))
+        self.assertTrue(is_binary_stream(io.BytesIO()))
+        self.assertFalse(is_binary_stream(sys.stdout))
+
+    # --------------------- START OF write_elements TESTING -----------------------
+
+    def test_write_elements__should_write_the_same_data_as_to_gedcom_string(self):
+        root_element = RootElement()
+        root_element.new_child_element("INDI", "@I1@").new_child_element("NAME", value=u"Jürgen /Müller/")
+
+        binary_stream = io.BytesIO()
+        write_elements(root_element, binary_stream)
+        self.assertEqual(root_element.to_gedcom_string(True).encode('utf-8'), binary_stream.getvalue())
+
+    # --------------------- START OF track_records TESTING -----------------------
+
+    def test_track_records__should_copy_consecutive_unchanged_records_at_once(self):
+        gedcom_data = u"\ufeff0 HEAD\r\n0 @I1@ INDI\r\n0 @I2@ INDI\r\n0 @I3@ INDI\r\n0 TRLR\r\n".encode('utf-8')
+        with tempfile.TemporaryDirectory() as directory:
+            file_path = os.path.join(directory, 'tracked.ged')
+            with open(file_path, 'wb') as gedcom_file:
+                gedcom_file.write(gedcom_data)
+
+            gedcom_parser = Parser()
+            gedcom_parser.parse_file(file_path)
+            records = gedcom_parser.get_root_child_elements()
+            record_source = track_records(file_path, records)
+            self.assertEqual((3, 11), record_source.get_byte_range(records[0]))
+
+            records[2].set_value("changed")
+            self.assertIsNone(record_source.get_byte_range(records[2]))
+            self.assertEqual([b"0 HEAD\r\n0 @I1@ INDI\r\n", "0 @I2@ INDI changed\r\n", b"0 @I3@ INDI\r\n0 TRLR\r\n"],
+                             list(iter_record_chunks(records, gedcom_data, record_source)))
+
+    def test_track_records__should_not_track_records_that_do_not_match_the_file(self):
+        with tempfile.TemporaryDirectory() as directory:
+            file_path = os.path.join(directory, 'tracked.ged')
+            with open(file_path, 'wb') as gedcom_file:
+                gedcom_file.write(b"0 HEAD\n0 TRLR\n")
+            self.assertIsNone(track_records(file_path, [Element(0, "", "HEAD", "")]))
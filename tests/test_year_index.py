@@ -0,0 +1,27 @@
+import unittest
+
+from python_gedcom_2.year_index import YearIndex
+
+
+class TestYearIndex(unittest.TestCase):
+
+    def setUp(self):
+        self.index = YearIndex([(1950, "b"), (1900, "a"), (1950, "c"), (2000, "d"), (1910, "c")])
+
+    # --------------------- START OF get_between TESTING -----------------------
+
+    def test_get_between__should_include_both_years_and_keep_the_order_within_a_year(self):
+        self.assertEqual(["a", "c", "b"], self.index.get_between(1900, 1950))
+        self.assertEqual(["b", "c"], self.index.get_between(1950, 1950))
+
+    def test_get_between__should_return_nothing_outside_of_the_years(self):
+        self.assertEqual([], self.index.get_between(1800, 1899))
+        self.assertEqual([], self.index.get_between(2001, 2100))
+        self.assertEqual([], self.index.get_between(1950, 1900))
+
+    # --------------------- START OF count_between TESTING -----------------------
+
+    def test_count_between__should_count_every_year(self):
+        self.assertEqual(5, len(self.index))
+        self.assertEqual(4, self.index.count_between(1900, 1950))
+        self.assertEqual(0, self.index.count_between(1951, 1999))